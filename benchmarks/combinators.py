@@ -0,0 +1,168 @@
+"""
+Measures the per-item overhead of the paco combinators compared to the
+raw asyncio equivalents, at several input sizes and concurrency limits.
+
+Results are written as JSON, sorted by case name, size and limit, so
+runs can be diffed to spot regressions.
+
+Usage::
+
+    python benchmarks/combinators.py --sizes 1000 10000 --limits 10 100
+    python benchmarks/combinators.py --output results.json
+"""
+import sys
+import json
+import time
+import asyncio
+import argparse
+import platform
+
+import paco
+
+
+async def noop(num):
+    return num
+
+
+async def is_even(num):
+    return num % 2 == 0
+
+
+async def add(acc, num):
+    return acc + num
+
+
+async def paco_map(size, limit):
+    await paco.map(noop, range(size), limit=limit)
+
+
+async def paco_map_eager(size, limit):
+    await paco.map(noop, range(size), limit=limit, eager=True)
+
+
+async def paco_each(size, limit):
+    await paco.each(noop, range(size), limit=limit)
+
+
+async def paco_gather(size, limit):
+    await paco.gather(*[noop(num) for num in range(size)], limit=limit)
+
+
+async def paco_filter(size, limit):
+    await paco.filter(is_even, range(size), limit=limit)
+
+
+async def paco_reduce(size, limit):
+    await paco.reduce(add, range(size), initializer=0)
+
+
+async def paco_workers(size, limit):
+    pool = paco.ConcurrentExecutor(limit=limit, engine='workers')
+    pool.feed(noop, range(size))
+    await pool.run()
+
+
+async def asyncio_gather(size, limit):
+    await asyncio.gather(*[noop(num) for num in range(size)])
+
+
+async def asyncio_semaphore(size, limit):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(num):
+        async with semaphore:
+            return await noop(num)
+
+    await asyncio.gather(*[bounded(num) for num in range(size)])
+
+
+async def asyncio_taskgroup(size, limit):
+    semaphore = asyncio.Semaphore(limit)
+
+    async def bounded(num):
+        async with semaphore:
+            return await noop(num)
+
+    async with asyncio.TaskGroup() as group:
+        for num in range(size):
+            group.create_task(bounded(num))
+
+
+# Benchmark cases, by name. reduce and asyncio.gather are not bounded.
+CASES = {
+    'paco.map': paco_map,
+    'paco.map[eager]': paco_map_eager,
+    'paco.each': paco_each,
+    'paco.gather': paco_gather,
+    'paco.filter': paco_filter,
+    'paco.reduce': paco_reduce,
+    'paco.ConcurrentExecutor[workers]': paco_workers,
+    'asyncio.gather': asyncio_gather,
+    'asyncio.Semaphore': asyncio_semaphore,
+}
+
+# TaskGroup is only available in Python 3.11+
+if hasattr(asyncio, 'TaskGroup'):
+    CASES['asyncio.TaskGroup'] = asyncio_taskgroup
+
+
+def measure(loop, case, size, limit, repeat):
+    # Best of the given repetitions, to reduce the noise
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        loop.run_until_complete(case(size, limit))
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__.strip().split('\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[1000, 10000])
+    parser.add_argument('--limits', type=int, nargs='+', default=[10, 100])
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--cases', nargs='+', choices=sorted(CASES),
+                        default=sorted(CASES))
+    parser.add_argument('--output', help='output file, stdout by default')
+    args = parser.parse_args()
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+
+    results = []
+    for name in sorted(args.cases):
+        for size in args.sizes:
+            for limit in args.limits:
+                elapsed = measure(loop, CASES[name], size, limit,
+                                  args.repeat)
+                results.append({
+                    'case': name,
+                    'size': size,
+                    'limit': limit,
+                    'seconds': round(elapsed, 6),
+                    'items_per_second': round(size / elapsed, 1),
+                    'us_per_item': round(elapsed / size * 1e6, 3),
+                })
+
+    loop.close()
+
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'paco': paco.__version__,
+        'repeat': args.repeat,
+        'results': results,
+    }
+
+    output = json.dumps(report, indent=2, sort_keys=True)
+    if args.output:
+        with open(args.output, 'w') as file:
+            file.write(output + '\n')
+    else:
+        sys.stdout.write(output + '\n')
+
+
+if __name__ == '__main__':
+    main()
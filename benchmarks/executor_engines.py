@@ -0,0 +1,56 @@
+"""
+Compares the per-coroutine scheduling overhead of the ConcurrentExecutor
+execution engines.
+
+Usage::
+
+    python benchmarks/executor_engines.py --items 100000 --limit 50
+"""
+import time
+import asyncio
+import argparse
+
+import paco
+
+
+async def noop(num):
+    return num
+
+
+async def yielder(num):
+    await asyncio.sleep(0)
+    return num
+
+
+async def run_engine(engine, coro, items, limit):
+    pool = paco.ConcurrentExecutor(limit=limit, engine=engine)
+    pool.feed(coro, range(items))
+
+    start = time.perf_counter()
+    done, _ = await pool.run()
+    elapsed = time.perf_counter() - start
+
+    assert len(done) == items
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--items', type=int, default=100000)
+    parser.add_argument('--limit', type=int, default=50)
+    args = parser.parse_args()
+
+    loop = asyncio.get_event_loop()
+
+    for coro in (noop, yielder):
+        for engine in ('tasks', 'workers'):
+            elapsed = loop.run_until_complete(
+                run_engine(engine, coro, args.items, args.limit))
+            print('{:<8} {:<8} {:>10.0f} items/s {:>8.2f} us/item'.format(
+                coro.__name__, engine,
+                args.items / elapsed,
+                elapsed / args.items * 1e6))
+
+
+if __name__ == '__main__':
+    main()
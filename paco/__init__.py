@@ -29,6 +29,13 @@ from .constant import constant, identity
 from .throttle import throttle
 from .dropwhile import dropwhile
 from .concurrent import ConcurrentExecutor, concurrent
+from .as_completed import as_completed
+from .limiter import AIMDLimiter, GradientLimiter
+from .process import ProcessPool
+from .portal import Portal
+from .sharded import ShardedExecutor
+from .metrics import Metrics
+from .tracing import Tracer, JSONLinesExporter
 
 __author__ = 'Tomas Aparicio'
 __license__ = 'MIT'
@@ -39,7 +46,9 @@ __version__ = '0.2.4'
 # Explicit symbols to export
 __all__ = (
     'ConcurrentExecutor',
+    'AIMDLimiter',
     'apply',
+    'as_completed',
     'compose',
     'concurrent',
     'constant',
@@ -52,22 +61,29 @@ __all__ = (
     'filterfalse',
     'flat_map',
     'gather',
+    'GradientLimiter',
     'identity',
     'interval',
+    'JSONLinesExporter',
     'map',
+    'Metrics',
     'once',
     'partial',
+    'Portal',
+    'ProcessPool',
     'race',
     'reduce',
     'repeat',
     'run',
     'series',
+    'ShardedExecutor',
     'some',
     'throttle',
     'thunk',
     'timeout',
     'TimeoutLimit',
     'times',
+    'Tracer',
     'until',
     'wait',
     'whilst',
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .decorator import decorate
 from .assertions import assert_corofunction
 
@@ -46,9 +45,8 @@ def apply(coro, *args, **kw):
     """
     assert_corofunction(coro=coro)
 
-    @asyncio.coroutine
-    def wrapper(*_args, **_kw):
+    async def wrapper(*_args, **_kw):
         # Explicitely ignore wrapper arguments
-        return (yield from coro(*args, **kw))
+        return await coro(*args, **kw)
 
     return wrapper
@@ -0,0 +1,74 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from .assertions import isiter
+from .concurrent import ConcurrentExecutor
+
+
+def as_completed(*coros_or_futures, limit=0, loop=None, timeout=None,
+                 return_exceptions=False):
+    """
+    Streaming variant of ``paco.gather()`` that returns an asynchronous
+    iterator yielding ``(index, result)`` tuples as soon as every coroutine
+    is finished, with a concurrency execution limit.
+
+    ``index`` is the position of the coroutine in the original sequence,
+    so consumers can start processing the first results while the rest
+    of the coroutines are still pending.
+
+    If return_exceptions is `True`, exceptions in the tasks are yielded
+    as results, otherwise the pending coroutines are cancelled and the
+    first raised exception is propagated by the iterator.
+
+    If the iteration is stopped early or the timeout is exceeded, the
+    pending coroutines are cancelled once the iterator is closed.
+
+    Arguments:
+        *coros_or_futures (coroutines|list): an iterable collection yielding
+            coroutines functions or coroutine objects.
+        limit (int): max concurrency limit. Use ``0`` for no limit.
+        timeout (int|float): maximum number of seconds to wait for all the
+            coroutines. ``asyncio.TimeoutError`` is raised by the iterator
+            once exceeded. No limit by default.
+        return_exceptions (bool): returns exceptions as valid results.
+        loop (asyncio.BaseEventLoop): optional event loop to use.
+
+    Raises:
+        TypeError: in case of invalid input arguments.
+
+    Returns:
+        async_generator: asynchronous iterator.
+
+    Usage::
+
+        async def sleep(num):
+            await asyncio.sleep(num)
+            return num
+
+        async for index, result in paco.as_completed(
+                sleep(0.3), sleep(0.1), sleep(0.2), limit=3):
+            print(index, result)
+        # => 1 0.1
+        # => 2 0.2
+        # => 0 0.3
+
+    """
+    # Support iterable as first argument for better interoperability
+    if len(coros_or_futures) == 1 and isiter(coros_or_futures[0]):
+        coros_or_futures = coros_or_futures[0]
+
+    # Create concurrent executor
+    pool = ConcurrentExecutor(limit=limit, loop=loop)
+
+    for coro in coros_or_futures:
+        # Validate coroutine object
+        if asyncio.iscoroutinefunction(coro):
+            coro = coro()
+        if not asyncio.iscoroutine(coro):
+            raise TypeError(
+                'paco: only coroutines or coroutine functions allowed')
+
+        # Add coroutine to the executor pool
+        pool.add(coro)
+
+    return pool.as_completed(timeout=timeout,
+                             return_exceptions=return_exceptions)
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .reduce import reduce
 
 
@@ -38,13 +37,11 @@ def compose(*coros):
     # Make list to inherit built-in type methods
     coros = list(coros)
 
-    @asyncio.coroutine
-    def reducer(acc, coro):
-        return (yield from coro(acc))
+    async def reducer(acc, coro):
+        return await coro(acc)
 
-    @asyncio.coroutine
-    def wrapper(acc):
-        return (yield from reduce(reducer, coros,
-                                  initializer=acc, right=True))
+    async def wrapper(acc):
+        return await reduce(reducer, coros,
+                            initializer=acc, right=True)
 
     return wrapper
@@ -1,6 +1,6 @@
 # -*- coding: utf-8 -*-
 """Coroutines concurrent pool executor with built-in
-concurrency limit based on a semaphore free slots algorithm.
+concurrency limit based on a windowed free slots algorithm.
 
 Usage::
 
@@ -9,28 +9,128 @@ Usage::
         return await r.read()
     # limit the concurrent coroutines to 3
     pool = concurrent(3)
+    await pool.start()
     for _ in range(10):
-        p.submit(fetch, 'http://www.baidu.com')
-    await p.join()
+        pool.submit(fetch, 'http://www.baidu.com')
+    await pool.close()
+
+    # or as task group, bound to the current task
+    async with concurrent(3) as pool:
+        for _ in range(10):
+            pool.submit(fetch, 'http://www.baidu.com')
 """
+import sys
 import asyncio
-from collections import deque, namedtuple
+import functools
+import builtins
+import itertools
+import threading
+from concurrent.futures import (Future as ThreadFuture,
+                                CancelledError as ThreadCancelledError)
+from collections import deque
+from .wraps import wraps
 from .observer import Observer
-from .assertions import isiter
+from .priority import PriorityQueue
+from .metrics import Metrics
+from .deadline import DeadlineTimer
+from .ratelimit import TokenBucket
+from .assertions import isiter, assert_corofunction, assert_iter
+
+
+# Supported execution engines
+ENGINES = ('tasks', 'workers')
+
+# Supported pool queue types
+QUEUES = ('fifo', 'priority')
+
+# Native eager tasks start is only available in Python 3.12+
+EAGER_START = sys.version_info >= (3, 12)
+
+# Exception groups are only available in Python 3.11+
+BaseExceptionGroup = getattr(builtins, 'BaseExceptionGroup', None)
+
+
+def current_task(loop=None):
+    """
+    Returns the task being currently executed in the given event loop,
+    if any. This function is intended to be used internally.
+    """
+    try:
+        return asyncio.current_task(loop=loop)
+    except RuntimeError:
+        return None
+
+
+class Task(object):
+    """
+    Task record storing a scheduled coroutine and its execution state,
+    shared by the executor internals, events subscribers and metrics.
+
+    Status is one of ``queued``, ``running``, ``completed``, ``failed``
+    or ``cancelled``. Timestamps are given by the event loop clock and
+    only recorded if metrics or an adaptive limiter are enabled.
+
+    Tasks can be unpacked as ``(index, coro)`` tuples.
+
+    Arguments:
+        index (int): task index, in order of creation.
+        coro (coroutine): coroutine object to execute.
+        timeout (int|float): optional task timeout in seconds.
+        call (function): optional deferred call that creates the
+            coroutine object once the task is started, if ``coro``
+            is not given.
+    """
 
-# Task represents an immutable tuple storing the index order
-# and coroutine object.
-Task = namedtuple('Task', ['index', 'coro'])
+    __slots__ = ('index', 'coro', 'call', 'priority', 'weight', 'key',
+                 'timeout', 'future', 'span', 'status', 'enqueued',
+                 'started', 'finished')
+
+    def __init__(self, index, coro, timeout=None, call=None):
+        self.index = index
+        self.coro = coro
+        self.call = call
+        self.priority = 0
+        self.weight = 1
+        self.key = None
+        self.timeout = timeout
+        self.future = None
+        self.span = None
+        self.status = 'queued'
+        self.enqueued = None
+        self.started = None
+        self.finished = None
+
+    def __iter__(self):
+        return iter((self.index, self.coro))
+
+    def __repr__(self):
+        return 'Task(index={}, status={})'.format(self.index, self.status)
+
+
+def _copy_future(target, source):
+    """
+    Copies the state of the given asyncio future to the running
+    ``concurrent.futures.Future``. This function is intended to be used
+    internally.
+    """
+    if source.cancelled():
+        # Running futures cannot be cancelled
+        target.set_exception(ThreadCancelledError())
+    elif source.exception() is not None:
+        target.set_exception(source.exception())
+    else:
+        target.set_result(source.result())
 
 
-@asyncio.coroutine
-def safe_run(coro, return_exceptions=False):
+async def safe_run(coro, return_exceptions=False):
     """
     Executes a given coroutine and optionally catches exceptions, returning
     them as value. This function is intended to be used internally.
     """
     try:
-        result = yield from coro
+        result = await coro
+    except asyncio.CancelledError:
+        raise
     except Exception as err:
         if return_exceptions:
             result = err
@@ -39,15 +139,14 @@ def safe_run(coro, return_exceptions=False):
     return result
 
 
-@asyncio.coroutine
-def collect(coro, index, results,
-            preserve_order=False,
-            return_exceptions=False):
+async def collect(coro, index, results,
+                  preserve_order=False,
+                  return_exceptions=False):
     """
     Collect is used internally to execute coroutines and collect the returned
     value. This function is intended to be used internally.
     """
-    result = yield from safe_run(coro, return_exceptions=return_exceptions)
+    result = await safe_run(coro, return_exceptions=return_exceptions)
 
     if preserve_order:
         results[index] = result
@@ -71,7 +170,42 @@ class ConcurrentExecutor(object):
     use the high-level API functions that provides a simpler abstraction for
     the majority of the use cases.
 
-    This class is not thread safe.
+    This class is not thread safe, except for ``submit_threadsafe()``,
+    which can be used to submit coroutines from other threads.
+
+    Coroutines can be executed by two different engines:
+
+        - tasks: each coroutine is wrapped in its own ``asyncio.Task``,
+            scheduled once a previous one has finished. This is the default.
+        - workers: a fixed number of ``limit`` long-lived worker coroutines
+            pull tasks from the pool queue, avoiding the creation of a new
+            ``asyncio.Task`` per coroutine. Recommended for large amounts of
+            short-lived coroutines.
+
+    Sequential execution (``limit=1``) always runs in a single worker.
+
+    In eager mode, the ``tasks`` engine runs every coroutine right away
+    until its first suspension when there is a free slot, and only creates
+    an ``asyncio.Task`` if the coroutine actually suspends, similar to the
+    Python 3.12 ``asyncio.eager_task_factory``. Coroutines that finish
+    synchronously, e.g: cache hits, skip the event loop round trip.
+    Eager mode relies on native eager tasks, so before Python 3.12
+    coroutines are started as regular tasks. Coroutines with
+    ``task_timeout`` are never started eagerly.
+
+    Besides batch execution via ``run()``, the executor can run in service
+    mode: once started via ``start()``, new coroutines can be submitted
+    at any time via ``submit()`` and are executed as soon as there is a
+    free slot, until the executor is closed via ``close()``.
+
+    The executor can also be used as asynchronous context manager, which
+    runs it in service mode bound to the current task, with
+    ``asyncio.TaskGroup`` semantics: exiting the block waits until all
+    the submitted coroutines are finished. If a coroutine fails, the
+    pending ones and the block are cancelled, and the errors are raised
+    as ``ExceptionGroup`` in Python 3.11+, otherwise the first error is
+    raised. If the current task is cancelled, the coroutines are
+    cancelled as well, so they never outlive the block.
 
     Events:
         - start (executor): triggered before executor cycle starts.
@@ -81,6 +215,10 @@ class ConcurrentExecutor(object):
         - task.error (task, error): triggered when a coroutined task
             raised an exception.
 
+    Task events subscribers are compiled once per execution cycle, so
+    subscribing to a task event while the executor is running takes
+    effect on the next run. Synchronous subscribers are called directly.
+
     Arguments:
         limit (int): concurrency limit. Defaults to 10.
         coros (list[coroutine], optional): list of coroutines to schedule.
@@ -88,6 +226,59 @@ class ConcurrentExecutor(object):
             Defaults to asyncio.get_event_loop().
         ignore_empty (bool, optional): do not raise an exception if there are
             no coroutines to schedule are empty.
+        engine (str, optional): execution engine to use. Supported values
+            are ``tasks`` and ``workers``. Defaults to ``tasks``.
+        queue (str, optional): pool queue type. Use ``priority`` to schedule
+            coroutines by the priority given to ``add()`` or ``submit()``.
+            Defaults to ``fifo``.
+        limiter (paco.limiter.Limiter, optional): adaptive concurrency
+            limiter used to resize the concurrency limit at runtime based
+            on the tasks latency and errors. Overrides ``limit``.
+        executor (concurrent.futures.Executor|bool, optional): executor
+            used to run blocking functions added to the pool, sharing
+            the same concurrency limit. Use ``True`` for the loop default
+            thread pool executor.
+        key (function, optional): function that returns the concurrency key
+            of a task, called with the fed value or with the positional
+            arguments passed to ``add()`` or ``submit()``. Tasks with the
+            same key are limited to ``key_limit`` concurrent coroutines on
+            top of the global limit, e.g: per host concurrency limit.
+        key_limit (int, optional): concurrency limit per key. Defaults to 1.
+        key_backlog (int, optional): max number of fed values read ahead
+            and held while their concurrency key is saturated. Once
+            reached, fed values are not read until a held one is started,
+            while added tasks are still scheduled. Defaults to ``1000``.
+        max_weight (int|float, optional): max total weight of the running
+            coroutines, given by the ``weight`` passed to ``add()`` or
+            ``submit()``, e.g: bytes or estimated CPU cost. Tasks are
+            admitted in order, so a task waits until the running ones
+            free enough weight. No limit by default.
+        task_timeout (int|float, optional): default max number of seconds
+            a coroutine can run before it is cancelled and fails with
+            ``asyncio.TimeoutError``. Can be overridden per coroutine via
+            ``add()`` or ``submit()``. No limit by default.
+        metrics (paco.Metrics|bool, optional): metrics registry to record
+            the tasks queue depth, outcomes and latencies. Use ``True``
+            to create a new one, available via ``metrics`` attribute.
+            Disabled by default.
+        tracer (paco.Tracer, optional): tracer used to record a span per
+            coroutine task, child of the current span when the task was
+            added or fed. Disabled by default.
+        maxsize (int, optional): max number of coroutines waiting in the
+            pool queue. Once reached, ``add()`` and ``submit()`` raise
+            ``asyncio.QueueFull``, while ``put()`` waits for a free
+            queue slot. Use ``0`` for no limit. Defaults to ``0``.
+        eager (bool, optional): starts the coroutines eagerly, until
+            they suspend. Only used by the ``tasks`` engine in Python
+            3.12+. Defaults to ``False``.
+        rate (int|float, optional): max number of coroutines started per
+            second, on top of the concurrency limit, e.g: API requests
+            per second quota. No limit by default.
+        burst (int, optional): max number of coroutines that can be
+            started at once within the ``rate`` limit. Defaults to ``1``.
+
+    Raises:
+        ValueError: if the given engine or queue type is not supported.
 
     Returns:
         ConcurrentExecutor
@@ -106,16 +297,92 @@ class ConcurrentExecutor(object):
         # => [3, TypeError("unsupported operand type(s) for +: 'NoneType' and 'str'")]  # noqa
     """
 
-    def __init__(self, limit=10, loop=None, coros=None, ignore_empty=False):
+    def __init__(self, limit=10, loop=None, coros=None,
+                 ignore_empty=False, engine='tasks', queue='fifo',
+                 limiter=None, executor=None, key=None, key_limit=1,
+                 max_weight=None, task_timeout=None, metrics=None,
+                 tracer=None, maxsize=0, eager=False, rate=None, burst=1,
+                 key_backlog=1000):
+        if engine not in ENGINES:
+            raise ValueError('paco: invalid engine: {}'.format(engine))
+        if queue not in QUEUES:
+            raise ValueError('paco: invalid queue: {}'.format(queue))
+
         self.errors = []
         self.running = False
+        # Error raised by the lazy sources, failing the execution cycle
+        self._source_error = None
         self.return_exceptions = False
-        self.limit = max(int(limit), 0)
-        self.pool = deque()
+        self.limiter = limiter
+        self.limit = max(int(limiter.limit if limiter else limit), 0)
+        self.queue = queue
+        self.pool = PriorityQueue() if queue == 'priority' else deque()
         self.observer = Observer()
         self.ignore_empty = ignore_empty
+        self.engine = engine
+        self.executor = executor
+        self.key = key
+        self.key_limit = max(int(key_limit), 1)
+        self.key_backlog = max(int(key_backlog), 1)
+        self.max_weight = max_weight
+        self.task_timeout = task_timeout
+        self.metrics = Metrics() if metrics is True else metrics or None
+        self.tracer = tracer
+        self.maxsize = max(int(maxsize), 0)
+        self.eager = eager
+        self.rate = rate
+        self.burst = burst
         self.loop = loop or asyncio.get_event_loop()
-        self.semaphore = asyncio.Semaphore(self.limit, loop=self.loop)
+
+        # Record tasks timestamps only if someone uses them
+        self._timed = bool(self.metrics or self.limiter)
+
+        # Lazy sources of tasks, consumed on demand once the pool is empty
+        self._sources = deque()
+        # Incremental task index counter
+        self._index = 0
+        # Execution cycle scheduling state
+        self._done = set()
+        self._pending = set()
+        self._workers = set()
+        self._waiter = None
+        self._return_when = None
+        self._retain_done = True
+        self._scheduling = False
+        # Concurrency keys state: running tasks and parked tasks by key,
+        # unparked tasks ready to run and number of parked fed tasks
+        self._key_counts = {}
+        self._parked = {}
+        self._ready = deque()
+        self._read_ahead = 0
+        # Weighted slots state: total weight of the running tasks and
+        # the next task waiting for free weight
+        self._weight = 0
+        self._held = None
+        # Shared tasks deadlines timer
+        self._deadlines = DeadlineTimer(self.loop)
+        # Start rate limit token bucket and its single wakeup timer
+        self._bucket = (TokenBucket(rate, burst, clock=self.loop.time)
+                        if rate else None)
+        self._rate_timer = None
+        # Producers waiting for a free slot in the pool queue
+        self._putters = deque()
+        # Coroutines submitted from other threads, pending to be added
+        self._inbox = []
+        self._inbox_lock = threading.Lock()
+        self._inbox_scheduled = False
+        # Service mode state
+        self._service = False
+        self._closing = False
+        # Task group state: parent task bound to the executor block
+        self._group = False
+        self._parent = None
+        self._parent_cancelled = False
+        self._exiting = False
+        # Compiled task events dispatchers
+        self._on_task_start = None
+        self._on_task_finish = None
+        self._on_task_error = None
 
         # Register coroutines in the pool
         if isiter(coros):
@@ -140,17 +407,117 @@ class ConcurrentExecutor(object):
         if self.running:
             raise RuntimeError('paco: executor is still running')
 
-        self.pool.clear()
+        self._clear_queue()
         self.observer.clear()
-        self.semaphore = asyncio.Semaphore(self.limit, loop=self.loop)
+        self._index = 0
+
+    def resize(self, limit):
+        """
+        Changes the concurrency limit at runtime.
+
+        If the limit is increased, free slots are filled right away.
+        If it is decreased, running coroutines are not interrupted,
+        but no new ones are scheduled until they fit in the new limit.
+
+        Arguments:
+            limit (int): new concurrency limit. Use ``0`` for no limit.
+        """
+        self.limit = max(int(limit), 0)
+
+        # Fill the new free slots, if any
+        if self._service or self._waiter is not None:
+            self._schedule()
 
     def cancel(self):
         """
-        Tries to gracefully cancel the pending coroutine scheduled
-        coroutine tasks.
+        Cancels the pending coroutine tasks and the in-flight ones,
+        except the task calling this method, if any.
         """
+        self._clear_queue()
+        self.running = False
+        self._cancel_running()
+
+    def _clear_queue(self):
+        """
+        Discards the queued tasks and lazy sources.
+        """
+        held, self._held = self._held, None
+        tasks = list(itertools.chain(
+            self.pool, self._ready,
+            itertools.chain.from_iterable(self._parked.values())))
+        if held:
+            tasks.append(held)
+
+        for task in tasks:
+            self._discard(task)
+
+        if self._rate_timer is not None:
+            self._rate_timer.cancel()
+            self._rate_timer = None
+
         self.pool.clear()
+        self._sources.clear()
+        self._clear_keys()
+
+        # Held task was already handed over a key slot, but its weight
+        # is only accounted once it is admitted
+        if held and held.key is not None:
+            self._release_key(held)
+
+        # Pool queue is cleared, so waiting producers can continue
+        while self._putters:
+            self._wakeup_putter()
+
+    def _discard(self, task):
+        """
+        Flags the given queued task as cancelled without running it.
+        """
+        task.status = 'cancelled'
+        # Deferred tasks coroutine objects were never created
+        if task.coro:
+            task.coro.close()
+        if task.future:
+            task.future.cancel()
+        if task.span:
+            self.tracer.finish(task.span, outcome='cancelled')
+        if self.metrics:
+            self.metrics.drop()
+
+    def _cancel_running(self):
+        """
+        Cancels the in-flight tasks, except the current one.
+
+        Returns:
+            list: cancelled tasks.
+        """
+        current = current_task(loop=self.loop)
+        # Worker engine pending futures are not tasks, cancel the workers
+        tasks = [task for task in itertools.chain(self._pending, self._workers)
+                 if isinstance(task, asyncio.Task) and
+                 task is not current and not task.done()]
+
+        # Deferred, so the tasks scheduled but not started yet are started
+        # first and release their resources via the not running path
+        for task in tasks:
+            self.loop.call_soon(task.cancel)
+
+        return tasks
+
+    async def _abort(self):
+        """
+        Cancels the in-flight tasks and waits until they are finished.
+        """
         self.running = False
+        tasks = self._cancel_running()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    def _clear_keys(self):
+        self._parked.clear()
+        self._read_ahead = 0
+        # Ready tasks were already handed over a key slot
+        while self._ready:
+            self._release_key(self._ready.popleft())
 
     def on(self, event, fn):
         """
@@ -162,14 +529,15 @@ class ConcurrentExecutor(object):
         """
         return self.observer.on(event, fn)
 
-    def off(self, event):
+    def off(self, event, fn=None):
         """
         Removes event subscribers.
 
         Arguments:
             event (str): event name to remove observers.
+            fn (function): optional subscriber function to remove.
         """
-        return self.observer.off(event)
+        return self.observer.off(event, fn)
 
     def extend(self, *coros):
         """
@@ -181,20 +549,238 @@ class ConcurrentExecutor(object):
         for coro in coros:
             self.add(coro)
 
-    def add(self, coro, *args, **kw):
+    def add(self, coro, *args, priority=0, weight=1, task_timeout=None,
+            **kw):
         """
         Adds a new coroutine function with optional variadic argumetns.
 
+        Blocking functions are also supported if the executor was created
+        with an ``executor``.
+
+        Arguments:
+            coro (coroutine function): coroutine to execute.
+            *args (mixed): optional variadic arguments
+            priority (int|float): coroutine scheduling priority, lower values
+                are scheduled first. Only used by ``priority`` pool queues.
+                Defaults to ``0``.
+            weight (int|float): coroutine cost accounted against the
+                executor ``max_weight``. Defaults to ``1``.
+            task_timeout (int|float): max number of seconds the coroutine
+                can run. Defaults to the executor ``task_timeout``.
+
+        Raises:
+            TypeError: if the coro object is not a valid coroutine
+            ValueError: if weight is negative.
+            asyncio.QueueFull: if the executor ``maxsize`` is reached.
+
+        Returns:
+            coroutine: scheduled coroutine object.
+        """
+        task = self._add(coro, args, kw, priority, weight, task_timeout)
+        self._wakeup()
+        return task.coro
+
+    def submit(self, coro, *args, priority=0, weight=1,
+               task_timeout=None, **kw):
+        """
+        Submits a new coroutine function with optional variadic arguments,
+        returning a future resolved with the coroutine result.
+
+        This method is non-blocking: if the executor is started in service
+        mode, the coroutine is executed as soon as there is a free slot.
+        Otherwise, it will be executed in the next ``run()`` cycle.
+
+        Arguments:
+            coro (coroutine function): coroutine to execute.
+            *args (mixed): optional variadic arguments
+            priority (int|float): coroutine scheduling priority, lower values
+                are scheduled first. Only used by ``priority`` pool queues.
+                Defaults to ``0``.
+            weight (int|float): coroutine cost accounted against the
+                executor ``max_weight``. Defaults to ``1``.
+            task_timeout (int|float): max number of seconds the coroutine
+                can run. Defaults to the executor ``task_timeout``.
+
+        Raises:
+            TypeError: if the coro object is not a valid coroutine
+            ValueError: if weight is negative.
+            RuntimeError: if the executor is closing.
+            asyncio.QueueFull: if the executor ``maxsize`` is reached.
+
+        Returns:
+            asyncio.Future: future resolved with the coroutine result.
+        """
+        if self._closing:
+            raise RuntimeError('paco: executor is closing')
+
+        task = self._add(coro, args, kw, priority, weight, task_timeout)
+        future = task.future = asyncio.Future(loop=self.loop)
+        self._wakeup()
+        return future
+
+    def submit_threadsafe(self, coro, *args, priority=0, weight=1,
+                          task_timeout=None, **kw):
+        """
+        Thread-safe variant of ``submit()``, intended to submit coroutine
+        functions from threads other than the executor event loop thread,
+        e.g: consumer or C extension callbacks.
+
+        The coroutine function is called in the event loop thread.
+        Coroutines submitted in a row are added to the executor in batches,
+        with a single event loop wakeup per batch instead of one per
+        coroutine.
+
+        Arguments:
+            coro (coroutine function): coroutine to execute.
+            *args (mixed): optional variadic arguments
+            priority (int|float): coroutine scheduling priority, lower values
+                are scheduled first. Only used by ``priority`` pool queues.
+                Defaults to ``0``.
+            weight (int|float): coroutine cost accounted against the
+                executor ``max_weight``. Defaults to ``1``.
+            task_timeout (int|float): max number of seconds the coroutine
+                can run. Defaults to the executor ``task_timeout``.
+
+        Returns:
+            concurrent.futures.Future: future resolved with the coroutine
+                result, or with the ``submit()`` error, if any. Cancelling
+                it before the coroutine is added discards the coroutine.
+
+        Usage::
+
+            pool = paco.ConcurrentExecutor(limit=10)
+            await pool.start()
+
+            # From another thread
+            future = pool.submit_threadsafe(process, message)
+            future.result()
+        """
+        future = ThreadFuture()
+        item = (coro, args, kw, priority, weight, task_timeout, future)
+
+        with self._inbox_lock:
+            self._inbox.append(item)
+            if self._inbox_scheduled:
+                return future
+            self._inbox_scheduled = True
+
+        try:
+            self.loop.call_soon_threadsafe(self._drain_inbox)
+        except RuntimeError:
+            with self._inbox_lock:
+                self._inbox.remove(item)
+                self._inbox_scheduled = False
+            raise
+
+        return future
+
+    def _drain_inbox(self):
+        """
+        Adds the coroutines submitted from other threads to the executor.
+        """
+        with self._inbox_lock:
+            items, self._inbox = self._inbox, []
+            self._inbox_scheduled = False
+
+        for coro, args, kw, priority, weight, task_timeout, future in items:
+            # Discard the coroutines cancelled in the meantime
+            if not future.set_running_or_notify_cancel():
+                if asyncio.iscoroutine(coro):
+                    coro.close()
+                continue
+
+            try:
+                if self._closing:
+                    raise RuntimeError('paco: executor is closing')
+                task = self._add(coro, args, kw, priority, weight,
+                                 task_timeout)
+            except Exception as err:
+                future.set_exception(err)
+                continue
+
+            task.future = self.loop.create_future()
+            task.future.add_done_callback(
+                functools.partial(_copy_future, future))
+
+        # Schedule the whole batch at once
+        self._wakeup()
+
+    async def put(self, coro, *args, priority=0, weight=1, task_timeout=None,
+                  **kw):
+        """
+        Submits a new coroutine function with optional variadic arguments,
+        waiting until there is a free slot in the pool queue if the
+        executor ``maxsize`` is reached, so fast producers are throttled
+        at the executor consumption rate.
+
+        The coroutine object is only created once there is a free slot.
+
+        This method is a coroutine.
+
         Arguments:
             coro (coroutine function): coroutine to execute.
             *args (mixed): optional variadic arguments
+            priority (int|float): coroutine scheduling priority.
+            weight (int|float): coroutine cost accounted against the
+                executor ``max_weight``. Defaults to ``1``.
+            task_timeout (int|float): max number of seconds the coroutine
+                can run. Defaults to the executor ``task_timeout``.
 
         Raises:
             TypeError: if the coro object is not a valid coroutine
+            ValueError: if weight is negative.
+            RuntimeError: if the executor is closing.
 
         Returns:
-            future: coroutine wrapped future
+            asyncio.Future: future resolved with the coroutine result.
+
+        Usage::
+
+            pool = paco.ConcurrentExecutor(limit=10, maxsize=100)
+            await pool.start()
+            async for message in consumer:
+                await pool.put(process, message)
+            await pool.close()
+        """
+        while self.full():
+            putter = asyncio.Future(loop=self.loop)
+            self._putters.append(putter)
+            try:
+                await putter
+            except asyncio.CancelledError:
+                # Hand over the wake up to the next waiting producer
+                if putter.done() and not putter.cancelled():
+                    self._wakeup_putter()
+                raise
+
+        return self.submit(coro, *args, priority=priority, weight=weight,
+                           task_timeout=task_timeout, **kw)
+
+    def full(self):
         """
+        Returns ``True`` if the pool queue reached the executor ``maxsize``.
+
+        Returns:
+            bool
+        """
+        return 0 < self.maxsize <= len(self.pool)
+
+    def _wakeup_putter(self):
+        # Wake up the next producer waiting for a free slot in the queue
+        while self._putters:
+            putter = self._putters.popleft()
+            if not putter.done():
+                putter.set_result(None)
+                break
+
+    def _add(self, coro, args, kw, priority=0, weight=1, task_timeout=None):
+        if self.maxsize and self.full():
+            raise asyncio.QueueFull('paco: executor queue is full')
+        if weight < 0:
+            raise ValueError('paco: weight cannot be negative')
+
+        coro = self._offload(coro)
+
         # Create coroutine object if a function is provided
         if asyncio.iscoroutinefunction(coro):
             coro = coro(*args, **kw)
@@ -203,111 +789,589 @@ class ConcurrentExecutor(object):
         if not asyncio.iscoroutine(coro):
             raise TypeError('paco: coro must be a coroutine object')
 
-        # Store coroutine with arguments for deferred execution
-        index = max(len(self.pool), 0)
-        task = Task(index, coro)
-
         # Append the coroutine data to the pool
-        self.pool.append(task)
+        task = self._make_task(coro)
+        task.priority = priority
+        task.weight = weight
+        if task_timeout is not None:
+            task.timeout = task_timeout
+        if self.key and args:
+            try:
+                task.key = self.key(*args)
+            except Exception:
+                self._discard(task)
+                raise
+        if self.queue == 'priority':
+            self.pool.append(task, priority)
+        else:
+            self.pool.append(task)
+        return task
+
+    def _offload(self, fn):
+        # Wrap blocking functions to run in the configured executor
+        if self.executor is None or not callable(fn) or \
+                asyncio.iscoroutinefunction(fn):
+            return fn
+        return wraps(fn, executor=self.executor, loop=self.loop)
+
+    def _wakeup(self):
+        # Schedule new tasks right away if running in service mode
+        if self._service:
+            self._schedule()
+
+    def feed(self, coro, iterable, *args, **kw):
+        """
+        Lazily schedules a coroutine function call per each value yielded
+        by the given iterable, passing the value as first argument.
 
-        return coro
+        Unlike ``add()``, coroutine objects are only created once there is
+        a free execution slot, so memory usage is bounded by the concurrency
+        limit instead of the iterable length. Values whose concurrency
+        ``key`` is saturated are held until a slot for the key is freed,
+        but their coroutine objects are not created until then.
 
-    # Alias to add()
-    submit = add
+        Fed values are scheduled once the pool queue is empty.
 
-    @asyncio.coroutine
-    def _run_sequentially(self):
-        # Store futures in two queues
-        done, pending = [], []
+        Blocking functions are also supported if the executor was created
+        with an ``executor``.
 
-        # Run until the pool is empty
-        while len(self.pool):
-            future = asyncio.Future(loop=self.loop)
-            pending.append(future)
+        Arguments:
+            coro (coroutinefunction): coroutine function to call.
+            iterable (iterable): values to pass to the coroutine function.
+            *args (mixed): optional variadic arguments to pass to
+                the coroutine function.
 
-            # Run coroutine
-            result = yield from self._run_coro((self.pool.popleft()))
+        Raises:
+            TypeError: if coro is not a coroutine function or iterable
+                is not a valid iterable object.
+        """
+        coro = self._offload(coro)
+        assert_corofunction(coro=coro)
+        assert_iter(iterable=iterable)
+        # Fed tasks spans are children of the current span
+        parent = self.tracer.current_span() if self.tracer else None
+        self._sources.append((coro, iter(iterable), args, kw, parent))
+        self._wakeup()
+
+    def _make_task(self, coro, parent=None, call=None):
+        task = Task(self._index, coro, self.task_timeout, call)
+        self._index += 1
+        if self._timed:
+            task.enqueued = self.loop.time()
+        if self.metrics:
+            self.metrics.enqueue()
+        if self.tracer:
+            task.span = self.tracer.create(
+                'paco.task', parent, index=task.index,
+                coro=getattr(coro or call.func, '__qualname__', None))
+        return task
+
+    def _next_task(self):
+        """
+        Returns the next task to execute if its weight fits in the
+        executor max weight and the start rate limit allows it.
+        """
+        task = self._held or self._pick_task()
+        self._held = None
 
-            # Assign result to future
-            if isinstance(result, Exception):
-                if not self.return_exceptions:
-                    raise result
-                future.set_exception(result)
-            else:
-                future.set_result(result)
+        if task is None:
+            return None
 
-            # Swap future between queues
-            done.append(pending.pop())
+        # Hold the task until the rate limit timer fires
+        if self._bucket is not None and not self._bucket.ready():
+            self._held = task
+            self._throttle()
+            return None
 
-        # Build futures tuple to be compatible with asyncio.wait() interface
-        return set(done), set(pending)
+        # Tasks are always admitted if nothing is running, so tasks heavier
+        # than the max weight are eventually executed
+        if self.max_weight is not None:
+            if self._weight and self._weight + task.weight > self.max_weight:
+                self._held = task
+                return None
+            self._weight += task.weight
+
+        if self._bucket is not None:
+            self._bucket.consume()
+        return task
+
+    def _throttle(self):
+        # A single timer wakes up the scheduler once there is a new token
+        if self._rate_timer is None:
+            self._rate_timer = self.loop.call_later(
+                self._bucket.delay(), self._on_rate)
+
+    def _on_rate(self):
+        self._rate_timer = None
+        self._schedule()
+
+    def _pick_task(self):
+        """
+        Picks the next task to execute, skipping the tasks whose
+        concurrency key is saturated.
+        """
+        task = None
+        try:
+            # Tasks released by a finished task with the same key go first
+            task = self._ready.popleft() if self._ready else \
+                self._admit_task()
 
-    @asyncio.coroutine
-    def _run_concurrently(self, timeout=None, return_when='ALL_COMPLETED'):
-        coros = []
-        limit = self.limit
+            # Fed tasks coroutine objects are created once they are started
+            if task is not None and task.call is not None:
+                task.coro, task.call = task.call(), None
+        except Exception as err:
+            # Fed values are pulled from tasks callbacks, so errors
+            # raised by the iterable are routed to the execution cycle
+            if task is not None:
+                self._discard(task)
+                if task.key is not None:
+                    self._release_key(task)
+            self._fail_source(err)
+            return None
+
+        return task
+
+    def _fail_source(self, err):
+        """
+        Fails the execution cycle with the given error raised while
+        pulling a task from the lazy sources, discarding the pending tasks.
+        """
+        if self._group:
+            self.errors.append(err)
+            if len(self.errors) == 1:
+                self._abort_group()
+            return None
 
-        while len(self.pool):
+        self._clear_queue()
+
+        # Service mode errors are delivered via futures, but fed values
+        # have no future to deliver the error to
+        if self._service:
+            return self.loop.call_exception_handler({
+                'message': 'paco: executor source error',
+                'exception': err,
+            })
+
+        # Raised by run(), regardless of return_exceptions
+        self._source_error = err
+        self.running = False
+        self._resolve()
+
+    def _admit_task(self):
+        """
+        Pops the next task whose concurrency key is not saturated,
+        parking the tasks whose key is saturated.
+        """
+        while True:
+            # Stop reading the lazy sources ahead once the backlog is full
+            task = self._pop_task(self._read_ahead < self.key_backlog)
+            if task is None or task.key is None:
+                return task
+
+            key = task.key
+
+            count = self._key_counts.get(key, 0)
+            if count < self.key_limit:
+                self._key_counts[key] = count + 1
+                return task
+
+            # Park the task until a task with the same key finishes.
+            # Parked fed tasks are deferred calls, so no coroutine objects
+            # are created meanwhile.
+            self._parked.setdefault(key, deque()).append(task)
+            if task.call is not None:
+                self._read_ahead += 1
+
+    def _pop_task(self, lazy=True):
+        """
+        Pops the next task from the pool queue, creating the coroutine object
+        from the lazy sources if the pool queue is empty, unless ``lazy``
+        is ``False``.
+        """
+        if self.pool:
             task = self.pool.popleft()
+            if self._putters:
+                self._wakeup_putter()
+            return task
+
+        while lazy and self._sources:
+            coro, iterator, args, kw, parent = self._sources[0]
+            for value in iterator:
+                task = self._make_task(
+                    None, parent, functools.partial(coro, value, *args, **kw))
+                if self.key:
+                    try:
+                        task.key = self.key(value)
+                    except Exception:
+                        self._discard(task)
+                        raise
+                return task
+            self._sources.popleft()
+
+        return None
+
+    def _release(self, task):
+        """
+        Releases the concurrency key and weight of the given finished task.
+        """
+        if task.key is not None:
+            self._release_key(task)
+        if self.max_weight is not None:
+            self._weight -= task.weight
+            # Workers retired while a task was held for weight are not
+            # respawned by finished tasks, so fill the free slots once
+            # the held task fits
+            held = self._held
+            if held is not None and self.running and \
+                    self.engine == 'workers' and \
+                    (not self._weight or
+                     self._weight + held.weight <= self.max_weight):
+                self._schedule()
+
+    def _release_key(self, task):
+        """
+        Releases the concurrency key slot of the given finished task,
+        evicting the key state if there are no more tasks with it.
+        """
+        key, task.key = task.key, None
+
+        # Hand over the slot to the next parked task, if any
+        parked = self._parked.get(key)
+        if parked:
+            task = parked.popleft()
+            if task.call is not None:
+                self._read_ahead -= 1
+            self._ready.append(task)
+            if not parked:
+                del self._parked[key]
+            return None
 
-            # Run without concurrency limit
-            if limit <= 0:
-                coros.append(self._run_coro(task))
-            # Otherwise, schedule for concurrent based flow
-            else:
-                coros.append(self._schedule_coro(task))
+        count = self._key_counts.pop(key, 0) - 1
+        if count > 0:
+            self._key_counts[key] = count
+
+    async def _run_concurrently(self, timeout=None,
+                                return_when='ALL_COMPLETED',
+                                retain_done=True):
+        self._return_when = return_when
+        self._retain_done = retain_done
+        self._waiter = asyncio.Future(loop=self.loop)
+
+        # Compile task events dispatchers for the current cycle
+        self._compile_events()
+
+        # Fill the available slots with the first tasks
+        self._schedule()
 
         # Wait until all the coroutines finishes
-        return (yield from asyncio.wait(coros,
-                                        loop=self.loop,
-                                        timeout=timeout,
-                                        return_when=return_when))
+        await asyncio.wait((self._waiter,), timeout=timeout)
+
+        # Fail fast: cancel and reap the in-flight tasks on first error
+        if self._source_error is not None or (
+                self.errors and not self.return_exceptions and
+                self._return_when == 'FIRST_EXCEPTION'):
+            await self._abort()
+
+        # Detach the cycle state, late finished tasks are ignored
+        done, pending = self._done, self._pending
+        self._done, self._pending = set(), set()
+        self._waiter = None
+
+        return done, pending
+
+    def _compile_events(self):
+        """
+        Compiles the task events observers, so there is no dispatching
+        cost per task if there are no subscribers.
+        """
+        compile = self.observer.compile
+        self._on_task_start = compile('task.start')
+        self._on_task_finish = compile('task.finish')
+        self._on_task_error = compile('task.error')
+
+    def _schedule(self):
+        """
+        Schedules the next tasks in the available free slots.
+
+        Slots are available based on a windowed free slots algorithm:
+        coroutines are only scheduled when a previous one has finished,
+        so there are never more than ``limit`` tasks alive at once.
+        """
+        # Eagerly started coroutines may add tasks while scheduling,
+        # which are picked up by the outer scheduling loop
+        if self._scheduling:
+            return None
+
+        limit = self.limit
+        workers = self.engine == 'workers' or limit == 1
+        eager = self.eager and EAGER_START and not workers
+
+        self._scheduling = True
+        try:
+            while self.running and (limit <= 0 or
+                                    len(self._pending) < limit):
+                task = self._next_task()
+                if task is None:
+                    break
+
+                if eager and task.timeout is None:
+                    future = self._start_eager(task)
+                    self._pending.add(future)
+                    if not future.done():
+                        future.add_done_callback(self._on_task_done)
+                    # Finished synchronously: the slot is free again
+                    elif not self._complete(future):
+                        break
+                    continue
+
+                if workers:
+                    # Spawn a new worker that will keep pulling tasks
+                    future = asyncio.Future(loop=self.loop)
+                    worker = asyncio.ensure_future(
+                        self._worker(task, future), loop=self.loop)
+                    self._workers.add(worker)
+                    worker.add_done_callback(self._workers.discard)
+                else:
+                    future = asyncio.ensure_future(self._run_coro(task),
+                                                   loop=self.loop)
+                    future.add_done_callback(self._on_task_done)
+
+                self._pending.add(future)
+        finally:
+            self._scheduling = False
+
+        # Resolve the execution cycle if there is nothing left to wait for
+        if self._idle():
+            self._resolve()
+
+    def _start_eager(self, task):
+        """
+        Runs the given task coroutine until its first suspension
+        in a native eager task.
+
+        Returns:
+            asyncio.Task: task, already done if the coroutine finished
+                synchronously.
+        """
+        return asyncio.Task(self._run_coro(task), loop=self.loop,
+                            eager_start=True)
+
+    async def _worker(self, task, future):
+        """
+        Long-lived worker coroutine that executes tasks from the pool
+        queue until it is empty or the execution cycle is resolved.
+        """
+        while True:
+            try:
+                result = await self._run_coro(task)
+            except asyncio.CancelledError:
+                future.cancel()
+                self._complete(future)
+                if not self._pending:
+                    self._resolve()
+                raise
+            except Exception as err:
+                future.set_exception(err)
+            else:
+                future.set_result(result)
+
+            # Stop pulling tasks if the execution cycle has been resolved
+            if not self._complete(future) or not self.running:
+                break
+
+            # Retire the worker if the concurrency limit was decreased
+            if 0 < self.limit <= len(self._pending):
+                break
+
+            task = self._next_task()
+            if task is None:
+                break
+
+            future = asyncio.Future(loop=self.loop)
+            self._pending.add(future)
+
+        # Resolve the execution cycle if there is nothing left to wait for
+        if self._idle():
+            self._resolve()
+
+    def _idle(self):
+        """
+        Returns ``True`` if there are no running tasks, nor tasks waiting
+        for the rate limit or for a saturated concurrency key.
+        """
+        return not self._pending and self._rate_timer is None and \
+            not self._parked
+
+    def _on_task_done(self, future):
+        # Schedule pending tasks in the freed slot
+        if self._complete(future):
+            self._schedule()
+
+    def _complete(self, future):
+        """
+        Flags the given task future as done.
+
+        Returns:
+            bool: ``True`` if the execution cycle must continue.
+        """
+        # Ignore tasks that finished after the cycle was resolved
+        if future not in self._pending:
+            return False
+
+        self._pending.remove(future)
+
+        # Done futures are not retained in service mode or if not requested
+        if self._retain_done and not self._service:
+            self._done.add(future)
+
+        # Retrieving the exception also silences asyncio warnings
+        failed = not future.cancelled() and future.exception() is not None
+
+        if self._return_when == 'FIRST_COMPLETED' or (
+                failed and self._return_when == 'FIRST_EXCEPTION'):
+            self._resolve()
+            return False
+
+        return True
+
+    def _resolve(self):
+        if self._waiter and not self._waiter.done():
+            self._waiter.set_result(None)
+
+    async def _run_coro(self, task):
+        future, span = task.future, task.span
 
-    @asyncio.coroutine
-    def _run_coro(self, task):
         # Executor must be running
         if not self.running:
+            self._discard(task)
+            self._release(task)
             return None
 
         # Trigger task pre-execution event
-        yield from self.observer.trigger('task.start', task)
-
-        # Trigger coroutine task
-        index, coro = task
+        waiter = self._on_task_start and self._on_task_start(task)
+        if waiter:
+            try:
+                await waiter
+            except BaseException:
+                # Cancelled before the coroutine started, e.g: by cancel()
+                self._discard(task)
+                self._release(task)
+                raise
+
+        # Enforce the task deadline, if any
+        coro = task.coro
+        if task.timeout is not None:
+            coro = self._deadline(coro, task.timeout)
+
+        task.status = 'running'
+        if self._timed:
+            task.started = self.loop.time()
+            if self.metrics:
+                self.metrics.start(task.started - task.enqueued)
+        if span:
+            token = self.tracer.activate(span)
 
         # Safe coroutine execution
         try:
-            result = yield from safe_run(
+            result = await safe_run(
                 coro, return_exceptions=self.return_exceptions)
+        except asyncio.CancelledError:
+            self._finish(task, 'cancelled')
+            if future:
+                future.cancel()
+            if span:
+                self.tracer.finish(span, token, 'cancelled')
+            raise
         except Exception as err:
-            self.errors.append(err)
-            yield from self.observer.trigger('task.error', task, err)
+            self._finish(task, 'failed')
+            if span:
+                self.tracer.finish(span, token, 'error', err)
+            if future and not future.done():
+                future.set_exception(err)
+            # Errors are delivered via futures in service mode,
+            # unless running as task group
+            if not self._service or self._group:
+                self.errors.append(err)
+                if self._group and len(self.errors) == 1:
+                    self._abort_group()
+            waiter = self._on_task_error and self._on_task_error(task, err)
+            if waiter:
+                await waiter
             raise err  # important: re-raise exception for asyncio propagation
+        finally:
+            self._release(task)
+
+        if isinstance(result, Exception):
+            self._finish(task, 'failed')
+            if span:
+                self.tracer.finish(span, token, 'error', result)
+        else:
+            self._finish(task, 'completed')
+            if span:
+                self.tracer.finish(span, token)
+
+        if future and not future.done():
+            future.set_result(result)
 
         # Trigger task post-execution event
-        yield from self.observer.trigger('task.finish', task, result)
+        waiter = self._on_task_finish and self._on_task_finish(task, result)
+        if waiter:
+            await waiter
 
         # Return result to future binding
         return result
 
-    @asyncio.coroutine
-    def _schedule_coro(self, task):
+    def _finish(self, task, status):
         """
-        Executes a given coroutine in the next available slot.
-
-        Slots are available based on a simple free slots
-        scheduling semaphore-based algorithm.
+        Flags the given task as finished, feeding the adaptive limiter
+        and metrics with the task latency.
         """
-        # Run when a slot is available
-        with (yield from self.semaphore):
-            return (yield from self._run_coro(task))
+        task.status = status
+        if not self._timed:
+            return None
 
-    @asyncio.coroutine
-    def run(self,
-            timeout=None,
-            return_when=None,
-            return_exceptions=None,
-            ignore_empty=None):
+        task.finished = self.loop.time()
+        latency = task.finished - task.started
+        if self.limiter and status != 'cancelled':
+            self._adapt(latency, status == 'failed')
+        if self.metrics:
+            self.metrics.finish(latency, status)
+
+    async def _deadline(self, coro, timeout):
+        """
+        Runs the given coroutine, cancelling the running task via the
+        shared deadlines timer if it takes longer than ``timeout``.
+        """
+        task = current_task(loop=self.loop)
+        deadline = self._deadlines.add(timeout, task)
+        try:
+            return await coro
+        except asyncio.CancelledError:
+            if not deadline.expired:
+                raise
+            # Python 3.11+ tracks pending cancellation requests
+            if hasattr(task, 'uncancel'):
+                task.uncancel()
+            raise asyncio.TimeoutError(
+                'paco: task timeout exceeded') from None
+        finally:
+            self._deadlines.remove(deadline)
+
+    def _adapt(self, latency, failed):
+        """
+        Feeds the adaptive limiter with a finished task sample,
+        resizing the concurrency limit accordingly.
+        """
+        limit = self.limiter.update(latency, failed, len(self._pending))
+        if limit != self.limit:
+            self.resize(limit)
+
+    async def run(self,
+                  timeout=None,
+                  return_when=None,
+                  return_exceptions=None,
+                  ignore_empty=None,
+                  retain_done=True):
         """
         Executes the registered coroutines in the executor queue.
 
@@ -318,6 +1382,11 @@ class ConcurrentExecutor(object):
                 See `asyncio.wait`_ for supported values.
             ignore_empty (bool, optional): do not raise an exception if there are
                 no coroutines to schedule are empty.
+            retain_done (bool, optional): keep the finished futures to return
+                them in the ``done`` set. Disable it if the results are
+                collected via events, so memory usage is bounded by the
+                concurrency limit instead of the number of coroutines.
+                Defaults to ``True``.
 
         Returns:
             asyncio.Future (tuple): two sets of Futures: ``(done, pending)``
@@ -338,7 +1407,7 @@ class ConcurrentExecutor(object):
                         else ignore_empty)
 
         # Check we have coroutines to schedule
-        if len(self.pool) == 0:
+        if len(self.pool) == 0 and not self._sources:
             # If ignore empty mode enabled, just return an empty tuple
             if ignore_empty:
                 return (tuple(), tuple())
@@ -355,25 +1424,31 @@ class ConcurrentExecutor(object):
         if return_exceptions is False and return_when is None:
             return_when = 'FIRST_EXCEPTION'
 
+        # Sequential execution stops on the first error
+        if self.limit == 1 and not self.return_exceptions and \
+                return_when is None:
+            return_when = 'FIRST_EXCEPTION'
+
         if return_when is None:
             return_when = 'ALL_COMPLETED'
 
         # Trigger pre-execution event
-        yield from self.observer.trigger('start', self)
-
-        # Sequential coroutines execution
-        if self.limit == 1:
-            done, pending = yield from self._run_sequentially()
+        await self.observer.trigger('start', self)
 
         # Concurrent execution based on configured limit
-        if self.limit != 1:
-            done, pending = yield from self._run_concurrently(
-                timeout=timeout,
-                return_when=return_when)
+        done, pending = await self._run_concurrently(
+            timeout=timeout,
+            return_when=return_when,
+            retain_done=retain_done)
 
         # Reset internal state and queue
         self.running = False
 
+        # Errors raised by the fed iterables are not coroutine results
+        if self._source_error is not None:
+            err, self._source_error = self._source_error, None
+            raise err
+
         # Raise exception, if needed
         if self.return_exceptions is False and self.errors:
             err = self.errors[0]
@@ -381,7 +1456,7 @@ class ConcurrentExecutor(object):
             raise err
 
         # Trigger pre-execution event
-        yield from self.observer.trigger('finish', self)
+        await self.observer.trigger('finish', self)
 
         # Reset executor state to defaults after each execution
         self.reset()
@@ -392,6 +1467,262 @@ class ConcurrentExecutor(object):
     # Idiomatic method alias to run()
     wait = run
 
+    def as_completed(self, timeout=None, return_exceptions=False):
+        """
+        Executes the registered coroutines in the executor queue, returning
+        an asynchronous iterator that yields ``(index, result)`` tuples as
+        soon as every coroutine is finished, where ``index`` is the order
+        in which the coroutine was added or fed.
+
+        The concurrency limit is respected, so consumers can start
+        processing the first results while the rest are still pending.
+
+        If the iteration is stopped early, e.g: ``break``, or the timeout
+        is exceeded, the pending coroutines are cancelled and reaped once
+        the iterator is closed. Use ``aclose()`` to close it right away.
+
+        Arguments:
+            timeout (int/float): max execution timeout. No limit by default.
+            return_exceptions (bool): yields exceptions as valid results.
+                Otherwise, pending coroutines are cancelled and the first
+                exception is raised by the iterator. Defaults to ``False``.
+
+        Raises:
+            RuntimeError: if executor is still running.
+            asyncio.TimeoutError: if execution takes more than expected.
+
+        Returns:
+            async_generator: asynchronous iterator.
+
+        Usage::
+
+            pool = paco.ConcurrentExecutor(limit=2)
+            pool.feed(fetch, urls)
+
+            async for index, response in pool.as_completed():
+                print(urls[index], response)
+        """
+        if self.running:
+            raise RuntimeError('paco: executor is already running')
+        return self._as_completed(timeout, return_exceptions)
+
+    async def _as_completed(self, timeout, return_exceptions):
+        results = deque()
+        waiter = None
+
+        def wakeup(*args):
+            if waiter is not None and not waiter.done():
+                waiter.set_result(None)
+
+        def push(task, result):
+            results.append((task.index, result))
+            wakeup()
+
+        # Results are collected via the task finish event
+        self.on('task.finish', push)
+        runner = asyncio.ensure_future(self.run(
+            timeout=timeout,
+            return_exceptions=return_exceptions,
+            ignore_empty=True,
+            retain_done=False), loop=self.loop)
+        runner.add_done_callback(wakeup)
+
+        try:
+            while True:
+                while results:
+                    yield results.popleft()
+
+                if runner.done():
+                    # Propagate execution errors
+                    _, pending = runner.result()
+                    if pending:
+                        raise asyncio.TimeoutError(
+                            'paco: as completed timeout exceeded')
+                    return
+
+                waiter = self.loop.create_future()
+                await waiter
+        finally:
+            self.off('task.finish', push)
+            await self._close_completed(runner)
+
+    async def _close_completed(self, runner):
+        """
+        Cancels and reaps the coroutines left by an ``as_completed()``
+        iteration stopped early or timed out.
+        """
+        # Stopped early: cancel the execution cycle
+        if not runner.done():
+            self.cancel()
+            await asyncio.wait((runner,))
+
+        if runner.cancelled() or runner.exception() is not None:
+            return None
+
+        # Timed out: the cycle left the in-flight tasks behind
+        _, pending = runner.result()
+        tasks = [task for task in itertools.chain(pending, self._workers)
+                 if isinstance(task, asyncio.Task) and not task.done()]
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+
+    async def start(self):
+        """
+        Starts the executor in service mode, executing the pending and
+        further submitted coroutines as soon as there are free slots,
+        until the executor is closed.
+
+        Raises:
+            RuntimeError: if executor is already running.
+        """
+        if self.running:
+            raise RuntimeError('paco: executor is already running')
+
+        self.running = True
+        self._service = True
+        self._closing = False
+        self.return_exceptions = False
+        self._return_when = 'ALL_COMPLETED'
+
+        # Compile task events dispatchers for the service lifetime
+        self._compile_events()
+
+        # Trigger pre-execution event
+        await self.observer.trigger('start', self)
+
+        # Schedule the already pending tasks
+        self._schedule()
+
+    async def drain(self):
+        """
+        Waits until all the pending and running coroutines are finished.
+
+        This method is a coroutine.
+        """
+        # Tasks held for a rate limit token are pending as well
+        if not self._service or (not self._pending and
+                                 not self.pool and not self._sources and
+                                 self._held is None and
+                                 self._rate_timer is None):
+            return None
+
+        if self._waiter is None or self._waiter.done():
+            self._waiter = asyncio.Future(loop=self.loop)
+
+        await asyncio.shield(self._waiter)
+
+    async def close(self):
+        """
+        Stops accepting new coroutines, waits until the pending ones
+        are finished and stops the executor service mode.
+
+        This method is a coroutine.
+        """
+        if not self._service:
+            return None
+
+        self._closing = True
+        await self.drain()
+
+        self.running = False
+        self._service = False
+        self._waiter = None
+
+        # Trigger post-execution event
+        await self.observer.trigger('finish', self)
+
+        # Reset executor state to defaults
+        self.reset()
+        self._closing = False
+
+    async def __aenter__(self):
+        await self.start()
+        self.errors = []
+        self._group = True
+        self._parent = current_task(loop=self.loop)
+        self._parent_cancelled = False
+        self._exiting = False
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._exiting = True
+        cancelled = exc_type is not None and \
+            issubclass(exc_type, asyncio.CancelledError)
+
+        # Wait until the coroutines are finished, unless the block failed
+        if exc_type is None and not self.errors:
+            try:
+                await self.drain()
+            except asyncio.CancelledError:
+                cancelled = True
+
+        # Cancel and reap the coroutines left, if any
+        self._clear_queue()
+        while True:
+            try:
+                await self._abort()
+                break
+            except asyncio.CancelledError:
+                cancelled = True
+
+        # Tell apart the block cancellation requested on task failure
+        # from the external cancellation of the current task
+        if self._parent_cancelled:
+            uncancel = getattr(self._parent, 'uncancel', None)
+            cancelled = cancelled and bool(uncancel and uncancel())
+
+        errors = self.errors
+        self.errors = []
+        self._service = self._group = self._exiting = False
+        self._parent = self._waiter = None
+
+        # Trigger post-execution event
+        await self.observer.trigger('finish', self)
+
+        # Reset executor state to defaults
+        self.reset()
+
+        if cancelled:
+            raise asyncio.CancelledError()
+
+        failed = exc_type is not None and not cancelled and \
+            issubclass(exc_type, Exception) and \
+            not issubclass(exc_type, asyncio.CancelledError)
+
+        if BaseExceptionGroup is not None:
+            if failed:
+                errors.insert(0, exc)
+            if errors:
+                raise BaseExceptionGroup(
+                    'paco: unhandled errors in executor', errors)
+            return False
+
+        # Block errors take precedence over the coroutines errors
+        if failed or not errors:
+            return False
+
+        err = errors[0]
+        err.errors = errors[1:]
+        raise err
+
+    def _abort_group(self):
+        """
+        Cancels the pending coroutines and the executor block on the
+        first task group error.
+        """
+        self.running = False
+        self._clear_queue()
+        self._cancel_running()
+
+        # Wake up the block exit, or cancel the block if still running
+        if self._exiting:
+            self._resolve()
+        elif self._parent and not self._parent.done():
+            self._parent_cancelled = True
+            self._parent.cancel()
+
     def is_running(self):
         """
         Checks the executor running state.
@@ -26,10 +26,9 @@ def constant(value, delay=None):
         # => 'foo'
 
     """
-    @asyncio.coroutine
-    def coro():
+    async def coro():
         if delay:
-            yield from asyncio.sleep(delay)
+            await asyncio.sleep(delay)
         return value
 
     return coro
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+import heapq
+
+# Min number of deadlines in the heap to consider compacting it
+MIN_COMPACT_SIZE = 100
+
+
+class Deadline(object):
+    """
+    Deadline of a running task registered in a ``DeadlineTimer``.
+
+    This class is intended to be used internally.
+    """
+
+    __slots__ = ('when', 'task', 'expired')
+
+    def __init__(self, when, task):
+        self.when = when
+        self.task = task
+        self.expired = False
+
+    def __lt__(self, other):
+        return self.when < other.when
+
+
+class DeadlineTimer(object):
+    """
+    Cancels tasks once their deadline expires, using a single heap of
+    deadlines and a single event loop timer handle scheduled at the
+    earliest deadline, instead of one timer handle per task.
+
+    Finished deadlines are lazily removed from the heap, which is
+    compacted once most of its deadlines are finished, like the asyncio
+    event loop does with cancelled timer handles.
+
+    This class is intended to be used internally.
+
+    Arguments:
+        loop (asyncio.BaseEventLoop): event loop to use.
+    """
+
+    def __init__(self, loop):
+        self.loop = loop
+        self._heap = []
+        self._handle = None
+        self._when = None
+        # Number of finished deadlines still in the heap
+        self._removed = 0
+
+    def __len__(self):
+        return len(self._heap)
+
+    def add(self, timeout, task):
+        """
+        Registers a new deadline for the given task.
+
+        Arguments:
+            timeout (int|float): seconds until the task is cancelled.
+            task (asyncio.Task): task to cancel.
+
+        Returns:
+            Deadline
+        """
+        deadline = Deadline(self.loop.time() + timeout, task)
+        heapq.heappush(self._heap, deadline)
+
+        # Reschedule the timer if this is the earliest deadline
+        if self._when is None or deadline.when < self._when:
+            self._schedule()
+
+        return deadline
+
+    def remove(self, deadline):
+        """
+        Removes the given deadline, if the task finished in time.
+        """
+        if deadline.task is None:
+            return None
+
+        deadline.task = None
+        # Expired deadlines were already popped from the heap
+        if not deadline.expired:
+            self._removed += 1
+
+        self._prune()
+        if not self._heap:
+            return self.clear()
+
+        # Rebuild the heap if most of the deadlines are finished,
+        # e.g: while a slow task deadline stays on top of the heap
+        if len(self._heap) > MIN_COMPACT_SIZE and \
+                self._removed > len(self._heap) // 2:
+            self._heap = [item for item in self._heap
+                          if item.task is not None]
+            heapq.heapify(self._heap)
+            self._removed = 0
+
+    def clear(self):
+        """
+        Removes all the deadlines and cancels the timer.
+        """
+        self._heap = []
+        self._removed = 0
+        if self._handle:
+            self._handle.cancel()
+        self._handle = self._when = None
+
+    def _prune(self):
+        # Drop finished deadlines on top of the heap
+        heap = self._heap
+        while heap and heap[0].task is None:
+            heapq.heappop(heap)
+            self._removed -= 1
+
+    def _schedule(self):
+        if self._handle:
+            self._handle.cancel()
+        self._when = self._heap[0].when
+        self._handle = self.loop.call_at(self._when, self._expire)
+
+    def _expire(self):
+        self._handle = self._when = None
+        now = self.loop.time()
+        heap = self._heap
+
+        while heap and heap[0].when <= now:
+            deadline = heapq.heappop(heap)
+            if deadline.task is None:
+                self._removed -= 1
+            else:
+                deadline.expired = True
+                deadline.task.cancel()
+
+        self._prune()
+        if heap:
+            self._schedule()
@@ -27,15 +27,14 @@ def generator_consumer(coro):  # pragma: no cover
         raise TypeError('paco: coro must be a coroutine function')
 
     @functools.wraps(coro)
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
+    async def wrapper(*args, **kw):
         if len(args) > 1 and isgenerator(args[1]):
             args = list(args)
-            args[1] = (yield from consume(args[1])
+            args[1] = (await consume(args[1])
                        if hasattr(args[1], '__anext__')
                        else list(args[1]))
             args = tuple(args)
-        return (yield from coro(*args, **kw))
+        return await coro(*args, **kw)
     return wrapper
 
 
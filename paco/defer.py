@@ -39,10 +39,9 @@ def defer(coro, delay=1):
     """
     assert_corofunction(coro=coro)
 
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
+    async def wrapper(*args, **kw):
         # Wait until we're done
-        yield from asyncio.sleep(delay)
-        return (yield from coro(*args, **kw))
+        await asyncio.sleep(delay)
+        return await coro(*args, **kw)
 
     return wrapper
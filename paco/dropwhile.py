@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .filter import filter
 from .decorator import overload
 
 
 @overload
-@asyncio.coroutine
-def dropwhile(coro, iterable, loop=None):
+async def dropwhile(coro, iterable, loop=None):
     """
     Make an iterator that drops elements from the iterable as long as the
     predicate is true; afterwards, returns every element.
@@ -45,8 +43,7 @@ def dropwhile(coro, iterable, loop=None):
     """
     drop = False
 
-    @asyncio.coroutine
-    def assert_fn(element):
+    async def assert_fn(element):
         nonlocal drop
 
         if element and not drop:
@@ -57,9 +54,8 @@ def dropwhile(coro, iterable, loop=None):
 
         return True if drop else element
 
-    @asyncio.coroutine
-    def filter_fn(element):
-        return (yield from coro(element))
+    async def filter_fn(element):
+        return await coro(element)
 
-    return (yield from filter(filter_fn, iterable,
-                              assert_fn=assert_fn, limit=1, loop=loop))
+    return await filter(filter_fn, iterable,
+                        assert_fn=assert_fn, limit=1, loop=loop)
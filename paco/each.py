@@ -1,14 +1,29 @@
 # -*- coding: utf-8 -*-
-import asyncio
+from .wraps import wraps
+from .process import ProcessPool
+from .sharded import ShardedExecutor
 from .decorator import overload
-from .concurrent import ConcurrentExecutor, safe_run
+from .concurrent import ConcurrentExecutor
 from .assertions import assert_corofunction, assert_iter
 
 
+def unsupported(executor, **options):
+    """
+    Raises ``ValueError`` if any of the given options, not supported by
+    the executor, is set.
+    """
+    for name, value in options.items():
+        if value is not None:
+            raise ValueError('{} is not supported by {}'.format(
+                name, type(executor).__name__))
+
+
 @overload
-@asyncio.coroutine
-def each(coro, iterable, limit=0, loop=None,
-         collect=False, timeout=None, return_exceptions=False, *args, **kw):
+async def each(coro, iterable, limit=0, loop=None,
+               collect=False, timeout=None, return_exceptions=False,
+               *args, executor=None, key=None, key_limit=1,
+               key_backlog=1000, task_timeout=None, tracer=None,
+               eager=False, rate=None, burst=1, **kw):
     """
     Concurrently iterates values yielded from an iterable, passing them to
     an asynchronous coroutine.
@@ -41,6 +56,40 @@ def each(coro, iterable, limit=0, loop=None,
             of seconds to wait before returning. timeout can be an int or
             float. If timeout is not specified or None, there is no limit to
             the wait time.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run ``coro`` if it is a blocking function instead of a
+            coroutine function. Use ``True`` for the loop default thread pool
+            executor. Concurrency is still bounded by ``limit``.
+            For CPU-bound functions, use a ``paco.ProcessPool`` or
+            ``process`` for the shared default process pool: items are
+            dispatched to worker processes in chunks and ``limit`` is
+            bounded by the number of worker processes instead.
+            Use a ``paco.ShardedExecutor`` to spread the coroutines over
+            several event loop threads, where ``limit`` is the global limit
+            and defaults to the executor limit. Options not supported by
+            the process and sharded executors raise ``ValueError``.
+        key (function): optional function that returns the concurrency key
+            of every iterable value. Coroutines with the same key are limited
+            to ``key_limit`` concurrent executions, e.g: per host limit.
+            Not supported by process pools and sharded executors.
+        key_limit (int): concurrency limit per key. Defaults to ``1``.
+        key_backlog (int): max number of values read ahead while their
+            concurrency key is saturated. Defaults to ``1000``.
+        task_timeout (int|float): optional max number of seconds every
+            coroutine can run before it is cancelled and fails with
+            ``asyncio.TimeoutError``. Not supported by process pools.
+        tracer (paco.Tracer): optional tracer used to record a span per
+            coroutine call. Not supported by process pools and sharded
+            executors.
+        eager (bool): starts the coroutines eagerly, creating a task only
+            if they suspend. Useful when most of the coroutines finish
+            without suspending, e.g: cache hits. Only used in Python
+            3.12+. Ignored by process pools. Defaults to ``False``.
+        rate (int|float): optional max number of coroutines started per
+            second, on top of ``limit``, e.g: API requests per second quota.
+            Not supported by process pools and sharded executors.
+        burst (int): max number of coroutines that can be started at once
+            within the ``rate`` limit. Defaults to ``1``.
         *args (mixed): optional variadic arguments to pass to the
             coroutine iterable function.
 
@@ -49,6 +98,7 @@ def each(coro, iterable, limit=0, loop=None,
 
     Raises:
         TypeError: in case of invalid input arguments.
+        ValueError: in case of options not supported by the executor.
 
     Usage::
 
@@ -62,36 +112,70 @@ def each(coro, iterable, limit=0, loop=None,
         # => [2, 4, 6, 8, 10]
 
     """
+    # Use the shared default process pool
+    if executor == 'process':
+        executor = ProcessPool.default()
+
+    # Dispatch CPU-bound functions to the worker processes in chunks
+    if isinstance(executor, ProcessPool):
+        unsupported(executor, key=key, task_timeout=task_timeout,
+                    tracer=tracer, rate=rate)
+        results = await executor.map(
+            coro, iterable, *args, loop=loop, timeout=timeout,
+            return_exceptions=return_exceptions, **kw)
+        return results if collect else None
+
+    # Spread the coroutines over the shard event loops
+    if isinstance(executor, ShardedExecutor):
+        unsupported(executor, key=key, tracer=tracer, rate=rate)
+        return await executor.each(
+            coro, iterable, *args, limit=limit or None, timeout=timeout,
+            task_timeout=task_timeout, eager=eager, collect=collect,
+            return_exceptions=return_exceptions, **kw)
+
+    # Run blocking functions in the given executor
+    if executor is not None:
+        coro = wraps(coro, executor=executor, loop=loop)
+
     assert_corofunction(coro=coro)
     assert_iter(iterable=iterable)
 
     # By default do not collect yielded values from coroutines
     results = None
 
-    if collect:
-        # Store ordered results
-        results = [None] * len(iterable)
-
     # Create concurrent executor
-    pool = ConcurrentExecutor(limit=limit, loop=loop)
+    pool = ConcurrentExecutor(limit=limit, loop=loop, key=key,
+                              key_limit=key_limit, key_backlog=key_backlog,
+                              task_timeout=task_timeout,
+                              tracer=tracer, eager=eager, rate=rate,
+                              burst=burst)
 
-    @asyncio.coroutine
-    def collector(index, item):
-        result = yield from safe_run(coro(item, *args, **kw),
-                                     return_exceptions=return_exceptions)
-        if collect:
+    if collect:
+        # Store ordered results. Unsized iterables, such as generators,
+        # are collected into a list growing as the items are consumed
+        results = [None] * len(iterable) if hasattr(iterable, '__len__') \
+            else []
+
+        # Fed tasks are indexed in iteration order, so results are
+        # stored by task index. This also covers exceptions returned
+        # by the executor, such as tasks timeout errors.
+        def collector(task, result):
+            index = task.index
+            if index >= len(results):
+                results.extend([None] * (index + 1 - len(results)))
             results[index] = result
 
-        return result
+        pool.on('task.finish', collector)
 
-    # Iterate and pass elements to coroutine
-    for index, value in enumerate(iterable):
-        pool.add(collector(index, value))
+    # Lazily pass elements to coroutine as slots become available
+    pool.feed(coro, iterable, *args, **kw)
 
     # Wait until all the coroutines finishes
-    yield from pool.run(return_exceptions=return_exceptions,
-                        ignore_empty=True,
-                        timeout=timeout)
+    # Results are collected via events, so finished futures are not retained
+    await pool.run(return_exceptions=return_exceptions,
+                   ignore_empty=True,
+                   timeout=timeout,
+                   retain_done=False)
 
     # Returns list of mapped results in order
     return results
@@ -1,14 +1,12 @@
 # -*- coding: utf-8 -*-
-import asyncio
-from .partial import partial
+from .wraps import wraps
 from .decorator import overload
 from .concurrent import ConcurrentExecutor
 from .assertions import assert_corofunction, assert_iter
 
 
 @overload
-@asyncio.coroutine
-def every(coro, iterable, limit=1, loop=None):
+async def every(coro, iterable, limit=1, loop=None, *, executor=None):
     """
     Returns `True` if every element in a given iterable satisfies the coroutine
     asynchronous test.
@@ -29,6 +27,10 @@ def every(coro, iterable, limit=1, loop=None):
             coroutines functions.
         limit (int): max concurrency execution limit. Use ``0`` for no limit.
         loop (asyncio.BaseEventLoop): optional event loop to use.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run ``coro`` if it is a blocking function instead of a
+            coroutine function. Use ``True`` for the loop default thread pool
+            executor. Concurrency is still bounded by ``limit``.
 
     Raises:
         TypeError: if input arguments are not valid.
@@ -48,6 +50,10 @@ def every(coro, iterable, limit=1, loop=None):
         # => True
 
     """
+    # Run blocking functions in the given executor
+    if executor is not None:
+        coro = wraps(coro, executor=executor, loop=loop)
+
     assert_corofunction(coro=coro)
     assert_iter(iterable=iterable)
 
@@ -62,23 +68,21 @@ def every(coro, iterable, limit=1, loop=None):
     pool = ConcurrentExecutor(limit=limit, loop=loop)
 
     # Tester function to guarantee the file is canceled.
-    @asyncio.coroutine
-    def tester(element):
+    async def tester(element):
         nonlocal passes
         if not passes:
             return None
 
-        if not (yield from coro(element)):
+        if not (await coro(element)):
             # Flag as not test passed
             passes = False
             # Force ignoring pending coroutines
             pool.cancel()
 
-    # Iterate and attach coroutine for defer scheduling
-    for element in iterable:
-        pool.add(partial(tester, element))
+    # Lazily attach elements for deferred scheduling
+    pool.feed(tester, iterable)
 
     # Wait until all coroutines finish
-    yield from pool.run()
+    await pool.run(retain_done=False)
 
     return passes
@@ -1,12 +1,11 @@
 # -*- coding: utf-8 -*-
-import asyncio
+from .wraps import wraps
 from .decorator import overload
 from .concurrent import ConcurrentExecutor
 from .assertions import assert_corofunction, assert_iter
 
 
-@asyncio.coroutine
-def assert_true(element):
+async def assert_true(element):
     """
     Asserts that a given coroutine yields a true-like value.
 
@@ -20,8 +19,8 @@ def assert_true(element):
 
 
 @overload
-@asyncio.coroutine
-def filter(coro, iterable, assert_fn=None, limit=0, loop=None):
+async def filter(coro, iterable, assert_fn=None, limit=0, loop=None, *,
+                 executor=None):
     """
     Returns a list of all the values in coll which pass an asynchronous truth
     test coroutine.
@@ -46,6 +45,10 @@ def filter(coro, iterable, assert_fn=None, limit=0, loop=None):
         assert_fn (coroutinefunction): optional assertion function.
         limit (int): max filtering concurrency limit. Use ``0`` for no limit.
         loop (asyncio.BaseEventLoop): optional event loop to use.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run ``coro`` if it is a blocking function instead of a
+            coroutine function. Use ``True`` for the loop default thread pool
+            executor. Concurrency is still bounded by ``limit``.
 
     Raises:
         TypeError: if coro argument is not a coroutine function.
@@ -69,6 +72,10 @@ def filter(coro, iterable, assert_fn=None, limit=0, loop=None):
         # => [1, 3, 5]
 
     """
+    # Run blocking functions in the given executor
+    if executor is not None:
+        coro = wraps(coro, executor=executor, loop=loop)
+
     assert_corofunction(coro=coro)
     assert_iter(iterable=iterable)
 
@@ -85,21 +92,18 @@ def filter(coro, iterable, assert_fn=None, limit=0, loop=None):
     # Create concurrent executor
     pool = ConcurrentExecutor(limit=limit, loop=loop)
 
-    # Reducer partial function for deferred coroutine execution
-    def filterer(index, element):
-        @asyncio.coroutine
-        def wrapper():
-            result = yield from coro(element)
-            if (yield from assert_fn(result)):
-                results[index] = element
-        return wrapper
+    # Filterer coroutine for deferred execution
+    async def filterer(entry):
+        index, element = entry
+        result = await coro(element)
+        if (await assert_fn(result)):
+            results[index] = element
 
-    # Iterate and attach coroutine for defer scheduling
-    for index, element in enumerate(iterable):
-        pool.add(filterer(index, element))
+    # Lazily attach elements for deferred scheduling
+    pool.feed(filterer, enumerate(iterable))
 
     # Wait until all coroutines finish
-    yield from pool.run(ignore_empty=True)
+    await pool.run(ignore_empty=True, retain_done=False)
 
     # Returns filtered elements
     return [x for x in results if x is not None]
@@ -1,11 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .filter import filter
 from .decorator import overload
 
 
-@asyncio.coroutine
-def assert_false(element):
+async def assert_false(element):
     """
     Asserts that a given coroutine yields a non-true value.
     """
@@ -13,8 +11,7 @@ def assert_false(element):
 
 
 @overload
-@asyncio.coroutine
-def filterfalse(coro, iterable, limit=0, loop=None):
+async def filterfalse(coro, iterable, limit=0, loop=None):
     """
     Returns a list of all the values in coll which pass an asynchronous truth
     test coroutine.
@@ -56,6 +53,6 @@ def filterfalse(coro, iterable, limit=0, loop=None):
         # => [1, 3, 5]
 
     """
-    return (yield from filter(coro, iterable,
-                              assert_fn=assert_false,
-                              limit=limit, loop=loop))
+    return await filter(coro, iterable,
+                        assert_fn=assert_false,
+                        limit=limit, loop=loop)
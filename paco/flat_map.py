@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .assertions import isiter
 from .reduce import reduce
 from .decorator import overload
@@ -7,9 +6,8 @@ from .assertions import assert_corofunction, assert_iter
 
 
 @overload
-@asyncio.coroutine
-def flat_map(coro, iterable, limit=0, loop=None, timeout=None,
-             return_exceptions=False, initializer=None, *args, **kw):
+async def flat_map(coro, iterable, limit=0, loop=None, timeout=None,
+                   return_exceptions=False, initializer=None, *args, **kw):
     """
     Concurrently iterates values yielded from an iterable, passing them to
     an asynchronous coroutine.
@@ -69,12 +67,11 @@ def flat_map(coro, iterable, limit=0, loop=None, timeout=None,
     # By default do not collect yielded values from coroutines
     results = initializer if isiter(initializer) else []
 
-    @asyncio.coroutine
-    def reducer(buf, value):
+    async def reducer(buf, value):
         if isiter(value):
-            yield from _reduce(value)
+            await _reduce(value)
         else:
-            buf.append((yield from coro(value)))
+            buf.append(await coro(value))
         return buf
 
     def _reduce(iterable):
@@ -82,4 +79,4 @@ def flat_map(coro, iterable, limit=0, loop=None, timeout=None,
                       initializer=results, limit=limit, loop=loop)
 
     # Returns list of mapped reduced results
-    return (yield from _reduce(iterable))
+    return await _reduce(iterable)
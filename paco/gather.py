@@ -4,9 +4,9 @@ from .assertions import isiter
 from .concurrent import ConcurrentExecutor, collect
 
 
-@asyncio.coroutine
-def gather(*coros_or_futures, limit=0, loop=None, timeout=None,
-           preserve_order=False, return_exceptions=False):
+async def gather(*coros_or_futures, limit=0, loop=None, timeout=None,
+                 preserve_order=False, return_exceptions=False,
+                 eager=False):
     """
     Return a future aggregating results from the given coroutine objects
     with a concurrency execution limit.
@@ -38,6 +38,10 @@ def gather(*coros_or_futures, limit=0, loop=None, timeout=None,
             the wait time.
         preserve_order (bool): preserves results order.
         return_exceptions (bool): returns exceptions as valid results.
+        eager (bool): starts the coroutines eagerly, creating a task only
+            if they suspend. Useful when most of the coroutines finish
+            without suspending, e.g: cache hits. Only used in Python
+            3.12+. Defaults to ``False``.
         loop (asyncio.BaseEventLoop): optional event loop to use.
 
     Returns:
@@ -67,7 +71,7 @@ def gather(*coros_or_futures, limit=0, loop=None, timeout=None,
     results = [None] * len(coros_or_futures) if preserve_order else []
 
     # Create concurrent executor
-    pool = ConcurrentExecutor(limit=limit, loop=loop)
+    pool = ConcurrentExecutor(limit=limit, loop=loop, eager=eager)
 
     # Iterate and attach coroutine for defer scheduling
     for index, coro in enumerate(coros_or_futures):
@@ -84,7 +88,8 @@ def gather(*coros_or_futures, limit=0, loop=None, timeout=None,
                          return_exceptions=return_exceptions))
 
     # Wait until all the tasks finishes
-    yield from pool.run(timeout=timeout, return_exceptions=return_exceptions)
+    await pool.run(timeout=timeout, return_exceptions=return_exceptions,
+                   retain_done=False)
 
     # Returns aggregated results
     return results
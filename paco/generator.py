@@ -1,11 +1,4 @@
-import sys
-import asyncio
-
-PY_35 = sys.version_info >= (3, 5)
-
-
-@asyncio.coroutine
-def consume(generator):  # pragma: no cover
+async def consume(generator):  # pragma: no cover
     """
     Helper function to consume a synchronous or asynchronous generator.
 
@@ -19,15 +12,11 @@ def consume(generator):  # pragma: no cover
     if hasattr(generator, '__next__'):
         return list(generator)
 
-    if not PY_35:
-        raise RuntimeError(
-            'paco: asynchronous iterator protocol not supported')
-
     # If asynchronous generator, consume it generator protocol manually
     buf = []
     while True:
         try:
-            buf.append((yield from generator.__anext__()))
+            buf.append(await generator.__anext__())
         except StopAsyncIteration:  # noqa
             break
 
@@ -1,13 +1,9 @@
 # -*- coding: utf-8 -*-
 import asyncio
+from asyncio import ensure_future
 from .decorator import decorate
 from .assertions import assert_corofunction
 
-try:
-    ensure_future = asyncio.ensure_future
-except:
-    ensure_future = getattr(asyncio, 'async')
-
 
 @decorate
 def interval(coro, interval=1, times=None, loop=None):
@@ -58,15 +54,14 @@ def interval(coro, interval=1, times=None, loop=None):
     # Store maximum allowed number of calls
     times = int(times or 0) or float('inf')
 
-    @asyncio.coroutine
-    def schedule(times, *args, **kw):
+    async def schedule(times, *args, **kw):
         while times > 0:
             # Decrement times counter
             times -= 1
 
             # Schedule coroutine
-            yield from coro(*args, **kw)
-            yield from asyncio.sleep(interval)
+            await coro(*args, **kw)
+            await asyncio.sleep(interval)
 
     def wrapper(*args, **kw):
         return ensure_future(schedule(times, *args, **kw), loop=loop)
@@ -0,0 +1,176 @@
+# -*- coding: utf-8 -*-
+import abc
+import math
+
+
+class Limiter(abc.ABC):
+    """
+    Base class for adaptive concurrency limit algorithms.
+
+    Limiters are notified with the latency and outcome of every finished
+    coroutine task and estimate the optimal concurrency limit, which
+    is then applied to the executor at runtime.
+
+    Subclasses must implement the ``update()`` method, otherwise they
+    cannot be instantiated.
+
+    Arguments:
+        limit (int): initial concurrency limit. Defaults to ``10``.
+        min_limit (int): minimum concurrency limit. Defaults to ``1``.
+        max_limit (int): maximum concurrency limit. Defaults to ``1000``.
+
+    Raises:
+        ValueError: if the limits are not valid.
+    """
+
+    def __init__(self, limit=10, min_limit=1, max_limit=1000):
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError('paco: invalid limiter limits')
+
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limit = float(self._clamp(limit))
+
+    @property
+    def limit(self):
+        """
+        Returns the current estimated concurrency limit.
+
+        Returns:
+            int
+        """
+        return int(self._limit)
+
+    def _clamp(self, limit):
+        return min(max(limit, self.min_limit), self.max_limit)
+
+    @abc.abstractmethod
+    def update(self, latency, failed=False, inflight=0):
+        """
+        Updates the concurrency limit estimation with a finished task sample.
+
+        Arguments:
+            latency (float): task execution time in seconds.
+            failed (bool): ``True`` if the task raised an exception.
+            inflight (int): number of tasks running when the task finished.
+
+        Returns:
+            int: new concurrency limit.
+        """
+
+
+class AIMDLimiter(Limiter):
+    """
+    Additive-increase/multiplicative-decrease concurrency limiter.
+
+    The limit grows by ``increase`` slots per each window of ``limit``
+    successful tasks while the executor is saturated, and it is multiplied
+    by ``backoff`` when a task fails or exceeds the ``latency`` threshold.
+
+    Arguments:
+        limit (int): initial concurrency limit. Defaults to ``10``.
+        min_limit (int): minimum concurrency limit. Defaults to ``1``.
+        max_limit (int): maximum concurrency limit. Defaults to ``1000``.
+        increase (int|float): slots to add per window. Defaults to ``1``.
+        backoff (float): multiplicative decrease ratio. Defaults to ``0.9``.
+        latency (int|float): optional latency threshold in seconds
+            considered as an overload signal.
+
+    Raises:
+        ValueError: if the limits or backoff ratio are not valid.
+
+    Usage::
+
+        pool = paco.ConcurrentExecutor(limiter=paco.AIMDLimiter(latency=0.5))
+    """
+
+    def __init__(self, limit=10, min_limit=1, max_limit=1000,
+                 increase=1, backoff=0.9, latency=None):
+        super().__init__(limit=limit, min_limit=min_limit,
+                         max_limit=max_limit)
+
+        if not 0 < backoff < 1:
+            raise ValueError('paco: backoff must be between 0 and 1')
+
+        self.increase = increase
+        self.backoff = backoff
+        self.latency = latency
+
+    def update(self, latency, failed=False, inflight=0):
+        if failed or (self.latency is not None and latency > self.latency):
+            self._limit = self._clamp(self._limit * self.backoff)
+        elif inflight * 2 >= self._limit:
+            # Only grow if the current limit is actually being used
+            self._limit = self._clamp(
+                self._limit + self.increase / self._limit)
+        return self.limit
+
+
+class GradientLimiter(Limiter):
+    """
+    Latency gradient based concurrency limiter.
+
+    Compares the short-term latency against the long-term latency baseline:
+    the limit is decreased as soon as the latency grows over the baseline
+    with the given ``tolerance``, and otherwise grows by a queue of
+    ``sqrt(limit)`` slots. Failed tasks are considered an overload signal.
+
+    Arguments:
+        limit (int): initial concurrency limit. Defaults to ``10``.
+        min_limit (int): minimum concurrency limit. Defaults to ``1``.
+        max_limit (int): maximum concurrency limit. Defaults to ``1000``.
+        tolerance (float): tolerated latency increase ratio over the
+            baseline. Defaults to ``1.5``.
+        smoothing (float): limit change smoothing factor. Defaults to ``0.2``.
+        window (int): long-term latency average window size in samples.
+            Defaults to ``600``.
+
+    Raises:
+        ValueError: if the limits or ratios are not valid.
+
+    Usage::
+
+        pool = paco.ConcurrentExecutor(limiter=paco.GradientLimiter())
+    """
+
+    def __init__(self, limit=10, min_limit=1, max_limit=1000,
+                 tolerance=1.5, smoothing=0.2, window=600):
+        super().__init__(limit=limit, min_limit=min_limit,
+                         max_limit=max_limit)
+
+        if tolerance < 1 or not 0 < smoothing <= 1 or window < 1:
+            raise ValueError('paco: invalid gradient limiter ratios')
+
+        self.tolerance = tolerance
+        self.smoothing = smoothing
+        self.window = window
+        self._long_latency = None
+        self._short_latency = None
+
+    def update(self, latency, failed=False, inflight=0):
+        # Initialize latency averages with the first sample
+        if self._long_latency is None:
+            self._long_latency = self._short_latency = latency
+
+        # Exponential moving averages for short and long term latencies
+        self._short_latency += (latency - self._short_latency) * 0.5
+        self._long_latency += (latency - self._long_latency) / self.window
+
+        # Do not grow the limit if it is not being used
+        if not failed and inflight * 2 < self._limit:
+            return self.limit
+
+        if failed:
+            limit = self._limit * 0.5
+        else:
+            gradient = max(0.5, min(1.0, self.tolerance * (
+                self._long_latency / max(self._short_latency, 1e-9))))
+            limit = self._limit * gradient
+
+            # Grow by a queue of slots if latency is within tolerance
+            if gradient == 1.0:
+                limit += math.sqrt(self._limit)
+
+        self._limit = self._clamp(
+            self._limit * (1 - self.smoothing) + limit * self.smoothing)
+        return self.limit
@@ -1,13 +1,13 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .each import each
 from .decorator import overload
 
 
 @overload
-@asyncio.coroutine
-def map(coro, iterable, limit=0, loop=None, timeout=None,
-        return_exceptions=False, *args, **kw):
+async def map(coro, iterable, limit=0, loop=None, timeout=None,
+              return_exceptions=False, *args, executor=None, key=None,
+              key_limit=1, key_backlog=1000, task_timeout=None, tracer=None,
+              eager=False, rate=None, burst=1, **kw):
     """
     Concurrently maps values yielded from an iterable, passing then
     into an asynchronous coroutine function.
@@ -35,6 +35,40 @@ def map(coro, iterable, limit=0, loop=None, timeout=None,
             float. If timeout is not specified or None, there is no limit to
             the wait time.
         return_exceptions (bool): returns exceptions as valid results.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run ``coro`` if it is a blocking function instead of a
+            coroutine function. Use ``True`` for the loop default thread pool
+            executor. Concurrency is still bounded by ``limit``.
+            For CPU-bound functions, use a ``paco.ProcessPool`` or
+            ``process`` for the shared default process pool: items are
+            dispatched to worker processes in chunks and ``limit`` is
+            bounded by the number of worker processes instead.
+            Use a ``paco.ShardedExecutor`` to spread the coroutines over
+            several event loop threads, where ``limit`` is the global limit
+            and defaults to the executor limit. Options not supported by
+            the process and sharded executors raise ``ValueError``.
+        key (function): optional function that returns the concurrency key
+            of every iterable value. Coroutines with the same key are limited
+            to ``key_limit`` concurrent executions, e.g: per host limit.
+            Not supported by process pools and sharded executors.
+        key_limit (int): concurrency limit per key. Defaults to ``1``.
+        key_backlog (int): max number of values read ahead while their
+            concurrency key is saturated. Defaults to ``1000``.
+        task_timeout (int|float): optional max number of seconds every
+            coroutine can run before it is cancelled and fails with
+            ``asyncio.TimeoutError``. Not supported by process pools.
+        tracer (paco.Tracer): optional tracer used to record a span per
+            coroutine call. Not supported by process pools and sharded
+            executors.
+        eager (bool): starts the coroutines eagerly, creating a task only
+            if they suspend. Useful when most of the coroutines finish
+            without suspending, e.g: cache hits. Only used in Python
+            3.12+. Ignored by process pools. Defaults to ``False``.
+        rate (int|float): optional max number of coroutines started per
+            second, on top of ``limit``, e.g: API requests per second quota.
+            Not supported by process pools and sharded executors.
+        burst (int): max number of coroutines that can be started at once
+            within the ``rate`` limit. Defaults to ``1``.
         *args (mixed): optional variadic arguments to be passed to the
             coroutine map function.
 
@@ -51,8 +85,10 @@ def map(coro, iterable, limit=0, loop=None, timeout=None,
 
     """
     # Call each iterable but collecting yielded values
-    return (yield from each(coro, iterable,
-                            limit=limit, loop=loop,
-                            timeout=timeout, collect=True,
-                            return_exceptions=return_exceptions,
-                            *args, **kw))
+    return await each(coro, iterable, limit, loop, True, timeout,
+                      return_exceptions, *args,
+                      executor=executor, key=key,
+                      key_limit=key_limit, key_backlog=key_backlog,
+                      task_timeout=task_timeout,
+                      tracer=tracer, eager=eager, rate=rate, burst=burst,
+                      **kw)
@@ -0,0 +1,275 @@
+# -*- coding: utf-8 -*-
+
+# Exported latency percentiles
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+class Histogram(object):
+    """
+    Fixed memory log-linear histogram of latency values, similar to
+    HDR histograms.
+
+    Values are counted in buckets of exponentially growing width, each one
+    split in ``sub_buckets`` linear sub-buckets, so the relative error
+    of the reported values is bounded by ``2 / sub_buckets`` regardless
+    of the value magnitude.
+
+    Values larger than ``max_value`` are counted in the last bucket.
+
+    Arguments:
+        max_value (int|float): max trackable value in seconds.
+            Defaults to ``3600``.
+        resolution (float): min trackable value in seconds.
+            Defaults to ``1e-6``.
+        sub_buckets (int): linear sub-buckets per bucket, rounded up to
+            a power of two. Defaults to ``128``.
+
+    Usage::
+
+        histogram = Histogram()
+        histogram.record(0.25)
+        histogram.percentile(99)
+        # => 0.25
+    """
+
+    def __init__(self, max_value=3600, resolution=1e-6, sub_buckets=128):
+        if max_value <= resolution or resolution <= 0:
+            raise ValueError('paco: invalid histogram range')
+
+        self.resolution = resolution
+        self._sub_bits = max(int(sub_buckets - 1).bit_length(), 1)
+        self._sub_count = 1 << self._sub_bits
+        self._half_count = self._sub_count >> 1
+        self._max_units = int(max_value / resolution)
+        self._counts = [0] * (self._index(self._max_units) + 1)
+        self.reset()
+
+    def reset(self):
+        """
+        Removes all the recorded values.
+        """
+        for index in range(len(self._counts)):
+            self._counts[index] = 0
+        self.count = 0
+        self.sum = 0.0
+        self.min = None
+        self.max = None
+
+    def _index(self, units):
+        shift = max(units.bit_length() - self._sub_bits, 0)
+        if not shift:
+            return units
+        return (self._sub_count + (shift - 1) * self._half_count +
+                (units >> shift) - self._half_count)
+
+    def _value(self, index):
+        # Returns the middle value of the given bucket index
+        if index < self._sub_count:
+            return index * self.resolution
+
+        shift = (index - self._sub_count) // self._half_count + 1
+        sub = (index - self._sub_count) % self._half_count + self._half_count
+        return ((sub << shift) + (1 << (shift - 1))) * self.resolution
+
+    def record(self, value):
+        """
+        Records a new value.
+
+        Arguments:
+            value (int|float): value in seconds.
+        """
+        units = min(max(int(value / self.resolution), 0), self._max_units)
+        self._counts[self._index(units)] += 1
+        self.count += 1
+        self.sum += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    @property
+    def mean(self):
+        """
+        Returns the mean of the recorded values.
+
+        Returns:
+            float
+        """
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, percentile):
+        """
+        Returns the value at the given percentile.
+
+        Arguments:
+            percentile (int|float): percentile between ``0`` and ``100``.
+
+        Returns:
+            float
+        """
+        if not self.count:
+            return 0.0
+
+        rank = max(self.count * percentile / 100.0, 1)
+        if rank >= self.count:
+            return self.max
+
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                # Reported values never exceed the recorded range
+                return min(max(self._value(index), self.min), self.max)
+
+        return self.max
+
+    def snapshot(self):
+        """
+        Returns a summary of the recorded values.
+
+        Returns:
+            dict: count, sum, min, max, mean and percentiles.
+        """
+        summary = {
+            'count': self.count,
+            'sum': self.sum,
+            'min': self.min or 0.0,
+            'max': self.max or 0.0,
+            'mean': self.mean,
+        }
+        for percentile in PERCENTILES:
+            summary['p{:g}'.format(percentile)] = self.percentile(percentile)
+        return summary
+
+
+class Metrics(object):
+    """
+    Executor metrics registry, tracking the tasks queue depth, in-flight
+    tasks, outcomes counters and latency histograms for both the time
+    waiting for a free slot and the execution time.
+
+    Metrics instances can be passed to a ``paco.ConcurrentExecutor``
+    via ``metrics`` param, and shared across executors.
+
+    Task records are updated by the executor. Lazily fed tasks are only
+    created once there is a free slot, so their wait time only covers
+    the concurrency key and weight admission.
+
+    Usage::
+
+        metrics = paco.Metrics()
+        pool = paco.ConcurrentExecutor(limit=10, metrics=metrics)
+        ...
+        metrics.snapshot()
+        # => {'queued': 0, 'in_flight': 10, 'completed': 240, ...}
+        print(metrics.export())
+    """
+
+    def __init__(self):
+        self.wait_time = Histogram()
+        self.exec_time = Histogram()
+        self.reset()
+
+    def reset(self):
+        """
+        Resets the counters and histograms.
+        """
+        self.queued = 0
+        self.in_flight = 0
+        self.completed = 0
+        self.failed = 0
+        self.cancelled = 0
+        self.wait_time.reset()
+        self.exec_time.reset()
+
+    def enqueue(self):
+        """
+        Records a new queued task.
+        """
+        self.queued += 1
+
+    def start(self, wait):
+        """
+        Records a started task.
+
+        Arguments:
+            wait (float): seconds the task waited in the queue.
+        """
+        self.queued -= 1
+        self.in_flight += 1
+        self.wait_time.record(wait)
+
+    def finish(self, latency, status='completed'):
+        """
+        Records a finished task.
+
+        Arguments:
+            latency (float): task execution time in seconds.
+            status (str): task outcome: ``completed``, ``failed``
+                or ``cancelled``.
+        """
+        self.in_flight -= 1
+        setattr(self, status, getattr(self, status) + 1)
+        self.exec_time.record(latency)
+
+    def drop(self, count=1):
+        """
+        Records queued tasks discarded without being started.
+
+        Arguments:
+            count (int): number of discarded tasks.
+        """
+        self.queued -= count
+        self.cancelled += count
+
+    def snapshot(self):
+        """
+        Returns a snapshot of the current metrics.
+
+        Returns:
+            dict
+        """
+        return {
+            'queued': self.queued,
+            'in_flight': self.in_flight,
+            'completed': self.completed,
+            'failed': self.failed,
+            'cancelled': self.cancelled,
+            'wait_time': self.wait_time.snapshot(),
+            'exec_time': self.exec_time.snapshot(),
+        }
+
+    def export(self, prefix='paco_executor'):
+        """
+        Exports the current metrics in Prometheus text format.
+
+        Arguments:
+            prefix (str): metrics names prefix.
+                Defaults to ``paco_executor``.
+
+        Returns:
+            str
+        """
+        lines = []
+
+        def metric(name, kind, value):
+            lines.append('# TYPE {}_{} {}'.format(prefix, name, kind))
+            lines.append('{}_{} {}'.format(prefix, name, value))
+
+        metric('queued', 'gauge', self.queued)
+        metric('in_flight', 'gauge', self.in_flight)
+        for name in ('completed', 'failed', 'cancelled'):
+            metric('{}_total'.format(name), 'counter', getattr(self, name))
+
+        for name, histogram in (('wait_seconds', self.wait_time),
+                                ('exec_seconds', self.exec_time)):
+            name = '{}_{}'.format(prefix, name)
+            lines.append('# TYPE {} summary'.format(name))
+            for percentile in PERCENTILES:
+                lines.append('{}{{quantile="{:g}"}} {:.6f}'.format(
+                    name, percentile / 100.0,
+                    histogram.percentile(percentile)))
+            lines.append('{}_sum {:.6f}'.format(name, histogram.sum))
+            lines.append('{}_count {}'.format(name, histogram.count))
+
+        return '\n'.join(lines) + '\n'
@@ -1,13 +1,5 @@
 # -*- coding: utf-8 -*-
 import asyncio
-from inspect import isfunction
-
-
-def coroutine_wrapper(fn):
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
-        return fn(*args, **kw)
-    return wrapper
 
 
 class Observer(object):
@@ -30,7 +22,7 @@ class Observer(object):
             TypeError: if fn argument is not valid
         """
         iscoroutine = asyncio.iscoroutinefunction(fn)
-        if not iscoroutine and not isfunction(fn):
+        if not iscoroutine and not callable(fn):
             raise TypeError('paco: fn param must be a callable '
                             'object or coroutine function')
 
@@ -39,18 +31,21 @@ class Observer(object):
             observers = self._pool[event] = []
 
         # Register the observer
-        observers.append(fn if iscoroutine else coroutine_wrapper(fn))
+        observers.append(fn)
 
-    def remove(self, event=None):
+    def remove(self, event=None, fn=None):
         """
-        Remove all the registered observers for the given event name.
+        Remove all the registered observers for the given event name,
+        or only the given observer function.
 
         Arguments:
             event (str): event name to remove.
+            fn (function): optional observer function to remove.
         """
         observers = self._pool.get(event)
         if observers:
-            self._pool[event] = []
+            self._pool[event] = [] if fn is None else [
+                observer for observer in observers if observer is not fn]
 
     def clear(self):
         """
@@ -62,19 +57,60 @@ class Observer(object):
     on = observe
     off = remove
 
-    @asyncio.coroutine
-    def trigger(self, event, *args, **kw):
+    def compile(self, event):
+        """
+        Compiles the current observers of the given event name into a single
+        dispatcher function, intended to be used in hot code paths.
+
+        The dispatcher calls synchronous observers directly and returns
+        a coroutine to wait for only if there are coroutine observers,
+        otherwise returns ``None``.
+
+        Observers registered after compilation are not dispatched.
+
+        Arguments:
+            event (str): event name to compile.
+
+        Returns:
+            function: event dispatcher or ``None`` if there are no observers.
+        """
+        observers = self._pool.get(event)
+
+        # If no observers registered for the event, there is nothing to call
+        if not observers:
+            return None
+
+        observers = tuple((fn, asyncio.iscoroutinefunction(fn))
+                          for fn in observers)
+
+        # Synchronous observers only: no coroutine required
+        if not any(iscoroutine for _, iscoroutine in observers):
+            def dispatcher(*args, **kw):
+                for fn, _ in observers:
+                    fn(*args, **kw)
+            return dispatcher
+
+        # Trigger observers in FIFO sequentially
+        async def coro_dispatcher(*args, **kw):
+            for fn, iscoroutine in observers:
+                if iscoroutine:
+                    await fn(*args, **kw)
+                else:
+                    fn(*args, **kw)
+
+        return coro_dispatcher
+
+    async def trigger(self, event, *args, **kw):
         """
         Triggers event observers for the given event name,
         passing custom variadic arguments.
         """
-        observers = self._pool.get(event)
+        dispatcher = self.compile(event)
 
         # If no observers registered for the event, do no-op
-        if not observers or len(observers) == 0:
+        if dispatcher is None:
             return None
 
-        # Trigger observers coroutines in FIFO sequentially
-        for fn in observers:
-            # Review: perhaps this should not wait
-            yield from fn(*args, **kw)
+        waiter = dispatcher(*args, **kw)
+        if waiter:
+            await waiter
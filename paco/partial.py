@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .decorator import decorate
 from .assertions import assert_corofunction
 
@@ -34,10 +33,9 @@ def partial(coro, *args, **kw):
     """
     assert_corofunction(coro=coro)
 
-    @asyncio.coroutine
-    def wrapper(*_args, **_kw):
+    async def wrapper(*_args, **_kw):
         call_args = args + _args
         kw.update(_kw)
-        return (yield from coro(*call_args, **kw))
+        return await coro(*call_args, **kw)
 
     return wrapper
@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 import asyncio
 import functools
-from inspect import isfunction, getargspec
+from inspect import isfunction, getfullargspec
 from .generator import consume
 from .assertions import isiter
 
@@ -18,13 +18,11 @@ class PipeOverloader(object):
         self.__args = args
         self.__kw = kw
 
-    @asyncio.coroutine
-    def __await_coro(self, coro):
-        return (yield from self.__trigger((yield from coro)))
+    async def __await_coro(self, coro):
+        return await self.__trigger(await coro)
 
-    @asyncio.coroutine
-    def __consume_generator(self, iterable):
-        return (yield from self.__trigger((yield from consume(iterable))))
+    async def __consume_generator(self, iterable):
+        return await self.__trigger(await consume(iterable))
 
     def __trigger(self, iterable):
         if not isiter(iterable):
@@ -92,7 +90,7 @@ def overload(fn):
     if not isfunction(fn):
         raise TypeError('paco: fn must be a callable object')
 
-    spec = getargspec(fn)
+    spec = getfullargspec(fn)
     args = spec.args
     if not spec.varargs and (len(args) < 2 or args[1] != 'iterable'):
         raise ValueError('paco: invalid function signature or arity')
@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+import os
+import asyncio
+import threading
+import concurrent.futures
+
+
+class Portal(object):
+    """
+    Portal owns a persistent event loop running in a daemon thread,
+    allowing synchronous code, such as web framework views or task
+    queue workers, to run coroutines without creating and tearing down
+    an event loop per call, like ``paco.run()`` does.
+
+    Since the loop is reused across calls, loop bound resources, such as
+    connection pools or executors, can be kept warm between calls.
+
+    The loop thread is started on first use, and restarted if the process
+    was forked since then, until the portal is closed.
+
+    Arguments:
+        name (str): loop thread name. Defaults to ``paco-portal``.
+
+    Usage::
+
+        portal = paco.Portal()
+
+        def view(request):
+            return portal.run(fetch(request.GET['url']), timeout=10)
+
+        def task(urls):
+            return portal.map(fetch, urls, limit=10)
+    """
+
+    def __init__(self, name='paco-portal'):
+        self.name = name
+        self.loop = None
+        self._thread = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """
+        Starts the portal event loop thread, if not started yet.
+
+        Returns:
+            asyncio.AbstractEventLoop: portal event loop.
+        """
+        with self._lock:
+            # Threads do not survive a fork: start a new loop
+            if self.loop is not None and self._pid == os.getpid():
+                return self.loop
+
+            loop = asyncio.new_event_loop()
+            ready = threading.Event()
+            thread = threading.Thread(target=self._run_loop,
+                                      args=(loop, ready),
+                                      name=self.name, daemon=True)
+            thread.start()
+            ready.wait()
+
+            self.loop = loop
+            self._thread = thread
+            self._pid = os.getpid()
+            return loop
+
+    def _run_loop(self, loop, ready):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(ready.set)
+        try:
+            loop.run_forever()
+        finally:
+            # Cancel and reap the coroutines left, as asyncio.run() does
+            tasks = asyncio.all_tasks(loop)
+            for task in tasks:
+                task.cancel()
+            if tasks:
+                loop.run_until_complete(
+                    asyncio.gather(*tasks, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+            loop.close()
+
+    def close(self):
+        """
+        Stops the portal event loop, cancelling the running coroutines,
+        and waits until the loop thread is finished.
+        """
+        with self._lock:
+            if self.loop is None or self._pid != os.getpid():
+                self.loop = self._thread = None
+                return None
+
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self._thread.join()
+            self.loop = self._thread = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def submit(self, coro, *args, **kw):
+        """
+        Schedules the given coroutine in the portal event loop, without
+        waiting for it.
+
+        Arguments:
+            coro (coroutine|coroutinefunction): coroutine object or
+                coroutine function to call with the given arguments.
+            *args (mixed): optional variadic arguments to pass to ``coro``.
+
+        Raises:
+            TypeError: if coro is not a coroutine.
+            RuntimeError: if called from the portal event loop thread.
+
+        Returns:
+            concurrent.futures.Future: future resolved with the coroutine
+                result.
+        """
+        if asyncio.iscoroutinefunction(coro):
+            coro = coro(*args, **kw)
+        if not asyncio.iscoroutine(coro):
+            raise TypeError('paco: coro must be a coroutine')
+
+        loop = self.start()
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError('paco: portal cannot be called '
+                               'from its own event loop thread')
+
+        return asyncio.run_coroutine_threadsafe(coro, loop)
+
+    def run(self, coro, *args, timeout=None, **kw):
+        """
+        Runs the given coroutine in the portal event loop, blocking the
+        current thread until it is finished.
+
+        Arguments:
+            coro (coroutine|coroutinefunction): coroutine object or
+                coroutine function to call with the given arguments.
+            *args (mixed): optional variadic arguments to pass to ``coro``.
+            timeout (int|float): optional maximum number of seconds to wait.
+                Once exceeded, the coroutine is cancelled.
+
+        Raises:
+            TypeError: if coro is not a coroutine.
+            RuntimeError: if called from the portal event loop thread.
+            asyncio.TimeoutError: if the timeout is exceeded.
+
+        Returns:
+            mixed: value returned by the coroutine.
+        """
+        future = self.submit(coro, *args, **kw)
+        try:
+            return future.result(timeout)
+        except concurrent.futures.TimeoutError:
+            # Coroutine timeout errors are raised as is
+            if future.done():
+                raise
+            future.cancel()
+            raise asyncio.TimeoutError('paco: portal timeout exceeded')
+        except BaseException:
+            # E.g: KeyboardInterrupt, do not leave the coroutine behind
+            future.cancel()
+            raise
+
+    def map(self, coro, iterable, **kw):
+        """
+        Runs ``paco.map()`` in the portal event loop, blocking the current
+        thread until it is finished.
+
+        Arguments:
+            coro (coroutinefunction): coroutine function to call with
+                every item.
+            iterable (iterable): items to map.
+            **kw (mixed): ``paco.map()`` keyword arguments, such as
+                ``limit`` or ``timeout``.
+
+        Returns:
+            list: ordered list of results.
+        """
+        # Imported here, since map() relies on portals via sharded executors
+        from .map import map
+        return self.run(map(coro, iterable, **kw))
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+import heapq
+import itertools
+
+
+class PriorityQueue(object):
+    """
+    Heap-based tasks queue that pops items by priority order, exposing
+    a ``collections.deque`` compatible interface.
+
+    Lower values have higher priority. Items with the same priority
+    are popped in insertion order.
+
+    This class is intended to be used internally.
+    """
+
+    def __init__(self):
+        self._heap = []
+        self._counter = itertools.count()
+
+    def __len__(self):
+        return len(self._heap)
+
+    def __iter__(self):
+        return (item for _, _, item in sorted(self._heap))
+
+    def append(self, item, priority=0):
+        """
+        Pushes a new item into the queue.
+
+        Arguments:
+            item (mixed): item to push.
+            priority (int|float): item priority. Defaults to ``0``.
+        """
+        heapq.heappush(self._heap, (priority, next(self._counter), item))
+
+    def popleft(self):
+        """
+        Pops the item with the highest priority.
+
+        Raises:
+            IndexError: if the queue is empty.
+
+        Returns:
+            mixed: popped item.
+        """
+        if not self._heap:
+            raise IndexError('pop from an empty priority queue')
+        return heapq.heappop(self._heap)[2]
+
+    def clear(self):
+        """
+        Removes all the items in the queue.
+        """
+        self._heap = []
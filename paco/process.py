@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+import os
+import time
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from .assertions import assert_iter
+
+
+def run_chunk(fn, chunk, args=(), kw=None, return_exceptions=False):
+    """
+    Executes the given function with every item of the chunk, measuring the
+    chunk execution time. This function runs in the worker processes and
+    is intended to be used internally.
+    """
+    start = time.perf_counter()
+    results = []
+
+    for item in chunk:
+        try:
+            results.append(fn(item, *args, **(kw or {})))
+        except Exception as err:
+            if not return_exceptions:
+                raise err
+            results.append(err)
+
+    return results, time.perf_counter() - start
+
+
+class ProcessPool(object):
+    """
+    Process pool backend for CPU-bound functions, dispatching items to the
+    worker processes in chunks to amortize the inter-process communication
+    cost per item.
+
+    Unless a fixed ``chunksize`` is given, chunk sizes are auto-tuned based
+    on the measured execution cost per item, so every chunk takes around
+    ``target`` seconds to run.
+
+    Worker processes are created on first use and reused across calls
+    until the pool is shut down.
+
+    This pool can be used as ``executor`` in ``paco.map()`` and
+    ``paco.each()``. Functions and items must be picklable.
+
+    Arguments:
+        workers (int): number of worker processes.
+            Defaults to ``os.cpu_count()``.
+        chunksize (int): optional fixed number of items per chunk.
+        target (float): target chunk execution time in seconds used for
+            chunk size auto-tuning. Defaults to ``0.05``.
+        mp_context (multiprocessing.context.BaseContext|str): optional
+            multiprocessing context, or start method name, used to start
+            the worker processes. Defaults to ``forkserver`` if available,
+            otherwise ``spawn``, since forking a process with threads
+            alive, e.g: portals or shard event loops, may deadlock.
+
+    Usage::
+
+        def fib(n):
+            return n if n < 2 else fib(n - 1) + fib(n - 2)
+
+        pool = paco.ProcessPool(workers=4)
+        await paco.map(fib, range(30), executor=pool)
+        # => [0, 1, 1, 2, 3, 5, 8, ...]
+    """
+
+    # Shared process pool used by default
+    _default = None
+
+    def __init__(self, workers=None, chunksize=None, target=0.05,
+                 mp_context=None):
+        self.workers = max(int(workers or os.cpu_count() or 1), 1)
+        self.chunksize = chunksize
+        self.target = target
+        self.mp_context = mp_context
+        self._executor = None
+        # Measured execution cost per item, by function
+        self._costs = {}
+
+    @classmethod
+    def default(cls):
+        """
+        Returns the shared default process pool.
+
+        Returns:
+            ProcessPool
+        """
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    @property
+    def executor(self):
+        """
+        Returns the underlying process pool executor, creating it if needed.
+
+        Returns:
+            concurrent.futures.ProcessPoolExecutor
+        """
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=self._context())
+        return self._executor
+
+    def _context(self):
+        context = self.mp_context
+        if context is None:
+            methods = multiprocessing.get_all_start_methods()
+            context = 'forkserver' if 'forkserver' in methods else 'spawn'
+        if isinstance(context, str):
+            context = multiprocessing.get_context(context)
+        return context
+
+    def shutdown(self, wait=True):
+        """
+        Shuts down the worker processes.
+
+        Arguments:
+            wait (bool): wait until the pending chunks are executed.
+        """
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait)
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.shutdown()
+
+    def _chunk_size(self, fn, remaining):
+        if self.chunksize:
+            return max(int(self.chunksize), 1)
+
+        # Start with single item chunks until the cost is measured
+        cost = self._costs.get(fn)
+        if cost is None:
+            return 1
+
+        size = int(self.target / max(cost, 1e-9))
+        # Keep all the worker processes busy
+        size = min(size, -(-remaining // self.workers))
+        return max(size, 1)
+
+    def _measure(self, fn, size, elapsed):
+        cost = elapsed / size
+        previous = self._costs.get(fn)
+        self._costs[fn] = cost if previous is None else (
+            previous + (cost - previous) * 0.5)
+
+    async def map(self, fn, iterable, *args, loop=None, timeout=None,
+                  return_exceptions=False, **kw):
+        """
+        Concurrently maps the items of the iterable through the given
+        function in the worker processes, returning ordered results.
+
+        This method is a coroutine.
+
+        Arguments:
+            fn (function): picklable function to call with every item.
+            iterable (iterable): items to map.
+            *args (mixed): optional variadic arguments to pass to ``fn``.
+            loop (asyncio.BaseEventLoop): optional event loop to use.
+            timeout (int|float): optional maximum number of seconds to wait.
+                Results of the chunks not finished in time are ``None``.
+            return_exceptions (bool): returns exceptions as valid results.
+
+        Raises:
+            TypeError: if fn is a coroutine function or not callable.
+
+        Returns:
+            list: ordered list of results.
+        """
+        if not callable(fn) or asyncio.iscoroutinefunction(fn):
+            raise TypeError('paco: process pool fn must be a function')
+        assert_iter(iterable=iterable)
+
+        loop = loop or asyncio.get_event_loop()
+        items = list(iterable)
+        results = [None] * len(items)
+        deadline = None if timeout is None else loop.time() + timeout
+
+        offset = 0
+        chunks = {}
+
+        try:
+            while offset < len(items) or chunks:
+                # Keep two chunks per worker in flight
+                while offset < len(items) and len(chunks) < self.workers * 2:
+                    size = self._chunk_size(fn, len(items) - offset)
+                    future = loop.run_in_executor(
+                        self.executor, run_chunk, fn,
+                        items[offset:offset + size], args, kw,
+                        return_exceptions)
+                    chunks[future] = offset
+                    offset += size
+
+                remaining = (None if deadline is None
+                             else max(deadline - loop.time(), 0))
+                done, _ = await asyncio.wait(
+                    chunks, timeout=remaining,
+                    return_when=asyncio.FIRST_COMPLETED)
+
+                # Timeout exceeded
+                if not done:
+                    break
+
+                for future in done:
+                    start = chunks.pop(future)
+                    values, elapsed = future.result()
+                    results[start:start + len(values)] = values
+                    self._measure(fn, len(values), elapsed)
+        finally:
+            for future in chunks:
+                future.cancel()
+
+        return results
@@ -1,15 +1,10 @@
 # -*- coding: utf-8 -*-
 import asyncio
+from asyncio import ensure_future
 from .assertions import assert_iter
 
-try:
-    from asyncio import ensure_future
-except ImportError:
-    ensure_future = getattr(asyncio, 'async')
 
-
-@asyncio.coroutine
-def race(iterable, loop=None, timeout=None, *args, **kw):
+async def race(iterable, loop=None, timeout=None, *args, **kw):
     """
     Runs coroutines from a given iterable concurrently without waiting until
     the previous one has completed.
@@ -65,12 +60,11 @@ def race(iterable, loop=None, timeout=None, *args, **kw):
     result = None
 
     # Resolve first yielded data from coroutine and stop pending ones
-    @asyncio.coroutine
-    def resolver(index, coro):
+    async def resolver(index, coro):
         nonlocal result
         nonlocal resolved
 
-        value = yield from coro
+        value = await coro
         if not resolved:
             resolved = True
 
@@ -98,6 +92,6 @@ def race(iterable, loop=None, timeout=None, *args, **kw):
         coros.append(ensure_future(resolver(index, coro)))
 
     # Run coroutines concurrently
-    yield from asyncio.wait(coros, timeout=timeout, loop=loop)
+    await asyncio.wait(coros, timeout=timeout)
 
     return result
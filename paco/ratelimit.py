@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+import time
+
+
+class TokenBucket(object):
+    """
+    Token bucket rate limiter: tokens are refilled at ``rate`` tokens
+    per second, up to ``burst`` tokens, and every started task consumes
+    one token.
+
+    Tokens are lazily refilled based on the elapsed time when checked,
+    so there is no periodic refill timer.
+
+    This class is intended to be used internally.
+
+    Arguments:
+        rate (int|float): tokens refilled per second.
+        burst (int): max number of tokens, i.e. tasks that can be started
+            at once. Defaults to ``1``.
+        clock (function): monotonic clock function.
+            Defaults to ``time.monotonic``.
+
+    Raises:
+        ValueError: if rate or burst are not positive.
+    """
+
+    __slots__ = ('rate', 'burst', 'tokens', 'updated', '_clock')
+
+    def __init__(self, rate, burst=1, clock=time.monotonic):
+        if rate <= 0:
+            raise ValueError('paco: rate must be positive')
+        if burst < 1:
+            raise ValueError('paco: burst must be at least 1')
+
+        self.rate = float(rate)
+        self.burst = burst
+        self.tokens = float(burst)
+        self._clock = clock
+        self.updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.tokens + (now - self.updated) * self.rate,
+                          self.burst)
+        self.updated = now
+
+    def ready(self):
+        """
+        Checks if there is a token available.
+
+        Returns:
+            bool
+        """
+        self._refill()
+        return self.tokens >= 1
+
+    def consume(self):
+        """
+        Consumes a token.
+        """
+        self.tokens -= 1
+
+    def delay(self):
+        """
+        Returns the seconds to wait until the next token is available.
+
+        Returns:
+            float
+        """
+        return max((1 - self.tokens) / self.rate, 0)
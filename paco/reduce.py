@@ -1,13 +1,12 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .decorator import overload
 from .concurrent import ConcurrentExecutor
 from .assertions import assert_corofunction, assert_iter
 
 
 @overload
-@asyncio.coroutine
-def reduce(coro, iterable, initializer=None, limit=1, right=False, loop=None):
+async def reduce(coro, iterable, initializer=None, limit=1, right=False,
+                 loop=None):
     """
     Apply function of two arguments cumulatively to the items of sequence,
     from left to right, so as to reduce the sequence to a single value.
@@ -60,24 +59,20 @@ def reduce(coro, iterable, initializer=None, limit=1, right=False, loop=None):
     # Create concurrent executor
     pool = ConcurrentExecutor(limit=limit, loop=loop)
 
-    # Reducer partial function for deferred coroutine execution
-    def reducer(element):
-        @asyncio.coroutine
-        def wrapper():
-            nonlocal acc
-            acc = yield from coro(acc, element)
-        return wrapper
+    # Reducer coroutine for deferred execution
+    async def reducer(element):
+        nonlocal acc
+        acc = await coro(acc, element)
 
     # Support right reduction
     if right:
         iterable.reverse()
 
-    # Iterate and attach coroutine for defer scheduling
-    for element in iterable:
-        pool.add(reducer(element))
+    # Lazily attach elements for deferred scheduling
+    pool.feed(reducer, iterable)
 
     # Wait until all coroutines finish
-    yield from pool.run(ignore_empty=True)
+    await pool.run(ignore_empty=True, retain_done=False)
 
     # Returns final reduced value
     return acc
@@ -1,11 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .assertions import assert_corofunction
 from .map import map
 
 
-@asyncio.coroutine
-def repeat(coro, times=1, step=1, limit=1, loop=None):
+async def repeat(coro, times=1, step=1, limit=1, loop=None):
     """
     Executes the coroutine function ``x`` number of  times,
     and accumulates results in order as you would use with ``map``.
@@ -43,4 +41,4 @@ def repeat(coro, times=1, step=1, limit=1, loop=None):
     iterable = range(1, times + 1, step)
 
     # Run iterable times
-    return (yield from map(coro, iterable, limit=limit, loop=loop))
+    return await map(coro, iterable, limit=limit, loop=loop)
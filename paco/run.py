@@ -5,6 +5,11 @@ def run(coro, loop=None):
     """
     Convenient shortcut alias to ``loop.run_until_complete``.
 
+    Synchronous code running coroutines repeatedly, such as web framework
+    views or task queue workers, should use a ``paco.Portal`` instead,
+    which keeps a single event loop running in a background thread, so
+    connection pools and executors stay warm across calls.
+
     Arguments:
         coro (coroutine): coroutine object to schedule.
         loop (asyncio.BaseEventLoop): optional event loop to use.
@@ -1,11 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .gather import gather
 
 
-@asyncio.coroutine
-def series(*coros_or_futures, timeout=None,
-           loop=None, return_exceptions=False):
+async def series(*coros_or_futures, timeout=None,
+                 loop=None, return_exceptions=False):
     """
     Run the given coroutine functions in series, each one
     running once the previous execution has completed.
@@ -63,6 +61,6 @@ def series(*coros_or_futures, timeout=None,
         # => [3, 5, 7]
 
     """
-    return (yield from gather(*coros_or_futures,
-                              loop=loop, limit=1, timeout=timeout,
-                              return_exceptions=return_exceptions))
+    return await gather(*coros_or_futures,
+                        loop=loop, limit=1, timeout=timeout,
+                        return_exceptions=return_exceptions)
@@ -0,0 +1,281 @@
+# -*- coding: utf-8 -*-
+import os
+import asyncio
+import threading
+from .portal import Portal
+from .concurrent import ConcurrentExecutor
+from .assertions import assert_corofunction, assert_iter
+
+
+class SharedIterator(object):
+    """
+    Thread-safe iterator shared by the shards, so idle shards pull the
+    next item. This class is intended to be used internally.
+    """
+
+    def __init__(self, iterable):
+        self._iterator = iter(iterable)
+        self._lock = threading.Lock()
+        self._stopped = False
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        with self._lock:
+            if self._stopped:
+                raise StopIteration
+            return next(self._iterator)
+
+    def stop(self):
+        """
+        Stops yielding items.
+        """
+        self._stopped = True
+
+
+class ShardedExecutor(object):
+    """
+    Sharded executor that runs ``shards`` event loops in as many threads,
+    spreading the coroutines over them, so CPU work done by the
+    coroutines, such as parsing, TLS or callbacks, is not bounded by
+    a single event loop.
+
+    Shards pull the items from a shared iterator as soon as they have a
+    free slot, and the global concurrency ``limit`` is split between
+    them. Results are collected in order back on the caller's event loop,
+    which is only woken up once per shard.
+
+    Coroutines run in the shard loops, so loop bound resources, such as
+    HTTP client sessions, must be created per shard.
+
+    Threads are started on first use and reused across calls until the
+    executor is closed. Scaling CPU work across shards requires a
+    free-threaded CPython build, otherwise the shards still share the GIL.
+
+    This executor can be used as ``executor`` in ``paco.map()`` and
+    ``paco.each()``.
+
+    Arguments:
+        shards (int): number of event loop threads.
+            Defaults to ``os.cpu_count()``.
+        limit (int): default global concurrency limit.
+            Use ``0`` for no limit. Defaults to ``0``.
+
+    Usage::
+
+        async def fetch(url):
+            async with aiohttp.ClientSession() as session:
+                async with session.get(url) as response:
+                    return parse(await response.text())
+
+        with paco.ShardedExecutor(shards=4, limit=100) as pool:
+            await pool.map(fetch, urls)
+            # or
+            await paco.map(fetch, urls, executor=pool)
+    """
+
+    def __init__(self, shards=None, limit=0):
+        self.shards = max(int(shards or os.cpu_count() or 1), 1)
+        self.limit = max(int(limit), 0)
+        self._portals = [Portal(name='paco-shard-{}'.format(index))
+                         for index in range(self.shards)]
+
+    @property
+    def loops(self):
+        """
+        Returns the shard event loops, starting them if needed.
+
+        Returns:
+            list[asyncio.AbstractEventLoop]
+        """
+        return [portal.start() for portal in self._portals]
+
+    def start(self):
+        """
+        Starts the shard event loop threads, if not started yet.
+        """
+        for portal in self._portals:
+            portal.start()
+
+    def close(self):
+        """
+        Stops the shard event loops, cancelling the running coroutines,
+        and waits until the threads are finished.
+        """
+        for portal in self._portals:
+            portal.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def _split(self, limit):
+        """
+        Splits the global concurrency limit between the shards.
+
+        Returns:
+            list[int]: concurrency limit per used shard.
+        """
+        if limit <= 0:
+            return [0] * self.shards
+        shards = min(self.shards, limit)
+        share, extra = divmod(limit, shards)
+        return [share + (index < extra) for index in range(shards)]
+
+    async def _run_shard(self, call, items, limit, eager=False):
+        """
+        Executes the given items in the current shard event loop.
+        """
+        # Coroutines are cancelled along with the shard task
+        async with ConcurrentExecutor(limit=limit, eager=eager) as pool:
+            pool.feed(call, items)
+
+    async def each(self, coro, iterable, *args, limit=None, timeout=None,
+                   task_timeout=None, eager=False, collect=False,
+                   return_exceptions=False, **kw):
+        """
+        Concurrently iterates the values of the iterable in the shard loops,
+        passing them to the given coroutine function.
+
+        This method is a coroutine.
+
+        Arguments:
+            coro (coroutinefunction): coroutine function to call with
+                every item.
+            iterable (iterable): items to iterate.
+            *args (mixed): optional variadic arguments to pass to ``coro``.
+            limit (int): global concurrency limit. Use ``0`` for no limit.
+                Defaults to the executor ``limit``.
+            timeout (int|float): optional maximum number of seconds to wait.
+                Results of the coroutines not finished in time are ``None``.
+            task_timeout (int|float): optional max number of seconds every
+                coroutine can run before it fails with
+                ``asyncio.TimeoutError``.
+            eager (bool): starts the coroutines eagerly in the shard loops.
+                Only used in Python 3.12+. Defaults to ``False``.
+            collect (bool): return the coroutines results. Defaults to
+                ``False``.
+            return_exceptions (bool): returns exceptions as valid results.
+
+        Raises:
+            TypeError: in case of invalid input arguments.
+
+        Returns:
+            list: ordered list of results, if ``collect`` is ``True``.
+        """
+        assert_corofunction(coro=coro)
+        assert_iter(iterable=iterable)
+
+        limit = self.limit if limit is None else max(int(limit), 0)
+        limits = self._split(limit)
+        errors = []
+
+        # Store ordered results. Unsized iterables, such as generators,
+        # are collected into a list growing as the items are consumed
+        results = None
+        if collect:
+            results = [None] * len(iterable) \
+                if hasattr(iterable, '__len__') else []
+        lock = threading.Lock()
+
+        items = enumerate(iterable)
+        if limit:
+            # Shards pull the next item once they have a free slot
+            sources = [SharedIterator(items)] * len(limits)
+        else:
+            # Unlimited shards would greedily pull all the items,
+            # so items are spread in round-robin instead
+            items = list(items)
+            sources = [SharedIterator(items[index::len(limits)])
+                       for index in range(len(limits))]
+
+        def stop():
+            for source in sources:
+                source.stop()
+
+        async def call(item):
+            index, value = item
+            try:
+                if task_timeout is None:
+                    result = await coro(value, *args, **kw)
+                else:
+                    result = await asyncio.wait_for(
+                        coro(value, *args, **kw), task_timeout)
+            except Exception as err:
+                if not return_exceptions:
+                    # Stop all the shards on the first error
+                    errors.append(err)
+                    stop()
+                    raise err
+                result = err
+            if results is not None:
+                # Results are stored from the shard threads
+                with lock:
+                    if index >= len(results):
+                        results.extend([None] * (index + 1 - len(results)))
+                    results[index] = result
+
+        # Results are gathered on the caller loop once per shard
+        futures = [
+            asyncio.wrap_future(asyncio.run_coroutine_threadsafe(
+                self._run_shard(call, source, shard_limit, eager), loop))
+            for loop, source, shard_limit in zip(self.loops, sources, limits)]
+
+        try:
+            done, pending = await asyncio.wait(
+                futures, timeout=timeout,
+                return_when=asyncio.FIRST_EXCEPTION)
+        finally:
+            # Stop the shards on error, timeout or cancellation
+            stop()
+            for future in futures:
+                future.cancel()
+
+        # Shard errors are reported via the errors list
+        for future in done:
+            if not future.cancelled():
+                future.exception()
+
+        if errors:
+            raise errors[0]
+
+        return results
+
+    async def map(self, coro, iterable, *args, limit=None, timeout=None,
+                  task_timeout=None, eager=False,
+                  return_exceptions=False, **kw):
+        """
+        Concurrently maps the values of the iterable through the given
+        coroutine function in the shard loops, returning ordered results.
+
+        This method is a coroutine.
+
+        Arguments:
+            coro (coroutinefunction): coroutine function to call with
+                every item.
+            iterable (iterable): items to map.
+            *args (mixed): optional variadic arguments to pass to ``coro``.
+            limit (int): global concurrency limit. Use ``0`` for no limit.
+                Defaults to the executor ``limit``.
+            timeout (int|float): optional maximum number of seconds to wait.
+                Results of the coroutines not finished in time are ``None``.
+            task_timeout (int|float): optional max number of seconds every
+                coroutine can run before it fails with
+                ``asyncio.TimeoutError``.
+            eager (bool): starts the coroutines eagerly in the shard loops.
+                Only used in Python 3.12+. Defaults to ``False``.
+            return_exceptions (bool): returns exceptions as valid results.
+
+        Raises:
+            TypeError: in case of invalid input arguments.
+
+        Returns:
+            list: ordered list of results.
+        """
+        return await self.each(coro, iterable, *args, limit=limit,
+                               timeout=timeout, task_timeout=task_timeout,
+                               eager=eager, collect=True,
+                               return_exceptions=return_exceptions, **kw)
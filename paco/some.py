@@ -1,14 +1,13 @@
 # -*- coding: utf-8 -*-
-import asyncio
-from .partial import partial
+from .wraps import wraps
 from .decorator import overload
 from .concurrent import ConcurrentExecutor
 from .assertions import assert_corofunction, assert_iter
 
 
 @overload
-@asyncio.coroutine
-def some(coro, iterable, limit=0, timeout=None, loop=None):
+async def some(coro, iterable, limit=0, timeout=None, loop=None, *,
+               executor=None):
     """
     Returns `True` if at least one element in the iterable satisfies the
     asynchronous coroutine test. If any iteratee call returns `True`,
@@ -28,6 +27,10 @@ def some(coro, iterable, limit=0, timeout=None, loop=None):
             float. If timeout is not specified or None, there is no limit to
             the wait time.
         loop (asyncio.BaseEventLoop): optional event loop to use.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run ``coro`` if it is a blocking function instead of a
+            coroutine function. Use ``True`` for the loop default thread pool
+            executor. Concurrency is still bounded by ``limit``.
 
     Raises:
         TypeError: if input arguments are not valid.
@@ -44,6 +47,10 @@ def some(coro, iterable, limit=0, timeout=None, loop=None):
         # => True
 
     """
+    # Run blocking functions in the given executor
+    if executor is not None:
+        coro = wraps(coro, executor=executor, loop=loop)
+
     assert_corofunction(coro=coro)
     assert_iter(iterable=iterable)
 
@@ -58,23 +65,21 @@ def some(coro, iterable, limit=0, timeout=None, loop=None):
     pool = ConcurrentExecutor(limit=limit, loop=loop)
 
     # Reducer partial function for deferred coroutine execution
-    @asyncio.coroutine
-    def tester(element):
+    async def tester(element):
         nonlocal passes
         if passes:
             return None
 
-        if (yield from coro(element)):
+        if (await coro(element)):
             # Flag as not test passed
             passes = True
             # Force stop pending coroutines
             pool.cancel()
 
-    # Iterate and attach coroutine for defer scheduling
-    for element in iterable:
-        pool.add(partial(tester, element))
+    # Lazily attach elements for deferred scheduling
+    pool.feed(tester, iterable)
 
     # Wait until all coroutines finish
-    yield from pool.run(timeout=timeout)
+    await pool.run(timeout=timeout, retain_done=False)
 
     return passes
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import time
-import asyncio
 from .decorator import decorate
 from .assertions import assert_corofunction
 
@@ -99,8 +98,7 @@ def throttle(coro, limit=1, timeframe=1,
     def elapsed():
         return now() - last_call
 
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
+    async def wrapper(*args, **kw):
         nonlocal result
         nonlocal remaning
         nonlocal last_call
@@ -117,7 +115,7 @@ def throttle(coro, limit=1, timeframe=1,
         remaning -= 1
 
         # Schedule coroutine passing arguments and cache result
-        result = yield from coro(*args, **kw)
+        result = await coro(*args, **kw)
         return result
 
     return wrapper
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .assertions import assert_corofunction
 
 
@@ -36,8 +35,7 @@ def thunk(coro):
     """
     assert_corofunction(coro=coro)
 
-    @asyncio.coroutine
-    def wrapper():
-        return (yield from coro())
+    async def wrapper():
+        return await coro()
 
     return wrapper
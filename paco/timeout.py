@@ -31,13 +31,11 @@ def timeout(coro, timeout=None, loop=None):
         await paco.timeout(coro, timeout=10)
 
     """
-    @asyncio.coroutine
-    def _timeout(coro):
-        return (yield from asyncio.wait_for(coro, timeout, loop=loop))
+    async def _timeout(coro):
+        return await asyncio.wait_for(coro, timeout)
 
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
-        return (yield from _timeout(coro(*args, **kw)))
+    async def wrapper(*args, **kw):
+        return await _timeout(coro(*args, **kw))
 
     return _timeout(coro) if asyncio.iscoroutine(coro) else wrapper
 
@@ -69,7 +67,7 @@ class TimeoutLimit(object):
         self._cancel_handler = None
 
     def __enter__(self):
-        self._task = asyncio.Task.current_task(loop=self._loop)
+        self._task = asyncio.current_task(loop=self._loop)
         if self._task is None:
             raise RuntimeError('paco: timeout context manager should '
                                'be used inside a task')
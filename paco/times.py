@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .decorator import decorate
 from .assertions import assert_corofunction
 
@@ -57,8 +56,7 @@ def times(coro, limit=1, raise_exception=False, return_value=None):
     # Store result from last execution
     result = None
 
-    @asyncio.coroutine
-    def wrapper(*args, **kw):
+    async def wrapper(*args, **kw):
         nonlocal limit
         nonlocal result
 
@@ -75,10 +73,10 @@ def times(coro, limit=1, raise_exception=False, return_value=None):
 
         # If return_value is present, do not memoize result
         if return_value:
-            return (yield from coro(*args, **kw))
+            return await coro(*args, **kw)
 
         # Schedule coroutine and memoize result
-        result = yield from coro(*args, **kw)
+        result = await coro(*args, **kw)
         return result
 
     return wrapper
@@ -0,0 +1,244 @@
+# -*- coding: utf-8 -*-
+import json
+import time
+import random
+import asyncio
+from contextlib import contextmanager
+
+try:
+    import contextvars
+except ImportError:  # pragma: no cover
+    contextvars = None
+
+# Current span, propagated across tasks via context variables if
+# supported by the Python version (3.7+)
+_current = (contextvars.ContextVar('paco_span', default=None)
+            if contextvars else None)
+
+
+def _new_id():
+    return '{:016x}'.format(random.getrandbits(64))
+
+
+class Span(object):
+    """
+    Span records the timing and outcome of a traced operation, such as
+    a coroutine task scheduled by an executor.
+
+    Timestamps are expressed in seconds since the epoch.
+
+    Arguments:
+        name (str): span name.
+        parent (paco.tracing.Span, optional): parent span.
+        attributes (dict, optional): span attributes.
+    """
+
+    __slots__ = ('name', 'trace_id', 'span_id', 'parent_id', 'attributes',
+                 'enqueued', 'start', 'end', 'outcome', 'error')
+
+    def __init__(self, name, parent=None, attributes=None):
+        self.name = name
+        self.trace_id = parent.trace_id if parent else _new_id()
+        self.span_id = _new_id()
+        self.parent_id = parent.span_id if parent else None
+        self.attributes = attributes or {}
+        self.enqueued = self.start = time.time()
+        self.end = None
+        self.outcome = None
+        self.error = None
+
+    @property
+    def queue_wait(self):
+        """
+        Returns the seconds the span waited since it was enqueued until
+        it was started.
+
+        Returns:
+            float
+        """
+        return self.start - self.enqueued
+
+    @property
+    def duration(self):
+        """
+        Returns the span duration in seconds, if finished.
+
+        Returns:
+            float
+        """
+        return None if self.end is None else self.end - self.start
+
+    def to_dict(self):
+        """
+        Returns the span data as dictionary.
+
+        Returns:
+            dict
+        """
+        return {
+            'name': self.name,
+            'trace_id': self.trace_id,
+            'span_id': self.span_id,
+            'parent_id': self.parent_id,
+            'enqueued': self.enqueued,
+            'start': self.start,
+            'end': self.end,
+            'queue_wait': self.queue_wait,
+            'duration': self.duration,
+            'outcome': self.outcome,
+            'error': self.error,
+            'attributes': self.attributes,
+        }
+
+
+class Tracer(object):
+    """
+    Tracer creates spans and reports them to the given sink once finished.
+
+    The current span is propagated via ``contextvars``, so spans created
+    inside a traced block or coroutine task, including nested executors,
+    are linked to it as parent span.
+
+    The tracer can be passed to ``paco.ConcurrentExecutor``, ``paco.map()``
+    and ``paco.each()`` via ``tracer`` param in order to trace every
+    scheduled coroutine task.
+
+    Arguments:
+        sink (function, optional): function called with every finished
+            ``paco.tracing.Span``, e.g: a ``paco.JSONLinesExporter``.
+
+    Usage::
+
+        tracer = paco.Tracer(paco.JSONLinesExporter('spans.jsonl'))
+
+        async def handler(request):
+            with tracer.span('handler', path=request.path):
+                await paco.map(fetch, urls, limit=10, tracer=tracer)
+    """
+
+    def __init__(self, sink=None):
+        self.sink = sink
+
+    def current_span(self):
+        """
+        Returns the current span, if any.
+
+        Returns:
+            paco.tracing.Span
+        """
+        return _current.get() if _current else None
+
+    def create(self, name, parent=None, **attributes):
+        """
+        Creates a new enqueued span, child of the given or current span.
+
+        Returns:
+            paco.tracing.Span
+        """
+        if parent is None:
+            parent = self.current_span()
+        return Span(name, parent, attributes)
+
+    def activate(self, span):
+        """
+        Starts the given span and sets it as current span.
+
+        Returns:
+            mixed: token to pass to ``finish()``.
+        """
+        span.start = time.time()
+        return _current.set(span) if _current else None
+
+    def finish(self, span, token=None, outcome='ok', error=None):
+        """
+        Finishes the given span, restoring the previous current span
+        and reporting it to the sink.
+
+        Arguments:
+            span (paco.tracing.Span): span to finish.
+            token (mixed): token returned by ``activate()``.
+            outcome (str): span outcome: ``ok``, ``error`` or ``cancelled``.
+            error (Exception): optional span error.
+        """
+        span.end = time.time()
+        span.outcome = outcome
+        if error is not None:
+            span.error = repr(error)
+        if token is not None:
+            _current.reset(token)
+        if self.sink:
+            self.sink(span)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """
+        Context manager that traces the enclosed block as a new span.
+
+        Arguments:
+            name (str): span name.
+            **attributes (mixed): span attributes.
+        """
+        span = self.create(name, **attributes)
+        token = self.activate(span)
+        try:
+            yield span
+        except asyncio.CancelledError:
+            self.finish(span, token, 'cancelled')
+            raise
+        except BaseException as err:
+            self.finish(span, token, 'error', err)
+            raise
+        else:
+            self.finish(span, token)
+
+
+class JSONLinesExporter(object):
+    """
+    Span sink that writes finished spans to a file as JSON lines,
+    for offline analysis.
+
+    Arguments:
+        path (str|file): file path or file-like object to write to.
+            Files opened by path are opened in append mode.
+        buffer (int): number of spans to buffer before writing them.
+            Defaults to ``100``.
+
+    Usage::
+
+        with paco.JSONLinesExporter('spans.jsonl') as exporter:
+            tracer = paco.Tracer(exporter)
+    """
+
+    def __init__(self, path, buffer=100):
+        self.buffer = max(int(buffer), 1)
+        self._own = isinstance(path, str)
+        self._file = open(path, 'a') if self._own else path
+        self._lines = []
+
+    def __call__(self, span):
+        self._lines.append(json.dumps(span.to_dict(), default=repr))
+        if len(self._lines) >= self.buffer:
+            self.flush()
+
+    def flush(self):
+        """
+        Writes the buffered spans to the file.
+        """
+        if self._lines:
+            self._file.write('\n'.join(self._lines) + '\n')
+            self._lines = []
+        self._file.flush()
+
+    def close(self):
+        """
+        Flushes the buffered spans, closing the file if opened by path.
+        """
+        self.flush()
+        if self._own:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -1,10 +1,8 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .whilst import whilst
 
 
-@asyncio.coroutine
-def until(coro, coro_test, assert_coro=None, *args, **kw):
+async def until(coro, coro_test, assert_coro=None, *args, **kw):
     """
     Repeatedly call `coro` coroutine function until `coro_test` returns `True`.
 
@@ -41,9 +39,8 @@ def until(coro, coro_test, assert_coro=None, *args, **kw):
         # => [1, 2, 3, 4, 5]
 
     """
-    @asyncio.coroutine
-    def assert_coro(value):
+    async def assert_coro(value):
         return not value
 
-    return (yield from whilst(coro, coro_test,
-                              assert_coro=assert_coro, *args, **kw))
+    return await whilst(coro, coro_test,
+                        assert_coro=assert_coro, *args, **kw)
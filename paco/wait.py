@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .assertions import isiter
 from .concurrent import ConcurrentExecutor
 
 
-@asyncio.coroutine
-def wait(*coros_or_futures, limit=0, timeout=None, loop=None,
-         return_exceptions=False, return_when='ALL_COMPLETED'):
+async def wait(*coros_or_futures, limit=0, timeout=None, loop=None,
+               return_exceptions=False, return_when='ALL_COMPLETED'):
     """
     Wait for the Futures and coroutine objects given by the sequence
     futures to complete, with optional concurrency limit.
@@ -79,6 +77,6 @@ def wait(*coros_or_futures, limit=0, timeout=None, loop=None,
                               coros=coros_or_futures)
 
     # Wait until all the tasks finishes
-    return (yield from pool.run(timeout=timeout,
-                                return_when=return_when,
-                                return_exceptions=return_exceptions))
+    return await pool.run(timeout=timeout,
+                          return_when=return_when,
+                          return_exceptions=return_exceptions)
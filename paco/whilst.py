@@ -1,11 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from .filter import assert_true
 from .assertions import assert_corofunction
 
 
-@asyncio.coroutine
-def whilst(coro, coro_test, assert_coro=None, *args, **kw):
+async def whilst(coro, coro_test, assert_coro=None, *args, **kw):
     """
     Repeatedly call `coro` coroutine function while `coro_test` returns `True`.
 
@@ -51,7 +49,7 @@ def whilst(coro, coro_test, assert_coro=None, *args, **kw):
     assert_coro = assert_coro or assert_true
 
     # Execute coroutine until a certain
-    while (yield from assert_coro((yield from coro_test()))):
-        results.append((yield from coro(*args, **kw)))
+    while (await assert_coro(await coro_test())):
+        results.append(await coro(*args, **kw))
 
     return results
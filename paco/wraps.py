@@ -1,15 +1,29 @@
 # -*- coding: utf-8 -*-
 import asyncio
+import inspect
+import functools
 
 
-def wraps(fn):
+def wraps(fn, executor=None, loop=None):
     """
     Wraps a given function as coroutine function.
 
+    By default the function is executed synchronously in the event loop.
+    If an ``executor`` is provided, the function is executed via
+    ``loop.run_in_executor()`` instead, so blocking functions do not block
+    the event loop.
+
     This function can be used as decorator.
 
     Arguments:
         fn (function): function object to wrap.
+        executor (concurrent.futures.Executor|bool): optional executor used
+            to run the function. Use ``True`` for the loop default
+            thread pool executor.
+        loop (asyncio.BaseEventLoop): optional event loop to use.
+
+    Raises:
+        TypeError: if fn is not a callable object.
 
     Returns:
         coroutinefunction: wrapped function as coroutine.
@@ -32,5 +46,35 @@ def wraps(fn):
         await mul_2(2)
         # => 4
 
+        # Run blocking function in the default thread pool executor
+        read = paco.wraps(read_file, executor=True)
+        await read('data.txt')
+
     """
-    return asyncio.coroutine(fn)
+    if not callable(fn):
+        raise TypeError('paco: fn must be a callable object')
+
+    if asyncio.iscoroutinefunction(fn):
+        return fn
+
+    if executor is None:
+        @functools.wraps(fn)
+        async def wrapper(*args, **kw):
+            result = fn(*args, **kw)
+            # Functions may also return awaitable objects
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+        return wrapper
+
+    # Use the loop default executor
+    if executor is True:
+        executor = None
+
+    @functools.wraps(fn)
+    async def wrapper(*args, **kw):
+        return await (loop or asyncio.get_event_loop()).run_in_executor(
+            executor, functools.partial(fn, *args, **kw))
+
+    return wrapper
@@ -75,6 +75,7 @@ setup(
     package_data={'': ['LICENSE', 'History.rst', 'requirements-dev.txt']},
     package_dir={'paco': 'paco'},
     include_package_data=True,
+    python_requires='>=3.7',
     cmdclass={'test': PyTest},
     classifiers=[
         'Intended Audience :: Developers',
@@ -83,8 +84,6 @@ setup(
         'Development Status :: 5 - Production/Stable',
         'Natural Language :: English',
         'License :: OSI Approved :: MIT License',
-        'Programming Language :: Python :: 3.5',
-        'Programming Language :: Python :: 3.6',
         'Programming Language :: Python :: 3.7',
         'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
@@ -1,11 +1,9 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from paco import apply
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(*args, **kw):
+async def coro(*args, **kw):
     return args, kw
 
 
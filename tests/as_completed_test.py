@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import time
+import pytest
+import asyncio
+from paco import as_completed
+from .helpers import run_in_loop
+
+
+async def sleep(num):
+    await asyncio.sleep(num)
+    return num
+
+
+async def consume(iterator):
+    return [(index, result) async for index, result in iterator]
+
+
+def test_as_completed():
+    start = time.time()
+    results = run_in_loop(consume(as_completed(
+        sleep(0.03), sleep(0.01), sleep(0.02))))
+    assert results == [(1, 0.01), (2, 0.02), (0, 0.03)]
+    assert time.time() - start < 0.06
+
+
+def test_as_completed_limit():
+    coros = [sleep(0.05), sleep(0.01), sleep(0.01)]
+    results = run_in_loop(consume(as_completed(coros, limit=1)))
+    assert results == [(0, 0.05), (1, 0.01), (2, 0.01)]
+
+
+def test_as_completed_streaming():
+    events = []
+
+    async def coro(num):
+        await asyncio.sleep(num * 0.02)
+        events.append(('done', num))
+        return num
+
+    async def consumer():
+        async for index, result in as_completed(
+                [coro(num) for num in range(3)], limit=2):
+            events.append(('result', index))
+
+    run_in_loop(consumer())
+    # First results are consumed before the last coroutine finishes
+    assert events.index(('result', 0)) < events.index(('done', 2))
+
+
+def test_as_completed_exceptions():
+    async def fail():
+        raise ValueError('foo')
+
+    results = run_in_loop(consume(as_completed(
+        sleep(0.01), fail(), return_exceptions=True)))
+    assert results[0][0] == 1
+    assert isinstance(results[0][1], ValueError)
+    assert results[1] == (0, 0.01)
+
+    with pytest.raises(ValueError):
+        run_in_loop(consume(as_completed(sleep(1), fail())))
+
+
+def test_as_completed_timeout():
+    with pytest.raises(asyncio.TimeoutError):
+        run_in_loop(consume(as_completed(
+            sleep(0.01), sleep(1), timeout=0.05)))
+
+
+def test_as_completed_timeout_cleanup():
+    cancelled = []
+
+    async def coro(num):
+        try:
+            await asyncio.sleep(num)
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+        return num
+
+    with pytest.raises(asyncio.TimeoutError):
+        run_in_loop(consume(as_completed(
+            coro(0.01), coro(1), coro(2), timeout=0.05)))
+    # In-flight coroutines are cancelled and reaped before raising
+    assert sorted(cancelled) == [1, 2]
+
+
+def test_as_completed_break():
+    started = []
+    cancelled = []
+
+    async def coro(num):
+        started.append(num)
+        try:
+            await asyncio.sleep(0.01 * (num + 1))
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+        return num
+
+    async def consumer():
+        iterator = as_completed([coro(num) for num in range(100)], limit=2)
+        async for index, result in iterator:
+            break
+        await iterator.aclose()
+        return index
+
+    assert run_in_loop(consumer()) == 0
+    # In-flight coroutines are cancelled and pending ones never started
+    assert started == [0, 1]
+    assert cancelled == [1]
+
+    async def break_consumer():
+        async for index, result in as_completed(
+                [coro(num) for num in range(100)], limit=2):
+            break
+        # Iterator is closed once it is released
+        await asyncio.sleep(0.05)
+
+    del started[:], cancelled[:]
+    run_in_loop(break_consumer())
+    assert len(started) <= 3
+    assert sorted(cancelled) == started[1:]
+
+
+def test_as_completed_empty():
+    assert run_in_loop(consume(as_completed())) == []
+
+
+def test_as_completed_invalid_input():
+    with pytest.raises(TypeError):
+        as_completed(None)
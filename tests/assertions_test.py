@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco.assertions import (assert_corofunction,
                              assert_iter, isiter,
                              iscoro_or_corofunc,
@@ -16,8 +15,7 @@ def test_isiter():
 
 
 def test_iscallable():
-    @asyncio.coroutine
-    def coro():
+    async def coro():
         pass
 
     assert iscallable(test_iscallable)
@@ -31,8 +29,7 @@ def test_iscallable():
 
 
 def test_isfunc():
-    @asyncio.coroutine
-    def coro():
+    async def coro():
         pass
 
     assert isfunc(test_isfunc)
@@ -45,8 +42,7 @@ def test_isfunc():
     assert not isfunc(True)
 
 
-@asyncio.coroutine
-def coro(*args, **kw):
+async def coro(*args, **kw):
     return args, kw
 
 
@@ -62,12 +58,12 @@ def test_iscoro_or_():
 def test_assert_corofunction():
     assert_corofunction(coro=coro)
 
-    with pytest.raises(TypeError, message='coro must be a coroutine function'):
+    with pytest.raises(TypeError, match='coro must be a coroutine function'):
         assert_corofunction(coro=None)
 
 
 def test_assert_iter():
     assert_iter(iterable=())
 
-    with pytest.raises(TypeError, message='iterable must be an iterable'):
+    with pytest.raises(TypeError, match='iterable must be an iterable'):
         assert_iter(iterable=None)
@@ -6,9 +6,8 @@ from paco import compose, partial
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num, acc):
-    yield from asyncio.sleep(0.1)
+async def coro(num, acc):
+    await asyncio.sleep(0.1)
     return acc + (num,)
 
 
@@ -22,8 +21,7 @@ def test_compose():
 def test_compose_exception():
     count = 0
 
-    @asyncio.coroutine
-    def coro_exception(x):
+    async def coro_exception(x):
         nonlocal count
         count += 1
 
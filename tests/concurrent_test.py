@@ -1,22 +1,24 @@
 # -*- coding: utf-8 -*-
 import time
+import builtins
+import tracemalloc
 import pytest
 import asyncio
-from paco import concurrent
+from concurrent.futures import ThreadPoolExecutor
+from paco import concurrent, Tracer
+from paco.concurrent import EAGER_START
 from .helpers import sleep_coro, run_in_loop
 
 
-@asyncio.coroutine
-def run_test(limit=3, times=10, timespan=0.1):
-    p = concurrent(limit)
+async def run_test(limit=3, times=10, timespan=0.1, engine='tasks'):
+    p = concurrent(limit, engine=engine)
     for i in range(times):
         p.add(sleep_coro, timespan)
-    return (yield from p.run())
+    return await p.run()
 
 
 def test_concurrent_single():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         return num * 2
 
     p = concurrent(10)
@@ -97,16 +99,13 @@ def test_concurrent_observe():
     start = []
     finish = []
 
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         return num * 2
 
-    @asyncio.coroutine
-    def on_start(task):
+    async def on_start(task):
         start.append(task)
 
-    @asyncio.coroutine
-    def on_finish(task, result):
+    async def on_finish(task, result):
         finish.append(result)
 
     p = concurrent(10)
@@ -139,22 +138,18 @@ def test_concurrent_observe_exception():
     error = []
     finish = []
 
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         if num > 4:
             raise ValueError('invalid number')
         return num * 2
 
-    @asyncio.coroutine
-    def on_start(task):
+    async def on_start(task):
         start.append(task)
 
-    @asyncio.coroutine
-    def on_error(task, err):
+    async def on_error(task, err):
         error.append(err)
 
-    @asyncio.coroutine
-    def on_finish(task, result):
+    async def on_finish(task, result):
         finish.append(result)
 
     p = concurrent(1)
@@ -177,3 +172,984 @@ def test_concurrent_observe_exception():
 
     finish.sort()
     assert finish == [4, 8]
+
+
+def test_concurrent_feed():
+    created = 0
+    alive = 0
+    max_alive = 0
+
+    def values():
+        nonlocal created
+        for num in range(20):
+            created += 1
+            yield num
+
+    async def coro(num):
+        nonlocal alive, max_alive
+        alive += 1
+        max_alive = max(max_alive, alive)
+        await asyncio.sleep(0.01)
+        alive -= 1
+        return num * 2
+
+    p = concurrent(3)
+    p.feed(coro, values())
+    assert created == 0
+
+    done, pending = run_in_loop(p.run())
+    assert created == 20
+    assert max_alive == 3
+    assert len(done) == 20
+    assert len(pending) == 0
+
+    results = sorted(future.result() for future in done)
+    assert results == [num * 2 for num in range(20)]
+
+
+def test_concurrent_feed_bounded_memory():
+    async def coro(num):
+        return None
+
+    async def run(num, engine):
+        p = concurrent(10, engine=engine)
+        p.feed(coro, range(num))
+        tracemalloc.start()
+        try:
+            done, pending = await p.run(retain_done=False)
+            return done, tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    for engine in ('tasks', 'workers'):
+        done, small = run_in_loop(run(1000, engine))
+        assert len(done) == 0
+        # Finished futures are not retained, memory does not grow with n
+        done, large = run_in_loop(run(10000, engine))
+        assert len(done) == 0
+        assert large < small * 2
+
+
+def test_concurrent_feed_error():
+    def values():
+        for num in range(10):
+            if num == 4:
+                raise ValueError('invalid value')
+            yield num
+
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        return num
+
+    async def pair(num, other):
+        return num
+
+    for engine in ('tasks', 'workers'):
+        for limit in (1, 2):
+            # Iterable errors are raised by run(), even if
+            # exceptions are returned as results
+            p = concurrent(limit, engine=engine)
+            p.feed(coro, values())
+            with pytest.raises(ValueError, match='invalid value'):
+                run_in_loop(asyncio.wait_for(
+                    p.run(return_exceptions=True), 1))
+            assert not p.is_running()
+            assert p._pending == set()
+
+        p = concurrent(2, engine=engine)
+        p.feed(pair, [1, 2])
+        with pytest.raises(TypeError):
+            run_in_loop(asyncio.wait_for(p.run(), 1))
+
+
+def test_concurrent_feed_invalid():
+    with pytest.raises(TypeError):
+        concurrent().feed(lambda x: x, [1, 2, 3])
+
+    with pytest.raises(TypeError):
+        concurrent().feed(sleep_coro, None)
+
+
+def test_concurrent_workers_engine():
+    timespan, times, limit = 0.1, 10, 3
+    start = time.time()
+    done, pending = run_in_loop(
+        run_test(limit=limit, times=times, timespan=timespan,
+                 engine='workers')
+    )
+    assert time.time() - start >= (times * timespan / limit)
+    assert len(done) == times
+    assert len(pending) == 0
+
+    for future in done:
+        assert future.result() >= 0.1
+
+
+def test_concurrent_workers_engine_exception():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        if num == 4:
+            raise ValueError('invalid number')
+        return num * 2
+
+    p = concurrent(2, engine='workers')
+    p.feed(coro, range(10))
+    done, pending = run_in_loop(p.run(return_exceptions=True))
+    results = sorted(str(future.result()) for future in done)
+    assert len(done) == 10
+    assert 'invalid number' in results
+
+    p = concurrent(2, engine='workers')
+    p.feed(coro, range(10))
+    with pytest.raises(ValueError):
+        run_in_loop(p.run(return_exceptions=False))
+    assert not p.is_running()
+
+
+def test_concurrent_invalid_engine():
+    with pytest.raises(ValueError):
+        concurrent(engine='threads')
+
+
+def test_concurrent_observe_sync():
+    start = []
+    finish = []
+
+    async def coro(num):
+        return num * 2
+
+    p = concurrent(2, engine='workers')
+    p.on('task.start', lambda task: start.append(task.index))
+    p.on('task.finish', lambda task, result: finish.append(result))
+    p.feed(coro, [1, 2, 3])
+
+    done, pending = run_in_loop(p.run())
+    assert len(done) == 3
+    assert sorted(start) == [0, 1, 2]
+    assert sorted(finish) == [2, 4, 6]
+
+
+def test_concurrent_service():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        if num < 0:
+            raise ValueError('invalid number')
+        return num * 2
+
+    async def run_service(engine):
+        p = concurrent(2, engine=engine)
+        await p.start()
+        assert p.is_running()
+
+        first = [p.submit(coro, num) for num in range(3)]
+        assert (await first[0]) == 0
+        assert (await first[2]) == 4
+
+        # Keep feeding the running executor
+        second = [p.submit(coro, num) for num in range(3, 6)]
+        failed = p.submit(coro, -1)
+        await p.drain()
+        assert all(future.done() for future in second)
+        assert [future.result() for future in second] == [6, 8, 10]
+        assert isinstance(failed.exception(), ValueError)
+
+        late = p.submit(coro, 10)
+        await p.close()
+        assert late.result() == 20
+        assert not p.is_running()
+
+        # Batch runs are not allowed while in service mode
+        await p.start()
+        with pytest.raises(RuntimeError):
+            await p.run()
+        await p.close()
+
+    run_in_loop(run_service('tasks'))
+    run_in_loop(run_service('workers'))
+
+
+def test_concurrent_submit_batch():
+    async def coro(num):
+        return num * 2
+
+    p = concurrent(2)
+    futures = [p.submit(coro, num) for num in range(4)]
+    done, pending = run_in_loop(p.run())
+    assert len(done) == 4
+    assert [future.result() for future in futures] == [0, 2, 4, 6]
+
+
+def test_concurrent_priority_queue():
+    order = []
+
+    async def coro(name):
+        order.append(name)
+
+    p = concurrent(1, queue='priority')
+    p.add(coro, 'bulk-1', priority=10)
+    p.add(coro, 'bulk-2', priority=10)
+    p.add(coro, 'interactive-1')
+    p.submit(coro, 'urgent', priority=-1)
+    p.add(coro, 'interactive-2')
+
+    run_in_loop(p.run())
+    assert order == ['urgent', 'interactive-1', 'interactive-2',
+                     'bulk-1', 'bulk-2']
+
+
+def test_concurrent_invalid_queue():
+    with pytest.raises(ValueError):
+        concurrent(queue='lifo')
+
+
+def test_concurrent_resize():
+    alive = 0
+    max_alive = []
+
+    async def coro(num):
+        nonlocal alive
+        alive += 1
+        max_alive.append(alive)
+        await asyncio.sleep(0.01)
+        alive -= 1
+        return num
+
+    async def run_resize(engine):
+        del max_alive[:]
+        p = concurrent(2, engine=engine)
+        p.feed(coro, range(30))
+
+        async def resize():
+            await asyncio.sleep(0.025)
+            p.resize(6)
+            await asyncio.sleep(0.025)
+            p.resize(1)
+
+        (done, _), _ = await asyncio.gather(p.run(), resize())
+        assert len(done) == 30
+        assert max(max_alive[:4]) == 2
+        assert max(max_alive) == 6
+        assert max_alive[-1] == 1
+
+    run_in_loop(run_resize('tasks'))
+    run_in_loop(run_resize('workers'))
+
+
+def test_concurrent_limiter():
+    from paco.limiter import AIMDLimiter
+
+    async def coro(num):
+        await asyncio.sleep(0.001)
+        if num % 10 == 0:
+            raise ValueError('overloaded')
+        return num
+
+    limiter = AIMDLimiter(limit=4, max_limit=8, backoff=0.5)
+    p = concurrent(limiter=limiter)
+    assert p.limit == 4
+
+    p.feed(coro, range(1, 10))
+    run_in_loop(p.run())
+    assert p.limit > 4
+
+    p.feed(coro, [10, 20, 30])
+    run_in_loop(p.run(return_exceptions=True))
+    assert p.limit < 4
+
+
+def test_concurrent_executor_blocking():
+    def blocking(num):
+        time.sleep(0.05)
+        return num * 2
+
+    p = concurrent(4, executor=True)
+    p.add(blocking, 1)
+    p.add(sleep_coro, 0.05)
+    p.feed(blocking, [2, 3, 4])
+
+    start = time.time()
+    done, pending = run_in_loop(p.run())
+    assert 0.1 <= time.time() - start < 0.15
+    assert sorted(future.result() for future in done)[1:] == [2, 4, 6, 8]
+
+    with pytest.raises(TypeError):
+        concurrent().add(blocking, 1)
+
+
+def test_concurrent_key_limit():
+    running = {}
+    max_running = {}
+    alive = 0
+    max_alive = 0
+
+    async def coro(url):
+        nonlocal alive, max_alive
+        host = url.split('/')[0]
+        running[host] = running.get(host, 0) + 1
+        max_running[host] = max(max_running.get(host, 0), running[host])
+        alive += 1
+        max_alive = max(max_alive, alive)
+        await asyncio.sleep(0.01)
+        running[host] -= 1
+        alive -= 1
+        return url
+
+    urls = ['{}/{}'.format(host, num)
+            for num in range(5) for host in ('a', 'b', 'c')]
+    urls += ['slow/{}'.format(num) for num in range(10)]
+
+    async def run_keyed(engine):
+        p = concurrent(5, engine=engine, key_limit=2,
+                       key=lambda url: url.split('/')[0])
+        p.feed(coro, urls)
+        p.add(coro, 'slow/add')
+        done, _ = await p.run()
+        assert len(done) == len(urls) + 1
+        assert max_alive == 5
+        assert max(max_running.values()) == 2
+
+        # Idle keys state is evicted
+        assert p._key_counts == {}
+        assert p._parked == {}
+
+    run_in_loop(run_keyed('tasks'))
+    run_in_loop(run_keyed('workers'))
+
+
+def test_concurrent_key_error():
+    def key(num):
+        if num == 4:
+            raise KeyError('invalid key')
+        return num % 2
+
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        return num
+
+    # Key function errors fail the execution cycle
+    for engine in ('tasks', 'workers'):
+        for limit in (1, 2):
+            p = concurrent(limit, engine=engine, key=key)
+            p.feed(coro, range(10))
+            with pytest.raises(KeyError, match='invalid key'):
+                run_in_loop(asyncio.wait_for(
+                    p.run(return_exceptions=True), 1))
+
+    p = concurrent(2, key=key)
+    with pytest.raises(KeyError):
+        p.add(coro, 4)
+    assert len(p) == 0
+
+
+def test_concurrent_key_limit_cancel_start():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        return num
+
+    async def slow_start(task):
+        await asyncio.sleep(0.05)
+
+    async def run_cancel():
+        p = concurrent(2, key=lambda num: 'host')
+        p.on('task.start', slow_start)
+        p.feed(coro, [1, 2])
+        runner = asyncio.ensure_future(p.run())
+        await asyncio.sleep(0.01)
+
+        # Tasks cancelled while starting release their key slot
+        p.cancel()
+        await runner
+        assert p._key_counts == {}
+
+        p.off('task.start')
+        p.feed(coro, [3])
+        done, _ = await p.run()
+        return [future.result() for future in done]
+
+    assert run_in_loop(run_cancel()) == [3]
+
+
+def test_concurrent_key_limit_backlog():
+    async def run_backlog():
+        ready = asyncio.Event()
+        others = []
+        deferred = []
+
+        async def coro(url):
+            host = url.split('/')[0]
+            if host == 'slow':
+                return await ready.wait()
+            # Parked tasks of the saturated key do not create coroutines
+            deferred.append(all(task.coro is None
+                                for parked in p._parked.values()
+                                for task in parked))
+            others.append(url)
+            if len(others) == 40:
+                ready.set()
+
+        # A saturated key does not block other keys read ahead
+        # within the backlog
+        urls = ['slow/{}'.format(num) for num in range(1100)]
+        urls += ['host{}/0'.format(num) for num in range(40)]
+
+        p = concurrent(50, key_limit=2, key_backlog=1200,
+                       key=lambda url: url.split('/')[0])
+        p.feed(coro, urls)
+        await asyncio.wait_for(p.run(), 5)
+        assert len(others) == 40
+        assert all(deferred)
+
+    run_in_loop(run_backlog())
+
+    pulled = 0
+    finished = 0
+    max_ahead = 0
+
+    def values(num):
+        nonlocal pulled
+        for value in range(num):
+            pulled += 1
+            yield value
+
+    async def coro(value):
+        nonlocal finished, max_ahead
+        max_ahead = max(max_ahead, pulled - finished)
+        await asyncio.sleep(0)
+        finished += 1
+
+    # Fed values are not read ahead beyond the backlog
+    p = concurrent(50, key_limit=2, key_backlog=100, key=lambda value: 0)
+    p.feed(coro, values(2000))
+    run_in_loop(p.run(retain_done=False))
+    assert finished == 2000
+    assert max_ahead <= 2 + 100 + 1
+    assert p._read_ahead == 0
+
+
+def test_concurrent_max_weight():
+    weight = 0
+    max_weight = 0
+    order = []
+    alive = 0
+    max_alive = 0
+
+    async def coro(name, size):
+        nonlocal weight, max_weight, alive, max_alive
+        weight += size
+        max_weight = max(max_weight, weight)
+        order.append(name)
+        alive += 1
+        # Concurrency once the oversized task is finished
+        if 'huge' in order and name != 'huge':
+            max_alive = max(max_alive, alive)
+        await asyncio.sleep(0.01)
+        weight -= size
+        alive -= 1
+
+    async def run_weighted(engine):
+        nonlocal max_weight, max_alive
+        max_weight = max_alive = 0
+        del order[:]
+
+        p = concurrent(10, engine=engine, max_weight=100)
+        p.add(coro, 'download', 60, weight=60)
+        p.add(coro, 'huge', 200, weight=200)
+        for num in range(5):
+            p.add(coro, 'head-{}'.format(num), 1)
+        p.add(coro, 'upload', 50, weight=50)
+
+        done, _ = await p.run()
+        assert len(done) == 8
+        # Oversized tasks run alone
+        assert max_weight == 200
+        assert order[:2] == ['download', 'huge']
+        # Free slots are filled again once the held task fits
+        assert max_alive == 6
+        assert p._weight == 0
+        assert p._held is None
+
+    run_in_loop(run_weighted('tasks'))
+    run_in_loop(run_weighted('workers'))
+
+    with pytest.raises(ValueError):
+        concurrent().add(sleep_coro, weight=-1)
+
+
+def test_concurrent_fail_fast():
+    cancelled = []
+
+    async def coro(num):
+        try:
+            await asyncio.sleep(0.01 if num == 0 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+        if num == 0:
+            raise ValueError('invalid number')
+        return num
+
+    for engine in ('tasks', 'workers'):
+        del cancelled[:]
+        p = concurrent(5, engine=engine)
+        p.feed(coro, range(10))
+
+        start = time.time()
+        with pytest.raises(ValueError):
+            run_in_loop(p.run(return_exceptions=False))
+        assert time.time() - start < 0.5
+        # In-flight tasks are cancelled and reaped before raising
+        assert sorted(cancelled) == [1, 2, 3, 4]
+        assert not p.is_running()
+        assert not p._workers
+
+
+def test_concurrent_cancel_inflight():
+    cancelled = []
+    p = concurrent(5)
+
+    async def coro(num):
+        if num == 0:
+            await asyncio.sleep(0.01)
+            p.cancel()
+            return num
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+
+    p.feed(coro, range(10))
+    start = time.time()
+    done, pending = run_in_loop(p.run())
+    assert time.time() - start < 0.5
+    assert sorted(cancelled) == [1, 2, 3, 4]
+    assert len(done) == 5
+    assert [f.result() for f in done if not f.cancelled()] == [0]
+
+
+def test_concurrent_task_timeout():
+    async def coro(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    for engine in ('tasks', 'workers'):
+        p = concurrent(5, engine=engine, task_timeout=0.05)
+        p.add(coro, 0.01)
+        p.add(coro, 1)
+        p.add(coro, 0.5, task_timeout=1)
+        p.add(coro, 2, task_timeout=0.1)
+
+        start = time.time()
+        done, _ = run_in_loop(p.run(return_exceptions=True))
+        assert time.time() - start < 1
+        results = [future.result() for future in done]
+        assert 0.01 in results
+        assert 0.5 in results
+        assert len([r for r in results
+                    if isinstance(r, asyncio.TimeoutError)]) == 2
+        # Shared timer state is released
+        assert len(p._deadlines) == 0
+        assert p._deadlines._handle is None
+
+    p = concurrent(2, task_timeout=0.05)
+    p.add(coro, 1)
+    with pytest.raises(asyncio.TimeoutError):
+        run_in_loop(p.run(return_exceptions=False))
+
+
+def test_concurrent_metrics():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        if num == 3:
+            raise ValueError('invalid number')
+        return num
+
+    p = concurrent(2, metrics=True)
+    for num in range(5):
+        p.add(coro, num)
+    assert p.metrics.queued == 5
+
+    run_in_loop(p.run(return_exceptions=True))
+    snapshot = p.metrics.snapshot()
+    assert snapshot['queued'] == 0
+    assert snapshot['in_flight'] == 0
+    assert snapshot['completed'] == 4
+    assert snapshot['failed'] == 1
+    assert snapshot['wait_time']['count'] == 5
+    assert snapshot['wait_time']['max'] >= 0.01
+    assert snapshot['exec_time']['min'] >= 0.01
+
+    # Queued and in-flight tasks are cancelled
+    async def stop():
+        await asyncio.sleep(0.01)
+        p.cancel()
+
+    p.metrics.reset()
+    p.add(stop)
+    for num in range(5):
+        p.add(asyncio.sleep, 1)
+    run_in_loop(p.run())
+    snapshot = p.metrics.snapshot()
+    assert snapshot['queued'] == 0
+    assert snapshot['in_flight'] == 0
+    assert snapshot['completed'] == 1
+    assert snapshot['cancelled'] == 5
+
+
+def test_concurrent_as_completed():
+    p = concurrent(2)
+    p.feed(sleep_coro, [0.05, 0.01, 0.02])
+
+    async def consume():
+        return [index async for index, _ in p.as_completed()]
+
+    assert run_in_loop(consume()) == [1, 2, 0]
+    assert not p.is_running()
+    assert len(p.observer._pool.get('task.finish', [])) == 0
+
+
+def test_concurrent_bounded_queue():
+    queued = []
+
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        return num
+
+    async def producer(p):
+        await p.start()
+        futures = []
+        for num in range(10):
+            futures.append(await p.put(coro, num))
+            queued.append(len(p.pool))
+        results = await asyncio.gather(*futures)
+        await p.close()
+        return results
+
+    p = concurrent(2, maxsize=3)
+    assert run_in_loop(producer(p)) == list(range(10))
+    # Producer is throttled at the consumption rate
+    assert max(queued) == 3
+
+    p = concurrent(2, maxsize=2)
+    p.add(coro, 1)
+    p.submit(coro, 2)
+    assert p.full()
+    with pytest.raises(asyncio.QueueFull):
+        p.add(coro, 3)
+    with pytest.raises(asyncio.QueueFull):
+        p.submit(coro, 3)
+
+    # Waiting producers are released once the queue is cleared
+    async def cancel():
+        putter = asyncio.ensure_future(p.put(coro, 3))
+        await asyncio.sleep(0.01)
+        assert not putter.done()
+        p.cancel()
+        future = await putter
+        assert len(p.pool) == 1
+        return future
+
+    future = run_in_loop(cancel())
+    assert not future.done()
+
+    # Discard the coroutine left in the queue
+    p.reset()
+    assert future.cancelled()
+    assert len(p.pool) == 0
+
+
+def test_concurrent_task_record():
+    tasks = []
+
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        if num == 2:
+            raise ValueError('invalid number')
+        return num
+
+    p = concurrent(2, metrics=True)
+    p.on('task.finish', lambda task, result: tasks.append(task))
+    p.add(coro, 1, weight=2, task_timeout=1)
+    p.submit(coro, 2)
+    p.feed(coro, [3])
+    run_in_loop(p.run(return_exceptions=True))
+
+    task = tasks[0]
+    index, task_coro = task
+    assert (index, task_coro) == (task.index, task.coro)
+    assert task.index == 0 and task.weight == 2 and task.timeout == 1
+    assert task.status == 'completed'
+    assert task.enqueued <= task.started <= task.finished
+    assert task.finished - task.started >= 0.01
+
+    failed = [task for task in tasks if task.index == 1][0]
+    assert failed.status == 'failed'
+    assert isinstance(failed.future.result(), ValueError)
+    assert sorted(task.index for task in tasks) == [0, 1, 2]
+
+
+def test_concurrent_context_manager():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        return num * 2
+
+    async def run_group(engine):
+        async with concurrent(2, engine=engine) as pool:
+            assert pool.is_running()
+            futures = [pool.submit(coro, num) for num in range(5)]
+        assert not pool.is_running()
+        return [future.result() for future in futures]
+
+    assert run_in_loop(run_group('tasks')) == [0, 2, 4, 6, 8]
+    assert run_in_loop(run_group('workers')) == [0, 2, 4, 6, 8]
+
+
+def test_concurrent_context_manager_error():
+    cancelled = []
+
+    async def coro(num):
+        try:
+            await asyncio.sleep(0.01 if num == 0 else 1)
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+        if num == 0:
+            raise ValueError('invalid number')
+        return num
+
+    async def run_group(wait):
+        async with concurrent(3) as pool:
+            for num in range(5):
+                pool.add(coro, num)
+            # Block is cancelled on the first error
+            if wait:
+                await asyncio.sleep(1)
+
+    error = getattr(builtins, 'ExceptionGroup', ValueError)
+    for wait in (True, False):
+        del cancelled[:]
+        start = time.time()
+        with pytest.raises(error) as exc:
+            run_in_loop(run_group(wait))
+        assert time.time() - start < 0.5
+        assert sorted(cancelled) == [1, 2]
+        if error is not ValueError:
+            assert [type(err) for err in exc.value.exceptions] == [ValueError]
+
+
+def test_concurrent_context_manager_cancel():
+    cancelled = []
+
+    async def coro(num):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(num)
+            raise
+
+    async def run_group():
+        async with concurrent(3) as pool:
+            pool.feed(coro, range(5))
+
+    async def cancel_group():
+        task = asyncio.ensure_future(run_group())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    run_in_loop(cancel_group())
+    # Children never outlive the cancelled parent task
+    assert sorted(cancelled) == [0, 1, 2]
+
+
+def test_concurrent_eager():
+    cache = {0: 0, 2: 4}
+
+    async def coro(num):
+        if num in cache:
+            return cache[num]
+        await asyncio.sleep(0.01)
+        if num == 3:
+            raise ValueError('invalid number')
+        return num * 2
+
+    async def run_service():
+        p = concurrent(2, eager=True)
+        await p.start()
+        # Cache hits are resolved without an event loop round trip
+        assert p.submit(coro, 0).done() is EAGER_START
+        future = p.submit(coro, 1)
+        assert not future.done()
+        await p.close()
+        return future.result()
+
+    assert run_in_loop(run_service()) == 2
+
+    tracer = Tracer()
+    p = concurrent(2, eager=True, metrics=True, tracer=tracer)
+    p.feed(coro, range(5))
+    done, pending = run_in_loop(p.run(return_exceptions=True))
+    results = sorted(repr(future.result()) for future in done)
+    assert results == sorted(repr(value) for value in (
+        0, 2, 4, ValueError('invalid number'), 8))
+    assert p.metrics.completed == 4 and p.metrics.failed == 1
+
+    p = concurrent(2, eager=True)
+    p.feed(coro, range(5))
+    with pytest.raises(ValueError):
+        run_in_loop(p.run())
+
+
+@pytest.mark.skipif(not hasattr(asyncio, 'timeout'),
+                    reason='requires Python 3.11+')
+def test_concurrent_eager_current_task():
+    async def coro(num):
+        # Timeouts and task groups are bound to the coroutine task
+        if num == 0:
+            try:
+                async with asyncio.timeout(0.01):
+                    await asyncio.sleep(1)
+            except TimeoutError:
+                return 'timeout'
+        async with asyncio.TaskGroup() as group:
+            task = group.create_task(asyncio.sleep(0, num))
+        return task.result()
+
+    async def run_eager():
+        p = concurrent(2, eager=True)
+        p.feed(coro, range(4))
+        done, _ = await p.run()
+        return sorted(map(str, (future.result() for future in done)))
+
+    assert run_in_loop(run_eager()) == ['1', '2', '3', 'timeout']
+
+
+def test_concurrent_submit_threadsafe():
+    async def coro(num):
+        await asyncio.sleep(0.01)
+        if num == 3:
+            raise ValueError('invalid number')
+        return num * 2
+
+    p = concurrent(5)
+    wakeups = []
+    call_soon_threadsafe = p.loop.call_soon_threadsafe
+
+    def count_wakeups(*args):
+        wakeups.append(args)
+        return call_soon_threadsafe(*args)
+
+    p.loop.call_soon_threadsafe = count_wakeups
+    try:
+        run_in_loop(p.start())
+
+        def producer():
+            return [p.submit_threadsafe(coro, num) for num in range(20)]
+
+        # Submissions in a row are added in a single batch
+        thread = ThreadPoolExecutor(max_workers=1)
+        futures = thread.submit(producer).result()
+        cancelled = futures[-1].cancel()
+        assert len(wakeups) == 1
+
+        run_in_loop(p.close())
+        assert cancelled and futures[-1].cancelled()
+        assert [f.result() for f in futures[:3]] == [0, 2, 4]
+        with pytest.raises(ValueError):
+            futures[3].result()
+        assert [f.result() for f in futures[4:-1]] == [
+            num * 2 for num in range(4, 19)]
+
+        async def submit_from_thread():
+            await p.start()
+            loop = asyncio.get_event_loop()
+            future = await loop.run_in_executor(
+                thread, p.submit_threadsafe, coro, 5)
+            result = await asyncio.wrap_future(future)
+            await p.close()
+            return result
+
+        assert run_in_loop(submit_from_thread()) == 10
+        thread.shutdown()
+    finally:
+        del p.loop.call_soon_threadsafe
+
+
+def test_concurrent_rate_limit():
+    started = []
+
+    async def coro(num):
+        started.append(time.time())
+        await asyncio.sleep(0.01)
+        return num
+
+    for engine in ('tasks', 'workers'):
+        del started[:]
+        p = concurrent(10, engine=engine, rate=50, burst=2)
+        p.feed(coro, range(7))
+
+        start = time.time()
+        done, pending = run_in_loop(p.run())
+        elapsed = time.time() - start
+
+        # 2 burst tasks, then 5 tasks paced at 50/s
+        assert sorted(f.result() for f in done) == list(range(7))
+        assert 0.09 <= elapsed < 0.3
+        assert started[1] - started[0] < 0.01
+        assert started[-1] - started[1] >= 0.075
+        assert p._rate_timer is None
+
+    # Without queued tasks, the cycle ends without waiting for a token
+    p = concurrent(10, rate=1)
+    p.add(coro, 1)
+    start = time.time()
+    run_in_loop(p.run())
+    assert time.time() - start < 0.5
+
+
+def test_concurrent_rate_limit_cancel():
+    async def coro(key):
+        await asyncio.sleep(0.01)
+        return key
+
+    async def run_cancel():
+        p = concurrent(5, key=lambda key: key, rate=20)
+        p.add(coro, 'a')
+        p.add(coro, 'b')
+        runner = asyncio.ensure_future(p.run())
+        await asyncio.sleep(0.005)
+        assert p._held is not None
+
+        # Held task key slot is released once discarded
+        p.cancel()
+        await runner
+        assert p._held is None
+        assert p._key_counts == {}
+
+        p.add(coro, 'b')
+        done, _ = await p.run()
+        assert [future.result() for future in done] == ['b']
+
+    run_in_loop(run_cancel())
+
+
+def test_concurrent_rate_limit_close():
+    async def coro(num):
+        return num
+
+    async def run_close():
+        p = concurrent(5, rate=5)
+        await p.start()
+        first = p.submit(coro, 1)
+        second = p.submit(coro, 2)
+        await asyncio.sleep(0.05)
+        assert p._held is not None
+
+        # Closing waits for the task held for a rate limit token
+        start = time.time()
+        await p.close()
+        assert time.time() - start >= 0.1
+        return first.result(), second.result()
+
+    assert run_in_loop(run_close()) == (1, 2)
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from paco import curry
 from .helpers import run_in_loop
 
@@ -8,8 +7,7 @@ def task(x, y, baz=None, *args, **kw):
     return x + y, baz, kw
 
 
-@asyncio.coroutine
-def coro(x, y, baz=None, *args, **kw):
+async def coro(x, y, baz=None, *args, **kw):
     return task(x, y, baz=baz, *args, **kw)
 
 
@@ -104,8 +102,7 @@ def test_curry_decorator():
     assert run_in_loop(task(2)(4)(8)(10)) == 24
 
     @curry(4)
-    @asyncio.coroutine
-    def task(x, y, *args):
+    async def task(x, y, *args):
         return x + y + args[0] + args[1]
 
     assert run_in_loop(task(2)(4)(8)(10)) == 24
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+import asyncio
+from paco.deadline import DeadlineTimer
+from .helpers import run_in_loop
+
+
+def test_deadline_timer_compact():
+    async def run_timer():
+        timer = DeadlineTimer(asyncio.get_event_loop())
+        task = asyncio.ensure_future(asyncio.sleep(1))
+
+        # A long deadline stays on top of the heap
+        slow = timer.add(60, task)
+        sizes = []
+        for _ in range(1000):
+            deadline = timer.add(120, task)
+            timer.remove(deadline)
+            sizes.append(len(timer))
+
+        # Finished deadlines are compacted instead of accumulated
+        assert max(sizes) <= 2 * 100 + 2
+        assert timer._heap[0] is slow
+
+        timer.remove(slow)
+        assert len(timer) == 0
+        assert timer._handle is None
+        task.cancel()
+
+    run_in_loop(run_timer())
+
+
+def test_deadline_timer_expire():
+    async def run_timer():
+        timer = DeadlineTimer(asyncio.get_event_loop())
+        task = asyncio.ensure_future(asyncio.sleep(1))
+        deadline = timer.add(0.01, task)
+        finished = timer.add(0.01, task)
+        timer.remove(finished)
+
+        await asyncio.sleep(0.02)
+        assert deadline.expired
+        assert not finished.expired
+        assert task.cancelled()
+
+        # Removing expired deadlines is a no-op
+        timer.remove(deadline)
+        assert len(timer) == 0
+        assert timer._removed == 0
+
+    run_in_loop(run_timer())
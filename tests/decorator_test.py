@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco.decorator import decorate
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(*args, **kw):
+async def coro(*args, **kw):
     return args, kw
 
 
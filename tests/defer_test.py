@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 import time
-import asyncio
 from paco import defer
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(x):
+async def coro(x):
     return x
 
 
@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import dropwhile
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num < 4
 
 
@@ -6,16 +6,14 @@ from paco import each
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num
 
 
 def test_each():
     calls = 0
 
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         nonlocal calls
         calls += 1
 
@@ -30,9 +28,8 @@ def test_each_collect():
 
 
 def test_each_collect_sequential():
-    @asyncio.coroutine
-    def coro(num):
-        yield from asyncio.sleep(0.1)
+    async def coro(num):
+        await asyncio.sleep(0.1)
         return num
 
     init = time.time()
@@ -41,10 +38,18 @@ def test_each_collect_sequential():
     assert time.time() - init >= 0.5
 
 
+def test_each_variadic_args():
+    async def add(num, other):
+        return num + other
+
+    # Extra positional arguments are passed to the coroutine
+    task = each(add, [1, 2], 0, None, True, None, False, 10)
+    assert run_in_loop(task) == [11, 12]
+
+
 def test_each_exception():
-    @asyncio.coroutine
-    def coro(num):
-        yield from asyncio.sleep(0.1)
+    async def coro(num):
+        await asyncio.sleep(0.1)
         if num == 4:
             raise ValueError('foo')
         return num
@@ -69,8 +74,7 @@ def test_each_invalid_coro():
 
 
 def test_each_return_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         raise ValueError('foo')
 
     task = each(coro, [1, 2, 3, 4, 5], collect=True, return_exceptions=True)
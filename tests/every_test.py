@@ -1,17 +1,14 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import every
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num < 4
 
 
-@asyncio.coroutine
-def coro_truly(num):
+async def coro_truly(num):
     return num < 10
 
 
@@ -33,3 +30,11 @@ def test_every_empty():
 def test_every_invalid_input():
     with pytest.raises(TypeError):
         run_in_loop(every(coro, None))
+
+
+def test_every_executor():
+    task = every(lambda num: num < 4, [1, 2, 3], executor=True)
+    assert run_in_loop(task) is True
+
+    task = every(lambda num: num < 4, [1, 2, 3, 4], executor=True)
+    assert run_in_loop(task) is False
@@ -6,8 +6,7 @@ from paco import filter
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def even(num):
+async def even(num):
     return num % 2 == 0
 
 
@@ -17,10 +16,9 @@ def test_filter():
 
 
 def test_filter_collect_sequential():
-    @asyncio.coroutine
-    def coro(num):
-        yield from asyncio.sleep(0.1)
-        return (yield from even(num))
+    async def coro(num):
+        await asyncio.sleep(0.1)
+        return await even(num)
 
     init = time.time()
     task = filter(coro, [1, 2, 3, 4, 5, 6], limit=1)
@@ -40,3 +38,12 @@ def test_filter_invalid_input():
 def test_filter_invalid_coro():
     with pytest.raises(TypeError):
         run_in_loop(filter(None))
+
+
+def test_filter_executor():
+    def blocking_even(num):
+        time.sleep(0.01)
+        return num % 2 == 0
+
+    task = filter(blocking_even, [1, 2, 3, 4, 5, 6], limit=3, executor=True)
+    assert run_in_loop(task) == [2, 4, 6]
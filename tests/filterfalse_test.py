@@ -6,8 +6,7 @@ from paco import filterfalse
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def even(num):
+async def even(num):
     return num % 2 == 0
 
 
@@ -17,10 +16,9 @@ def test_filterfalse():
 
 
 def test_filterfalse_collect_sequential():
-    @asyncio.coroutine
-    def coro(num):
-        yield from asyncio.sleep(0.1)
-        return (yield from even(num))
+    async def coro(num):
+        await asyncio.sleep(0.1)
+        return await even(num)
 
     init = time.time()
     task = filterfalse(coro, [1, 2, 3, 4, 5, 6], limit=1)
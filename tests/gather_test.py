@@ -6,9 +6,8 @@ from paco import gather, partial
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
-    yield from asyncio.sleep(0.1)
+async def coro(num):
+    await asyncio.sleep(0.1)
     return num * 2
 
 
@@ -46,8 +45,7 @@ def test_gather_invalid_coro():
 
 
 def test_gather_return_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         if num == 2:
             raise ValueError('foo')
         return num * 2
@@ -65,3 +63,12 @@ def test_gather_no_order():
     assert 6 in results
     assert len(results) == 3
     assert time.time() - start < 0.3
+
+
+def test_gather_eager():
+    async def cached(num):
+        return num * 2
+
+    results = run_in_loop(gather(cached(1), coro(2), cached(3), limit=2,
+                                 preserve_order=True, eager=True))
+    assert results == [2, 4, 6]
@@ -3,10 +3,9 @@ import asyncio
 from inspect import isfunction
 
 
-@asyncio.coroutine
-def sleep_coro(timespan=0.1):
+async def sleep_coro(timespan=0.1):
     start = time.time()
-    yield from asyncio.sleep(timespan)
+    await asyncio.sleep(timespan)
     return time.time() - start
 
 
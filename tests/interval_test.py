@@ -6,8 +6,7 @@ from paco import interval
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(track):
+async def coro(track):
     track['calls'] += 1
 
 
@@ -35,11 +34,10 @@ def test_interval_cancellation():
     def cancel():
         future.cancel()
 
-    @asyncio.coroutine
-    def runner(loop):
+    async def runner(loop):
         loop.call_later(1, cancel)
         try:
-            yield from future
+            await future
         except asyncio.CancelledError:
             pass
 
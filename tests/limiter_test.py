@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+import pytest
+from paco.limiter import Limiter, AIMDLimiter, GradientLimiter
+
+
+class StaticLimiter(Limiter):
+    def update(self, latency, failed=False, inflight=0):
+        return self.limit
+
+
+def test_limiter():
+    limiter = StaticLimiter(limit=20, max_limit=10)
+    assert limiter.limit == 10
+    assert limiter.update(0.1) == 10
+
+    # Limiters must implement update()
+    with pytest.raises(TypeError):
+        Limiter()
+
+    class IncompleteLimiter(Limiter):
+        pass
+
+    with pytest.raises(TypeError):
+        IncompleteLimiter()
+
+    with pytest.raises(ValueError):
+        StaticLimiter(min_limit=0)
+
+    with pytest.raises(ValueError):
+        StaticLimiter(min_limit=10, max_limit=5)
+
+
+def test_aimd_limiter():
+    limiter = AIMDLimiter(limit=10, max_limit=12, latency=1)
+
+    # Not saturated: limit is kept
+    assert limiter.update(0.1, inflight=2) == 10
+
+    # Saturated: additive increase per window
+    for _ in range(11):
+        limiter.update(0.1, inflight=10)
+    assert limiter.limit == 11
+
+    for _ in range(100):
+        limiter.update(0.1, inflight=12)
+    assert limiter.limit == 12
+
+    # Multiplicative decrease on errors or high latency
+    assert limiter.update(0.1, failed=True, inflight=12) == 10
+    assert limiter.update(2, inflight=10) == 9
+
+    for _ in range(100):
+        limiter.update(0.1, failed=True)
+    assert limiter.limit == 1
+
+    with pytest.raises(ValueError):
+        AIMDLimiter(backoff=1)
+
+
+def test_gradient_limiter():
+    limiter = GradientLimiter(limit=10, max_limit=100, smoothing=0.5)
+
+    # Stable latency grows the limit
+    for _ in range(10):
+        limiter.update(0.1, inflight=limiter.limit)
+    grown = limiter.limit
+    assert grown > 10
+
+    # Latency increase shrinks the limit
+    for _ in range(2):
+        limiter.update(1, inflight=limiter.limit)
+    assert limiter.limit < grown
+
+    # Errors shrink the limit
+    shrunk = limiter.limit
+    limiter.update(0.1, failed=True)
+    assert limiter.limit < shrunk
+
+    with pytest.raises(ValueError):
+        GradientLimiter(tolerance=0.5)
@@ -6,8 +6,7 @@ from paco import map
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num * 2
 
 
@@ -17,10 +16,9 @@ def test_map():
 
 
 def test_map_sequential():
-    @asyncio.coroutine
-    def _coro(num):
-        yield from asyncio.sleep(0.1)
-        return (yield from coro(num))
+    async def _coro(num):
+        await asyncio.sleep(0.1)
+        return await coro(num)
 
     init = time.time()
     task = map(_coro, [1, 2, 3, 4, 5], limit=1)
@@ -32,6 +30,21 @@ def test_map_empty():
     assert run_in_loop(map(coro, [])) == []
 
 
+def test_map_generator():
+    task = map(coro, (num for num in range(1, 6)), limit=2)
+    assert run_in_loop(task) == [2, 4, 6, 8, 10]
+
+
+def test_map_generator_error():
+    def values():
+        yield 1
+        raise ValueError('invalid value')
+
+    for limit in (1, 2):
+        with pytest.raises(ValueError, match='invalid value'):
+            run_in_loop(asyncio.wait_for(map(coro, values(), limit=limit), 1))
+
+
 def test_map_invalid_input():
     with pytest.raises(TypeError):
         run_in_loop(map(coro, None))
@@ -43,8 +56,7 @@ def test_map_invalid_coro():
 
 
 def test_map_return_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         raise ValueError('foo')
 
     task = map(coro, [1, 2, 3, 4, 5], return_exceptions=True)
@@ -53,11 +65,99 @@ def test_map_return_exceptions():
 
 
 def test_map_raise_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         if num > 3:
             raise ValueError('foo')
         return num * 2
 
     with pytest.raises(ValueError):
         run_in_loop(map(coro, [1, 2, 3, 4, 5], return_exceptions=False))
+
+
+def test_map_variadic_args():
+    async def add(num, other):
+        return num + other
+
+    # Extra positional arguments are passed to the coroutine
+    task = map(add, [1, 2], 0, None, None, False, 10)
+    assert run_in_loop(task) == [11, 12]
+
+
+def test_map_executor():
+    def blocking(num):
+        time.sleep(0.1)
+        return num * 2
+
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            await asyncio.sleep(0.01)
+            ticks += 1
+
+    async def run():
+        future = asyncio.ensure_future(ticker())
+        results = await map(blocking, [1, 2, 3, 4, 5, 6, 7, 8],
+                            limit=4, executor=True)
+        future.cancel()
+        return results
+
+    init = time.time()
+    assert run_in_loop(run()) == [2, 4, 6, 8, 10, 12, 14, 16]
+    assert 0.2 <= time.time() - init < 0.4
+    # Event loop was not blocked by the mapped functions
+    assert ticks >= 10
+
+
+def test_map_key_limit():
+    running = {}
+    max_running = {}
+
+    async def coro(num):
+        key = num % 2
+        running[key] = running.get(key, 0) + 1
+        max_running[key] = max(max_running.get(key, 0), running[key])
+        await asyncio.sleep(0.01)
+        running[key] -= 1
+        return num * 2
+
+    task = map(coro, range(10), limit=4, key=lambda num: num % 2)
+    assert run_in_loop(task) == [num * 2 for num in range(10)]
+    assert max_running == {0: 1, 1: 1}
+
+
+def test_map_task_timeout():
+    async def coro(delay):
+        await asyncio.sleep(delay)
+        return delay
+
+    task = map(coro, [0.01, 1, 0.02], limit=2, task_timeout=0.1,
+               return_exceptions=True)
+    results = run_in_loop(task)
+    assert results[0] == 0.01
+    assert isinstance(results[1], asyncio.TimeoutError)
+    assert results[2] == 0.02
+
+    with pytest.raises(asyncio.TimeoutError):
+        run_in_loop(map(coro, [1], task_timeout=0.05))
+
+
+def test_map_eager():
+    async def coro(num):
+        if num % 2:
+            await asyncio.sleep(0.01)
+        return num * 2
+
+    task = map(coro, range(10), limit=3, eager=True)
+    assert run_in_loop(task) == [num * 2 for num in range(10)]
+
+
+def test_map_rate_limit():
+    async def coro(num):
+        return num * 2
+
+    start = time.time()
+    task = map(coro, range(5), limit=5, rate=100, burst=1)
+    assert run_in_loop(task) == [0, 2, 4, 6, 8]
+    assert time.time() - start >= 0.035
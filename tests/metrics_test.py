@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+import pytest
+from paco.metrics import Histogram, Metrics
+
+
+def test_histogram():
+    histogram = Histogram()
+    assert histogram.percentile(50) == 0.0
+
+    for num in range(1, 1001):
+        histogram.record(num / 1000.0)
+
+    assert histogram.count == 1000
+    assert histogram.min == 0.001
+    assert histogram.max == 1.0
+    assert histogram.mean == pytest.approx(0.5005)
+    # Relative error is bounded by the sub-buckets precision
+    for percentile in (50, 90, 99, 99.9):
+        expected = percentile / 100.0
+        assert histogram.percentile(percentile) == pytest.approx(
+            expected, rel=2 / 128.0)
+    assert histogram.percentile(100) == 1.0
+
+    snapshot = histogram.snapshot()
+    assert snapshot['count'] == 1000
+    assert snapshot['p99'] == histogram.percentile(99)
+
+    histogram.reset()
+    assert histogram.count == 0
+    assert histogram.max is None
+
+
+def test_histogram_fixed_memory():
+    histogram = Histogram(max_value=10)
+    size = len(histogram._counts)
+    histogram.record(1e6)
+    histogram.record(-1)
+    assert len(histogram._counts) == size
+    assert histogram.percentile(100) == 1e6
+
+    with pytest.raises(ValueError):
+        Histogram(max_value=0)
+
+
+def test_metrics():
+    metrics = Metrics()
+    for _ in range(3):
+        metrics.enqueue()
+    metrics.start(0.1)
+    metrics.start(0.2)
+    metrics.finish(0.5)
+    metrics.finish(1, 'failed')
+    metrics.drop()
+
+    snapshot = metrics.snapshot()
+    assert snapshot['queued'] == 0
+    assert snapshot['in_flight'] == 0
+    assert snapshot['completed'] == 1
+    assert snapshot['failed'] == 1
+    assert snapshot['cancelled'] == 1
+    assert snapshot['wait_time']['count'] == 2
+    assert snapshot['exec_time']['max'] == 1
+
+    text = metrics.export()
+    assert '# TYPE paco_executor_queued gauge' in text
+    assert 'paco_executor_completed_total 1' in text
+    assert 'paco_executor_exec_seconds{quantile="0.99"}' in text
+    assert 'paco_executor_wait_seconds_count 2' in text
+
+    metrics.reset()
+    assert metrics.snapshot()['completed'] == 0
@@ -1,5 +1,4 @@
 # -*- coding: utf-8 -*-
-import asyncio
 from paco.observer import Observer
 from .helpers import run_in_loop
 
@@ -9,8 +8,7 @@ def test_observer():
         assert data == 'foo'
         assert key == 'foo'
 
-    @asyncio.coroutine
-    def bar_listener(data, key=None):
+    async def bar_listener(data, key=None):
         assert data == 'bar'
         assert key == 'bar'
 
@@ -24,7 +22,7 @@ def test_observer():
     run_in_loop(observer.trigger, 'bar', 'bar', key='bar')
 
     # Event with no listeners
-    observer.trigger('baz')
+    run_in_loop(observer.trigger, 'baz')
 
     # Remove listenrs
     observer.remove('bar')
@@ -35,3 +33,26 @@ def test_observer():
     # Remove all listeners
     observer.clear()
     assert len(observer._pool) == 0
+
+
+def test_observer_compile():
+    calls = []
+
+    def sync_listener(data):
+        calls.append(('sync', data))
+
+    async def coro_listener(data):
+        calls.append(('coro', data))
+
+    observer = Observer()
+    assert observer.compile('foo') is None
+
+    observer.observe('foo', sync_listener)
+    dispatcher = observer.compile('foo')
+    assert dispatcher('foo') is None
+    assert calls == [('sync', 'foo')]
+
+    observer.observe('foo', coro_listener)
+    dispatcher = observer.compile('foo')
+    run_in_loop(dispatcher('bar'))
+    assert calls[1:] == [('sync', 'bar'), ('coro', 'bar')]
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+import time
+import pytest
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from paco import Portal
+
+
+async def coro(num):
+    await asyncio.sleep(0.01)
+    return num * 2
+
+
+async def current_loop():
+    return asyncio.get_event_loop(), threading.current_thread().name
+
+
+def test_portal_run():
+    with Portal() as portal:
+        assert portal.run(coro(2)) == 4
+        assert portal.run(coro, 3) == 6
+
+        # The same loop is reused across calls
+        loop, name = portal.run(current_loop())
+        assert loop is portal.loop and name == 'paco-portal'
+        assert portal.run(current_loop)[0] is loop
+
+        # Concurrent calls from several threads
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            results = list(pool.map(lambda num: portal.run(coro, num),
+                                    range(10)))
+        assert results == [num * 2 for num in range(10)]
+
+        future = portal.submit(coro, 4)
+        assert future.result() == 8
+
+    assert loop.is_closed()
+    assert portal.loop is None
+
+
+def test_portal_map():
+    with Portal() as portal:
+        results = portal.map(coro, range(10), limit=3)
+        assert results == [num * 2 for num in range(10)]
+
+
+def test_portal_errors():
+    cancelled = []
+
+    async def sleep():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    async def fail():
+        raise ValueError('invalid')
+
+    async def nested():
+        return portal.run(coro(1))
+
+    portal = Portal()
+    with pytest.raises(ValueError):
+        portal.run(fail)
+
+    with pytest.raises(TypeError):
+        portal.run(None)
+
+    start = time.time()
+    with pytest.raises(asyncio.TimeoutError):
+        portal.run(sleep, timeout=0.05)
+    assert time.time() - start < 0.5
+
+    # Deadlock protection
+    with pytest.raises(RuntimeError):
+        portal.run(nested)
+
+    portal.close()
+    assert cancelled == [True]
@@ -0,0 +1,26 @@
+# -*- coding: utf-8 -*-
+import pytest
+from paco.priority import PriorityQueue
+
+
+def test_priority_queue():
+    queue = PriorityQueue()
+    assert len(queue) == 0
+    assert not queue
+
+    queue.append('low', 10)
+    queue.append('high', 1)
+    queue.append('default')
+    queue.append('default-2')
+    assert len(queue) == 4
+    assert list(queue) == ['default', 'default-2', 'high', 'low']
+
+    assert queue.popleft() == 'default'
+    assert queue.popleft() == 'default-2'
+    assert queue.popleft() == 'high'
+
+    queue.clear()
+    assert len(queue) == 0
+
+    with pytest.raises(IndexError):
+        queue.popleft()
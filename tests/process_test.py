@@ -0,0 +1,98 @@
+# -*- coding: utf-8 -*-
+import os
+import pytest
+from paco import ProcessPool, map, each
+from .helpers import run_in_loop
+
+
+def square(num, offset=0):
+    return num * num + offset
+
+
+def worker_pid(num):
+    return os.getpid()
+
+
+def fail(num):
+    if num == 3:
+        raise ValueError('invalid number')
+    return num
+
+
+def test_process_pool_map():
+    with ProcessPool(workers=2) as pool:
+        results = run_in_loop(pool.map(square, range(100)))
+        assert results == [num * num for num in range(100)]
+
+        # Chunk size is auto-tuned based on the measured cost
+        assert pool._costs[square] > 0
+        assert pool._chunk_size(square, 1000) > 1
+
+        results = run_in_loop(pool.map(square, range(10), 1))
+        assert results == [num * num + 1 for num in range(10)]
+
+        # Worker processes are reused across calls
+        executor = pool.executor
+        run_in_loop(pool.map(square, range(10)))
+        assert pool.executor is executor
+
+    assert pool._executor is None
+
+
+def test_process_pool_workers():
+    with ProcessPool(workers=2, chunksize=1) as pool:
+        pids = run_in_loop(pool.map(worker_pid, range(20)))
+        assert os.getpid() not in pids
+        assert len(set(pids)) <= 2
+
+
+def test_process_pool_exceptions():
+    with ProcessPool(workers=2, chunksize=2) as pool:
+        with pytest.raises(ValueError):
+            run_in_loop(pool.map(fail, range(10)))
+
+        results = run_in_loop(
+            pool.map(fail, range(5), return_exceptions=True))
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+
+        async def coro(num):
+            return num
+
+        with pytest.raises(TypeError):
+            run_in_loop(pool.map(coro, range(5)))
+
+
+def test_process_pool_map_executor():
+    with ProcessPool(workers=2) as pool:
+        task = map(square, [1, 2, 3, 4], executor=pool)
+        assert run_in_loop(task) == [1, 4, 9, 16]
+
+        task = each(square, [1, 2, 3, 4], executor=pool)
+        assert run_in_loop(task) is None
+
+
+def test_process_pool_default():
+    assert ProcessPool.default() is ProcessPool.default()
+    task = map(square, [1, 2, 3], executor='process')
+    assert run_in_loop(task) == [1, 4, 9]
+    ProcessPool.default().shutdown()
+
+
+def test_process_pool_mp_context():
+    # Worker processes are not forked by default
+    with ProcessPool(workers=1) as pool:
+        assert pool.executor._mp_context.get_start_method() != 'fork'
+        assert run_in_loop(pool.map(square, [2])) == [4]
+
+    with ProcessPool(workers=1, mp_context='spawn') as pool:
+        assert pool.executor._mp_context.get_start_method() == 'spawn'
+        assert run_in_loop(pool.map(square, [3])) == [9]
+
+
+def test_process_pool_options():
+    with ProcessPool(workers=1) as pool:
+        for options in ({'key': str}, {'rate': 1}, {'task_timeout': 1},
+                        {'tracer': object()}):
+            with pytest.raises(ValueError):
+                run_in_loop(map(square, range(5), executor=pool, **options))
@@ -6,9 +6,8 @@ from .helpers import run_in_loop
 
 
 def coro(delay=1):
-    @asyncio.coroutine
-    def wrapper():
-        yield from asyncio.sleep(delay)
+    async def wrapper():
+        await asyncio.sleep(delay)
         return delay
     return wrapper
 
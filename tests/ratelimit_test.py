@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+import pytest
+from paco.ratelimit import TokenBucket
+
+
+def test_token_bucket():
+    now = [0.0]
+    bucket = TokenBucket(10, burst=2, clock=lambda: now[0])
+
+    # Burst tokens are available right away
+    assert bucket.ready()
+    bucket.consume()
+    assert bucket.ready()
+    bucket.consume()
+    assert not bucket.ready()
+    assert bucket.delay() == pytest.approx(0.1)
+
+    now[0] = 0.05
+    assert not bucket.ready()
+    assert bucket.delay() == pytest.approx(0.05)
+
+    now[0] = 0.1
+    assert bucket.ready()
+    bucket.consume()
+
+    # Tokens are capped by the burst
+    now[0] = 10
+    assert bucket.ready()
+    bucket.consume()
+    bucket.consume()
+    assert not bucket.ready()
+
+
+def test_token_bucket_invalid():
+    with pytest.raises(ValueError):
+        TokenBucket(0)
+    with pytest.raises(ValueError):
+        TokenBucket(1, burst=0)
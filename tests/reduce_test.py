@@ -1,17 +1,14 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import reduce
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(acc, num):
+async def coro(acc, num):
     return acc + (num * 2,)
 
 
-@asyncio.coroutine
-def sumfn(acc, num):
+async def sumfn(acc, num):
     return acc + num
 
 
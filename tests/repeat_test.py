@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import repeat
 from .helpers import run_in_loop
 
@@ -8,8 +7,7 @@ from .helpers import run_in_loop
 def test_repeat():
     calls = 0
 
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         nonlocal calls
         calls += 1
         return num * 2
@@ -19,16 +17,14 @@ def test_repeat():
 
 
 def test_repeat_defaults():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         return num * 2
 
     assert run_in_loop(repeat(coro)) == [2]
 
 
 def test_repeat_concurrency():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         return num * 2
 
     assert run_in_loop(repeat(coro, 5), limit=5) == [2, 4, 6, 8, 10]
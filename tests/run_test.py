@@ -3,8 +3,7 @@ import asyncio
 from paco import run
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num * 2
 
 
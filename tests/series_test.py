@@ -5,9 +5,8 @@ from paco import series
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
-    yield from asyncio.sleep(0.1)
+async def coro(num):
+    await asyncio.sleep(0.1)
     return num * 2
 
 
@@ -19,8 +18,7 @@ def test_series():
 
 
 def test_series_return_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         raise ValueError('foo')
 
     task = series(coro(1), coro(2), coro(3), return_exceptions=True)
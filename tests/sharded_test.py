@@ -0,0 +1,127 @@
+# -*- coding: utf-8 -*-
+import time
+import pytest
+import asyncio
+import threading
+from paco import ShardedExecutor, map
+from .helpers import run_in_loop
+
+
+async def mul_2(num, delay=0.01):
+    await asyncio.sleep(delay)
+    return num * 2
+
+
+async def thread_name(num):
+    await asyncio.sleep(0.01)
+    return threading.current_thread().name
+
+
+async def fail(num):
+    await asyncio.sleep(0.01)
+    if num == 3:
+        raise ValueError('invalid number')
+    return num
+
+
+def test_sharded_executor_map():
+    with ShardedExecutor(shards=2, limit=4) as pool:
+        results = run_in_loop(pool.map(mul_2, range(20)))
+        assert results == [num * 2 for num in range(20)]
+
+        results = run_in_loop(pool.map(mul_2, range(5), 0))
+        assert results == [0, 2, 4, 6, 8]
+
+        # Coroutines are spread over the shard threads
+        names = run_in_loop(pool.map(thread_name, range(20)))
+        assert set(names) == {'paco-shard-0', 'paco-shard-1'}
+
+        # Unlimited concurrency
+        names = run_in_loop(pool.map(thread_name, range(20), limit=0))
+        assert set(names) == {'paco-shard-0', 'paco-shard-1'}
+
+        assert run_in_loop(pool.each(mul_2, range(5))) is None
+
+        loops = pool.loops
+        assert all(loop.is_running() for loop in loops)
+
+    assert all(loop.is_closed() for loop in loops)
+    assert all(portal.loop is None for portal in pool._portals)
+
+
+def test_sharded_executor_limit():
+    lock = threading.Lock()
+    running = [0, 0]
+
+    async def coro(num):
+        with lock:
+            running[0] += 1
+            running[1] = max(running)
+        await asyncio.sleep(0.01)
+        with lock:
+            running[0] -= 1
+        return num
+
+    with ShardedExecutor(shards=2, limit=3) as pool:
+        assert pool._split(3) == [2, 1]
+        assert pool._split(1) == [1]
+        assert pool._split(0) == [0, 0]
+
+        start = time.time()
+        results = run_in_loop(pool.map(coro, range(12)))
+        assert results == list(range(12))
+        assert running[1] == 3
+        assert time.time() - start >= 0.04
+
+
+def test_sharded_executor_errors():
+    with ShardedExecutor(shards=2, limit=2) as pool:
+        with pytest.raises(ValueError):
+            run_in_loop(pool.map(fail, range(10)))
+
+        results = run_in_loop(pool.map(fail, range(5),
+                                       return_exceptions=True))
+        assert results[:3] == [0, 1, 2]
+        assert isinstance(results[3], ValueError)
+        assert results[4] == 4
+
+        # Coroutines not finished in time return None
+        results = run_in_loop(pool.map(mul_2, [1, 2], 1, timeout=0.1))
+        assert results == [None, None]
+
+        with pytest.raises(TypeError):
+            run_in_loop(pool.map(None, range(5)))
+
+
+def test_sharded_executor_paco_map():
+    with ShardedExecutor(shards=2, limit=4) as pool:
+        results = run_in_loop(map(mul_2, range(10), executor=pool))
+        assert results == [num * 2 for num in range(10)]
+
+        # Unsized iterables, such as generators
+        gen = (num for num in range(10))
+        results = run_in_loop(map(mul_2, gen, executor=pool))
+        assert results == [num * 2 for num in range(10)]
+
+        gen = (num for num in range(10))
+        results = run_in_loop(pool.map(mul_2, gen, limit=0))
+        assert results == [num * 2 for num in range(10)]
+
+
+def test_sharded_executor_options():
+    with ShardedExecutor(shards=2, limit=4) as pool:
+        results = run_in_loop(map(mul_2, [1, 2], executor=pool,
+                                  task_timeout=0.1, eager=True))
+        assert results == [2, 4]
+
+        # Coroutines fail once the task timeout is exceeded
+        results = run_in_loop(map(mul_2, [1, 2], executor=pool, delay=1,
+                                  task_timeout=0.05,
+                                  return_exceptions=True))
+        assert all(isinstance(result, asyncio.TimeoutError)
+                   for result in results)
+
+        # Options not supported by the shards
+        for options in ({'key': str}, {'rate': 1}, {'tracer': object()}):
+            with pytest.raises(ValueError):
+                run_in_loop(map(mul_2, range(5), executor=pool, **options))
@@ -1,17 +1,14 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import some
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num < 2
 
 
-@asyncio.coroutine
-def coro_false(num):
+async def coro_false(num):
     return num > 10
 
 
@@ -33,3 +30,8 @@ def test_some_empty():
 def test_some_invalid_input():
     with pytest.raises(TypeError):
         run_in_loop(some(coro, None))
+
+
+def test_some_executor():
+    task = some(lambda num: num > 3, [1, 2, 3, 4], executor=True)
+    assert run_in_loop(task) is True
@@ -1,13 +1,11 @@
 # -*- coding: utf-8 -*-
 import time
 import pytest
-import asyncio
 from paco import throttle
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
+async def coro(num):
     return num
 
 
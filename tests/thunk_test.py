@@ -1,12 +1,10 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import thunk
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def task():
+async def task():
     return 'foo'
 
 
@@ -5,15 +5,9 @@ import asyncio
 from paco import timeout, TimeoutLimit, run
 from .helpers import run_in_loop
 
-try:
-    from asyncio import ensure_future
-except ImportError:
-    ensure_future = asyncio.async
 
-
-@asyncio.coroutine
-def coro(delay=1):
-    yield from asyncio.sleep(delay)
+async def coro(delay=1):
+    await asyncio.sleep(delay)
 
 
 def test_timeout():
@@ -44,10 +38,9 @@ def test_timeout_coroutine_object():
     now = time.time()
 
     with pytest.raises(asyncio.TimeoutError):
-        @asyncio.coroutine
-        def _run():
+        async def _run():
             task = timeout(coro(delay=1), timeout=0.2)
-            return (yield from task)
+            return await task
 
         run(_run())
 
@@ -57,10 +50,9 @@ def test_timeout_coroutine_object():
 def test_timeout_limit_context():
     now = time.time()
 
-    @asyncio.coroutine
-    def test():
+    async def test():
         with TimeoutLimit(timeout=0.2):
-            yield from coro(delay=1)
+            await coro(delay=1)
 
     with pytest.raises(asyncio.TimeoutError):
         run(test())
@@ -69,8 +61,8 @@ def test_timeout_limit_context():
 
 
 def test_timeout_limit_out_of_context():
-    with pytest.raises(RuntimeError, message='Timeout context manager '
-                                             'should be used inside a task'):
+    with pytest.raises(RuntimeError, match='timeout context manager '
+                                           'should be used inside a task'):
         with TimeoutLimit(timeout=1):
             pass
 
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+import io
+import json
+import pytest
+import asyncio
+from paco import map, Tracer, JSONLinesExporter
+from .helpers import run_in_loop
+
+
+def test_tracer_span():
+    spans = []
+    tracer = Tracer(spans.append)
+    assert tracer.current_span() is None
+
+    with tracer.span('parent', user='foo') as parent:
+        assert tracer.current_span() is parent
+        with tracer.span('child') as child:
+            assert tracer.current_span() is child
+        assert tracer.current_span() is parent
+
+    assert tracer.current_span() is None
+    assert [span.name for span in spans] == ['child', 'parent']
+    assert child.parent_id == parent.span_id
+    assert child.trace_id == parent.trace_id
+    assert parent.parent_id is None
+    assert parent.attributes == {'user': 'foo'}
+    assert parent.outcome == 'ok'
+    assert parent.duration >= 0
+
+    with pytest.raises(ValueError):
+        with tracer.span('error'):
+            raise ValueError('foo')
+    assert spans[-1].outcome == 'error'
+    assert spans[-1].error == "ValueError('foo')"
+
+
+def test_tracer_executor():
+    spans = []
+    tracer = Tracer(spans.append)
+
+    async def nested(num):
+        await asyncio.sleep(0.01)
+        return num
+
+    async def coro(num):
+        if num == 2:
+            raise ValueError('invalid number')
+        return await map(nested, [num], tracer=tracer)
+
+    async def handler():
+        with tracer.span('handler') as span:
+            results = await map(coro, range(3), limit=2, tracer=tracer,
+                                return_exceptions=True)
+        return span, results
+
+    handler_span, results = run_in_loop(handler())
+    assert results[:2] == [[0], [1]]
+    assert isinstance(results[2], ValueError)
+
+    tasks = [span for span in spans
+             if span.parent_id == handler_span.span_id]
+    assert len(tasks) == 3
+    assert sorted(span.outcome for span in tasks) == ['error', 'ok', 'ok']
+    for span in tasks:
+        assert span.name == 'paco.task'
+        assert span.trace_id == handler_span.trace_id
+        assert span.queue_wait >= 0
+        assert span.attributes['coro'].endswith('coro')
+
+    # Nested executor tasks are children of the parent task span
+    ids = set(span.span_id for span in tasks)
+    nested_spans = [span for span in spans if span.parent_id in ids]
+    assert len(nested_spans) == 2
+    assert all(span.duration >= 0.01 for span in nested_spans)
+
+
+def test_jsonlines_exporter():
+    output = io.StringIO()
+    exporter = JSONLinesExporter(output, buffer=2)
+    tracer = Tracer(exporter)
+
+    with tracer.span('foo'):
+        pass
+    assert output.getvalue() == ''
+
+    with tracer.span('bar'):
+        pass
+    with exporter:
+        with tracer.span('baz'):
+            pass
+
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line)['name'] for line in lines] == [
+        'foo', 'bar', 'baz']
+    assert json.loads(lines[0])['outcome'] == 'ok'
@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import until
 from .helpers import run_in_loop
 
@@ -8,12 +7,10 @@ from .helpers import run_in_loop
 def test_until():
     calls = 0
 
-    @asyncio.coroutine
-    def coro_test():
+    async def coro_test():
         return calls > 4
 
-    @asyncio.coroutine
-    def coro():
+    async def coro():
         nonlocal calls
         calls += 1
         return calls
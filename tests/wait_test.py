@@ -6,9 +6,8 @@ from paco import wait
 from .helpers import run_in_loop
 
 
-@asyncio.coroutine
-def coro(num):
-    yield from asyncio.sleep(0.1)
+async def coro(num):
+    await asyncio.sleep(0.1)
     return num * 2
 
 
@@ -28,8 +27,7 @@ def test_wait_sequential():
 
 
 def test_wait_return_exceptions():
-    @asyncio.coroutine
-    def coro(num):
+    async def coro(num):
         raise ValueError('foo')
 
     done, pending = run_in_loop(wait([coro(1), coro(2), coro(3)],
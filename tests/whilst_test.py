@@ -1,6 +1,5 @@
 # -*- coding: utf-8 -*-
 import pytest
-import asyncio
 from paco import whilst
 from .helpers import run_in_loop
 
@@ -8,12 +7,10 @@ from .helpers import run_in_loop
 def test_whilst():
     calls = 0
 
-    @asyncio.coroutine
-    def coro_test():
+    async def coro_test():
         return calls < 5
 
-    @asyncio.coroutine
-    def coro():
+    async def coro():
         nonlocal calls
         calls += 1
         return calls
@@ -1,5 +1,5 @@
 # -*- coding: utf-8 -*-
-import asyncio
+import pytest
 from paco import wraps
 from .helpers import run_in_loop
 
@@ -25,11 +25,34 @@ def test_wraps():
 
 
 def test_wraps_coroutine():
-    @asyncio.coroutine
-    def coro(x, foo=None):
+    async def coro(x, foo=None):
         return x * 2, foo
 
     coro = wraps(coro)
     num, foo = run_in_loop(coro, 2, foo='bar')
     assert num == 4
     assert foo == 'bar'
+
+
+def test_wraps_executor():
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
+
+    def blocking(x):
+        return x * 2, threading.current_thread()
+
+    coro = wraps(blocking, executor=True)
+    num, thread = run_in_loop(coro, 2)
+    assert num == 4
+    assert thread is not threading.current_thread()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        coro = wraps(blocking, executor=executor)
+        num, thread = run_in_loop(coro, 3)
+        assert num == 6
+        assert thread is not threading.current_thread()
+
+
+def test_wraps_invalid():
+    with pytest.raises(TypeError):
+        wraps(None)